@@ -37,9 +37,9 @@ import ipaddress
 import json
 import math
 import re
+import time
 import traceback
 from datetime import datetime, timedelta
-from sys import getsizeof
 from typing import Dict, Generator, List, Tuple, Union
 from urllib.parse import urlparse
 
@@ -65,7 +65,6 @@ from .utils.anomali_threatstream_constant import (
     ANOMALI_SEVERITY,
     ANOMALI_SEVERITY_MAPPING,
     ANOMALI_STATUS,
-    BYTES_TO_MB,
     DATE_FORMAT_FOR_IOCS,
     DEFAULT_REPUTATION,
     INDICATOR_TYPES,
@@ -81,12 +80,13 @@ from .utils.anomali_threatstream_constant import (
     SEPARATOR,
     SEVERITY_MAPPING,
     TAG_NAME,
-    TARGET_SIZE_MB,
+    TARGET_SIZE_BYTES,
 )
 from .utils.anomali_threatstream_helper import (
     AnomaliThreatstreamPluginException,
     AnomaliThreatstreamPluginHelper,
 )
+from .utils.retraction import pull_snapshot
 
 
 class AnomaliThreatstreamPlugin(PluginBase):
@@ -1114,36 +1114,30 @@ class AnomaliThreatstreamPlugin(PluginBase):
                 if payload:
                     objects.append(payload)
 
-            results = []
-            size_in_bytes = getsizeof(json.dumps(objects))
-            # Convert bytes to megabytes
-            size_in_mb = size_in_bytes / BYTES_TO_MB
-            if size_in_mb > TARGET_SIZE_MB:
-                chunk_data = self.anomali_threatstream_helper.split_into_size(
-                    objects
-                )
-                results.extend(chunk_data)
-            elif objects:
-                results.append(objects)
-
             (base_url, user_name, api_key) = self._get_credentials(
                 self.configuration
             )
             headers = self.get_headers(user_name, api_key)
-            final_payload = {
-                "meta": {
+            meta = json.dumps(
+                {
                     "classification": "private",
                     "allow_unresolved": True,
                     "allow_update": True,
                     "enrich": False,
-                },
-            }
+                }
+            )
+            bodies = self.anomali_threatstream_helper.pack_into_bodies(
+                objects,
+                TARGET_SIZE_BYTES,
+                prefix=f'{{"meta": {meta}, "objects": ['.encode("utf-8"),
+                separator=b", ",
+                suffix=b"]}",
+            )
 
             page_count = 0
             total_count = 0
-            for result in results:
+            for body, count in bodies:
                 page_count += 1
-                final_payload["objects"] = result
                 try:
                     logger_msg = (
                         f"pushing indicators to {self.plugin_name} "
@@ -1153,19 +1147,19 @@ class AnomaliThreatstreamPlugin(PluginBase):
                         logger_msg=logger_msg,
                         url=f"{base_url}/api/v2/intelligence/",
                         method="PATCH",
-                        data=json.dumps(final_payload),
+                        data=body,
                         headers=headers,
                         verify=self.ssl_validation,
                         proxies=self.proxy,
                     )
-                    total_count += len(result)
+                    total_count += count
                     self.logger.info(
-                        f"{self.log_prefix}: Successfully shared {len(result)}"
+                        f"{self.log_prefix}: Successfully shared {count}"
                         f" indicator(s) for page {page_count}. Total indicator"
                         f"(s) shared - {total_count}."
                     )
                 except (AnomaliThreatstreamPluginException, Exception) as err:
-                    skipped_count += len(result)
+                    skipped_count += count
                     self.logger.error(
                         message=(
                             f"{self.log_prefix}: Error occurred while pushing"
@@ -1680,33 +1674,55 @@ class AnomaliThreatstreamPlugin(PluginBase):
         retraction_interval = int(retraction_interval)
         start_time = datetime.now() - timedelta(days=retraction_interval)
         start_time = self._convert_datetime_to_anomali_format(start_time)
-        for source_ioc_list in source_indicators:
-            try:
-                iocs = set()
-                for ioc in source_ioc_list:
-                    if ioc:
-                        iocs.add(ioc.value)
-                total_iocs = len(iocs)
-                modified_indicators = self.get_indicators(
-                    is_retraction=True, retraction_time=start_time
-                )
-                for indicator in modified_indicators:
-                    iocs -= indicator
-                self.logger.info(
-                    f"{self.log_prefix}: {len(iocs)} indicator(s) will "
-                    f"be marked as retracted from {total_iocs} total "
-                    "indicator(s) present in cloud exchange for"
-                    f" {PLATFORM_NAME}."
-                )
+        # The indicators are pulled once per cycle, on the first chunk, and
+        # every chunk is checked against the same snapshot.
+        snapshot = None
+        try:
+            for source_ioc_list in source_indicators:
+                try:
+                    iocs = set()
+                    for ioc in source_ioc_list:
+                        if ioc:
+                            iocs.add(ioc.value)
+                    total_iocs = len(iocs)
+                    if snapshot is None:
+                        pull_start = time.monotonic()
+                        snapshot = pull_snapshot(
+                            self.get_indicators(
+                                is_retraction=True, retraction_time=start_time
+                            )
+                        )
+                        self.logger.info(
+                            f"{self.log_prefix}: Pulled a snapshot of "
+                            f"{snapshot.size} indicator(s) from "
+                            f"{PLATFORM_NAME} in "
+                            f"{time.monotonic() - pull_start:.2f} second(s)."
+                        )
+                    diff_start = time.monotonic()
+                    iocs = snapshot.get_missing(iocs)
+                    self.logger.debug(
+                        f"{self.log_prefix}: Checked {total_iocs} "
+                        "indicator(s) against the snapshot in "
+                        f"{time.monotonic() - diff_start:.2f} second(s)."
+                    )
+                    self.logger.info(
+                        f"{self.log_prefix}: {len(iocs)} indicator(s) will "
+                        f"be marked as retracted from {total_iocs} total "
+                        "indicator(s) present in cloud exchange for"
+                        f" {PLATFORM_NAME}."
+                    )
 
-                yield list(iocs), False
-            except Exception as err:
-                err_msg = (
-                    f"Error while fetching modified indicators from"
-                    f" {PLATFORM_NAME}."
-                )
-                self.logger.error(
-                    message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
-                    details=traceback.format_exc(),
-                )
-                raise AnomaliThreatstreamPluginException(err_msg)
+                    yield list(iocs), False
+                except Exception as err:
+                    err_msg = (
+                        f"Error while fetching modified indicators from"
+                        f" {PLATFORM_NAME}."
+                    )
+                    self.logger.error(
+                        message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
+                        details=traceback.format_exc(),
+                    )
+                    raise AnomaliThreatstreamPluginException(err_msg)
+        finally:
+            if snapshot is not None:
+                snapshot.close()
@@ -57,7 +57,7 @@ ANOMALI_STATUS = ["active", "inactive", "falsepos"]
 MODULE_NAME = "CTE"
 PLUGIN_NAME = "Anomali Threatstream XDR"
 PLATFORM_NAME = "Anomali Threatstream XDR"
-PLUGIN_VERSION = "1.3.0"
+PLUGIN_VERSION = "1.3.1"
 MAX_RETRIES = 4
 DEFAULT_WAIT_TIME = 60
 RETRY_SLEEP_TIME = 50
@@ -66,6 +66,7 @@ PAGE_LIMIT = 100
 DATE_FORMAT_FOR_IOCS = r"%Y-%m-%dT%H:%M:%S.%f%Z"
 TARGET_SIZE_MB = 10
 BYTES_TO_MB = 1024.0**2
+TARGET_SIZE_BYTES = TARGET_SIZE_MB * 1024 * 1024
 DEFAULT_REPUTATION = 5
 # Maximum number of Initial Range in Days.
 INTEGER_THRESHOLD = 4611686018427387904
@@ -34,7 +34,6 @@ CTE Anomali Threatstream plugin helper module.
 
 import json
 import re
-import sys
 import time
 import traceback
 from typing import Dict
@@ -47,7 +46,6 @@ from .anomali_threatstream_constant import (
     MAX_RETRIES,
     MODULE_NAME,
     RETRACTION,
-    TARGET_SIZE_MB,
 )
 
 
@@ -359,33 +357,55 @@ class AnomaliThreatstreamPluginHelper(object):
             )
             raise AnomaliThreatstreamPluginException(err_msg)
 
-    def split_into_size(self, data_list):
+    def serialize_json(self, record):
+        """Serialize a record to its JSON wire bytes."""
+        return json.dumps(record).encode("utf-8")
+
+    def pack_into_bodies(
+        self,
+        records,
+        max_bytes,
+        max_records=None,
+        serialize=None,
+        prefix=b"[",
+        separator=b",",
+        suffix=b"]",
+    ):
         """
-        Split a list into parts, each approximately with a target size in MB.
+        Serialize each record once and pack the records into request bodies.
 
-        Parameters:
-        - data_list: The list of data to be split.
+        Records are packed greedily in order, each body is
+        prefix + separator.join(serialized records) + suffix and is bounded by
+        max_bytes and max_records. A record larger than max_bytes on its own is
+        yielded alone. Bodies are built lazily, one at a time.
 
-        Returns:
-        A list of parts, each with a total size approximately equal to the target size.
+        Parameters:
+        - records: The records to be packed.
+        - max_bytes: Maximum size of a body in bytes.
+        - max_records: Maximum number of records in a body, None for no limit.
+        - serialize: Callable returning the wire bytes of a record,
+          defaults to serialize_json.
+        - prefix, separator, suffix: Bytes framing the serialized records.
+
+        Yields:
+        A tuple of the body bytes and the number of records in it.
         """
-        result = []
-        current_part = []
-        current_size_mb = 0
-
-        for item in data_list:
-            item_size_mb = sys.getsizeof(json.dumps(item)) / (
-                1024**2
-            )  # Convert bytes to MB
-            if current_size_mb + item_size_mb <= TARGET_SIZE_MB:
-                current_part.append(item)
-                current_size_mb += item_size_mb
-            else:
-                result.append(current_part)
-                current_part = [item]
-                current_size_mb = item_size_mb
-
-        if current_part:
-            result.append(current_part)
-
-        return result
+        if serialize is None:
+            serialize = self.serialize_json
+        framing = len(prefix) + len(suffix)
+        step = len(separator)
+        chunk, size = [], framing
+        for record in records:
+            record = serialize(record)
+            if chunk and (
+                size + step + len(record) > max_bytes
+                or len(chunk) == max_records
+            ):
+                yield prefix + separator.join(chunk) + suffix, len(chunk)
+                chunk, size = [], framing
+            if chunk:
+                size += step
+            size += len(record)
+            chunk.append(record)
+        if chunk:
+            yield prefix + separator.join(chunk) + suffix, len(chunk)
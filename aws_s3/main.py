@@ -32,13 +32,9 @@ AWS S3 Webtx Plugin.
 """
 from cryptography import x509
 from cryptography.hazmat.primitives import serialization
-import os
 from typing import List
 import traceback
 
-from tempfile import NamedTemporaryFile
-
-
 from netskope.integrations.cls.plugin_base import (
     PluginBase,
     ValidationResult,
@@ -53,7 +49,11 @@ from .utils.aws_s3_webtx_constants import (
     PLUGIN_VERSION,
 )
 from .utils.aws_s3_exceptions import AWSS3WebTXException
-from .utils.aws_s3_webtx_client import AWSS3WebTxClient, BucketNameAlreadyTaken
+from .utils.aws_s3_webtx_client import (
+    AWSS3WebTxClient,
+    BucketNameAlreadyTaken,
+    WebTxStream,
+)
 from netskope.common.utils import add_user_agent
 
 
@@ -153,30 +153,10 @@ class AWSS3WebTxPlugin(PluginBase):
                 user_agent,
             )
             aws_client.set_credentials()
-            temp_obj_file = NamedTemporaryFile("wb", delete=False)
-            for data in transformed_data:
-                if data:
-                    try:
-                        temp_obj_file.write(data)
-                        successful_log_push_counter += 1
-                    except Exception as exp:
-                        err_msg = (
-                            "Error occurred while "
-                            "writing log(s) to temporary object file."
-                        )
-                        self.logger.error(
-                            message=(
-                                f"{self.log_prefix}: {err_msg} Error: {exp}"
-                            ),
-                            details=str(traceback.format_exc()),
-                        )
-                        skipped_logs += 1
-                else:
-                    skipped_logs += 1
-            temp_obj_file.flush()
-            aws_client.push(temp_obj_file.name, data_type, subtype)
-            temp_obj_file.close()
-            os.unlink(temp_obj_file.name)
+            stream = WebTxStream(transformed_data)
+            successful_log_push_counter = stream.count
+            skipped_logs = len(transformed_data) - stream.count
+            aws_client.push(stream, data_type, subtype)
             if skipped_logs > 0:
                 self.logger.debug(
                     f"{self.log_prefix}: Received empty log(s) from PubSub "
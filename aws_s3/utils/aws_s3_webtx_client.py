@@ -31,11 +31,14 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 AWS S3 WebTx Client Class.
 """
 
+import io
 import threading
 import traceback
 import boto3
 from botocore.exceptions import NoCredentialsError, ClientError
+from bisect import bisect_right
 from datetime import datetime
+from itertools import accumulate
 from botocore.config import Config
 from .aws_s3_generate_temporary_credentials import (
     AWSS3GenerateTemporaryCredentials,
@@ -47,6 +50,74 @@ class BucketNameAlreadyTaken(Exception):
     pass
 
 
+class WebTxStream(io.RawIOBase):
+    """Read only file object over the gzip members of a WebTx batch.
+
+    Reads are served straight from the members, so the batch is uploaded
+    without being copied into a temporary file or a single buffer first.
+    """
+
+    def __init__(self, members):
+        """Init method.
+
+        Args:
+            members (List[bytes]): Gzip members, empty members are skipped.
+        """
+        super().__init__()
+        self._members = [memoryview(member) for member in members if member]
+        self._offsets = list(
+            accumulate((len(member) for member in self._members), initial=0)
+        )
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of the members in bytes."""
+        return self._offsets[-1]
+
+    @property
+    def count(self) -> int:
+        """Number of non empty members."""
+        return len(self._members)
+
+    def readable(self) -> bool:
+        """Stream is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Stream is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a new position."""
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        """Fill the buffer from the members starting at the current position."""
+        buffer = memoryview(buffer).cast("B")
+        written = 0
+        index = bisect_right(self._offsets, self._position) - 1
+        while written < len(buffer) and index < len(self._members):
+            start = self._position - self._offsets[index]
+            chunk = self._members[index][start:start + len(buffer) - written]
+            buffer[written:written + len(chunk)] = chunk
+            written += len(chunk)
+            self._position += len(chunk)
+            index += 1
+        return written
+
+
 class AWSS3WebTxClient:
     """AWS S3 WebTx Client Class."""
 
@@ -244,11 +315,11 @@ class AWSS3WebTxClient:
             )
             raise AWSS3WebTXException(err_msg)
 
-    def push(self, file_name: str, data_type: str, subtype: str):
+    def push(self, file_obj, data_type: str, subtype: str):
         """Push method.
 
         Args:
-            file_name (str): Name of the file.
+            file_obj (io.RawIOBase): Readable file object to upload.
             data_type (str): Data type.
             subtype (str): Sub type.
         """
@@ -260,8 +331,8 @@ class AWSS3WebTxClient:
         try:
             bucket_name = self.configuration.get("bucket_name", "").strip()
             s3_client = self.get_aws_client()
-            s3_client.upload_file(
-                file_name,
+            s3_client.upload_fileobj(
+                file_obj,
                 bucket_name,
                 object_name,
             )
@@ -34,7 +34,6 @@ Microsoft Azure Monitor Plugin."""
 import datetime
 import traceback
 import json
-import sys
 import requests
 import time
 from typing import List
@@ -50,7 +49,7 @@ from netskope.common.utils import AlertsHelper
 from .utils.monitor_validator import (
     AzureMonitorValidator,
 )
-from .utils.monitor_helper import get_monitor_mappings, split_into_size
+from .utils.monitor_helper import get_monitor_mappings, pack_into_bodies
 from .utils.monitor_exceptions import (
     MappingValidationError,
     EmptyExtensionError,
@@ -70,6 +69,7 @@ from .utils.monitor_constants import (
     MAX_WAIT_TIME,
     API_SCOPE,
     GRANT_TYPE,
+    MAX_PAYLOAD_SIZE_BYTES,
 )
 
 
@@ -185,12 +185,6 @@ class AzureMonitorPlugin(PluginBase):
         E.g. subtypes of alert is "dlp", "policy" etc.
         """
         try:
-            batch_size = sys.getsizeof(f"{transformed_data}") / (1024 * 1024)
-            if batch_size > 1:
-                transformed_data = split_into_size(transformed_data)
-            else:
-                transformed_data = [transformed_data]
-
             url_endpoint = (
                 f"{self.configuration.get('dce_uri').strip()}/"
                 f"dataCollectionRules/{self.configuration.get('dcr_immutable_id').strip()}/"
@@ -214,25 +208,27 @@ class AzureMonitorPlugin(PluginBase):
                 "Content-Type": "application/json",
             }
             headers = self._add_user_agent(headers)
-            for chunk in transformed_data:
+            for body, count in pack_into_bodies(
+                transformed_data, MAX_PAYLOAD_SIZE_BYTES
+            ):
                 page += 1
                 try:
                     self.push_data_to_monitor(
                         f"ingesting data to {self.plugin_name} for page {page}",
                         headers,
                         url_endpoint,
-                        json.dumps(chunk),
+                        body,
                     )
                     log_msg = "[{}]:[{}] Successfully ingested {} {}(s) for page {} to {}.".format(
                         data_type,
                         subtype,
-                        len(chunk),
+                        count,
                         data_type,
                         page,
                         self.plugin_name,
                     )
                     self.logger.info(f"{self.log_prefix}: {log_msg}")
-                    total_count += len(chunk)
+                    total_count += count
                 except Exception as err:
                     self.logger.error(
                         message=(
@@ -242,7 +238,7 @@ class AzureMonitorPlugin(PluginBase):
                         ),
                         details=str(traceback.format_exc()),
                     )
-                    skipped_count += len(chunk)
+                    skipped_count += count
                     continue
             if skipped_count > 0:
                 self.logger.info(
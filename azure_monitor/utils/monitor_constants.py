@@ -41,4 +41,5 @@ RETRY_SLEEP_TIME = 60
 MAX_WAIT_TIME = 120
 MODULE_NAME = "CLS"
 PLUGIN_NAME = "Microsoft Azure Monitor"
-PLUGIN_VERSION = "1.1.0"
+PLUGIN_VERSION = "1.1.1"
+MAX_PAYLOAD_SIZE_BYTES = 1024 * 1024
@@ -34,10 +34,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
 import re
-import os
 from typing import List
 from azure.storage.blob import BlobServiceClient
-from tempfile import NamedTemporaryFile
 from netskope.integrations.cls.plugin_base import PluginBase, ValidationResult
 
 from .utils.azure_validator import (
@@ -45,6 +43,7 @@ from .utils.azure_validator import (
 )
 from .utils.azure_client import (
     AzureClient,
+    WebTxStream,
 )
 
 REGEX_FOR_CONTAINER = r"^(?!-)(?!.*--)[A-Za-z0-9-]+(?<!-)$"
@@ -62,17 +61,9 @@ class AzurePlugin(PluginBase):
         """
         try:
             self.azure_client = AzureClient(self.configuration, self.logger, self.proxy)
-            temp_obj_file = NamedTemporaryFile("wb", delete=False)
-            for data in transformed_data:
-                temp_obj_file.write(data)
-            temp_obj_file.flush()
-            try:
-                self.azure_client.push(temp_obj_file.name, data_type, subtype)
-            except Exception:
-                raise
-            finally:
-                temp_obj_file.close()
-                os.unlink(temp_obj_file.name)
+            self.azure_client.push(
+                WebTxStream(transformed_data), data_type, subtype
+            )
         except Exception as e:
             self.logger.error(
                 f"Error while pushing to Azure Storage Plugin: {e}"
@@ -33,13 +33,84 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """Azure Client."""
 
 
+import io
 import time
 import uuid
+from bisect import bisect_right
+from itertools import accumulate
 from azure.storage.blob import (
     BlobServiceClient,
 )
 
 
+class WebTxStream(io.RawIOBase):
+    """Read only file object over the gzip members of a WebTx batch.
+
+    Reads are served straight from the members, so the batch is uploaded
+    without being copied into a temporary file or a single buffer first.
+    """
+
+    def __init__(self, members):
+        """Init method.
+
+        Args:
+            members (List[bytes]): Gzip members, empty members are skipped.
+        """
+        super().__init__()
+        self._members = [memoryview(member) for member in members if member]
+        self._offsets = list(
+            accumulate((len(member) for member in self._members), initial=0)
+        )
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of the members in bytes."""
+        return self._offsets[-1]
+
+    @property
+    def count(self) -> int:
+        """Number of non empty members."""
+        return len(self._members)
+
+    def readable(self) -> bool:
+        """Stream is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Stream is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a new position."""
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        """Fill the buffer from the members starting at the current position."""
+        buffer = memoryview(buffer).cast("B")
+        written = 0
+        index = bisect_right(self._offsets, self._position) - 1
+        while written < len(buffer) and index < len(self._members):
+            start = self._position - self._offsets[index]
+            chunk = self._members[index][start:start + len(buffer) - written]
+            buffer[written:written + len(chunk)] = chunk
+            written += len(chunk)
+            self._position += len(chunk)
+            index += 1
+        return written
+
+
 class AzureClient:
     """Azure Sentinel Client Class."""
 
@@ -49,10 +120,10 @@ class AzureClient:
         self.logger = logger
         self.proxy = proxy
 
-    def push(self, file_name, data_type, subtype):
+    def push(self, file_obj, data_type, subtype):
         """Call method of post_data with appropriate parameters.
 
-        :param data: The data to be ingested
+        :param file_obj: Readable file object (WebTxStream) to be ingested
         :param data_type: The type of the data being ingested (alerts/events)
         """
         # Setting a few properties of data being ingested
@@ -93,9 +164,13 @@ class AzureClient:
                 container=container_name, blob=object_name
             )
 
-            # Upload the created file
-            with open(file_name, "rb") as data:
-                blob_client.upload_blob(data, overwrite=True, proxies=self.proxy)
+            # Upload the batch
+            blob_client.upload_blob(
+                file_obj,
+                length=file_obj.size,
+                overwrite=True,
+                proxies=self.proxy,
+            )
 
             self.logger.info(
                 f"Successfully Uploaded to Azure Storage as blob file. {object_name}"
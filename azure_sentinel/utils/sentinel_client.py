@@ -37,10 +37,10 @@ import datetime
 import hashlib
 import hmac
 import json
-import sys
 import time
 import traceback
 from binascii import Error
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 import requests
@@ -51,6 +51,7 @@ from .sentinel_constants import (
     API_BASE_URL,
     CONTENT_TYPE,
     HTTP_METHOD,
+    MAX_PARALLEL_CHUNKS,
     MAX_RETRIES,
     MODULE_NAME,
     PLUGIN_NAME,
@@ -59,6 +60,7 @@ from .sentinel_constants import (
     TARGET_SIZE_BYTES,
 )
 from .sentinel_exception import AzureSentinelException
+from .sentinel_helper import pack_into_bodies
 
 
 class DataTypes(Enum):
@@ -438,33 +440,75 @@ class AzureSentinelClient:
             )
             raise AzureSentinelException(err_msg)
 
-    def create_payload(self, data, data_types):
-        payload_size = sys.getsizeof(json.dumps(data))
+    def create_payload(
+        self, data, data_types, target_size=TARGET_SIZE_BYTES
+    ):
+        """Pack the data into JSON array bodies of at most target_size bytes.
 
-        # If the payload size is within the limit, return it as a single chunk
-        if payload_size <= TARGET_SIZE_BYTES or len(data) == 1:
-            return [data]
+        Every record is serialized exactly once and records are packed
+        greedily in order, a record larger than target_size is sent alone.
+        The bodies are the same bytes json.dumps would produce for the
+        records of each chunk.
 
-        self.logger.debug(
-            f"{self.log_prefix}: {data_types} - The size of the current data "
-            "chunk exceeds the allowed payload limit "
-            "hence data will be divided into further chunks "
-            "before sharing. Current data chunk length: "
-            f"{len(data)}. Current data chunk size in bytes: {payload_size}"
-        )
+        Args:
+            data (list): Records to be ingested.
+            data_types (str): Data type and subtype used for logging.
+            target_size (int): Maximum size of a body in bytes.
 
-        # Split the data into two parts
-        mid = len(data) // 2
-        part1 = self.create_payload(
-            data[:mid], data_types
-        )  # Recursively process the first half
-        part2 = self.create_payload(
-            data[mid:], data_types
-        )  # Recursively process the second half
-        return part1 + part2  # Combine the results from both halves
+        Returns:
+            list: List of (body, record count) tuples.
+        """
+        payloads = list(pack_into_bodies(data, target_size, separator=b", "))
+        if not payloads:
+            payloads.append((b"[]", 0))
+
+        if len(payloads) > 1:
+            self.logger.debug(
+                f"{self.log_prefix}: {data_types} - The size of the current "
+                "data chunk exceeds the allowed payload limit hence data "
+                f"is divided into {len(payloads)} chunks before sharing. "
+                f"Current data chunk length: {len(data)}."
+            )
+        return payloads
+
+    def post_payload(
+        self,
+        uri,
+        headers,
+        workspace_id,
+        shared_key,
+        rfc1123date,
+        body,
+        logger_msg,
+        is_validation,
+    ):
+        """Sign and post a single body.
+
+        The signature is computed over the exact bytes that are sent.
+        """
+        headers = dict(headers)
+        headers["Authorization"] = self._build_signature(
+            workspace_id,
+            shared_key,
+            rfc1123date,
+            len(body),
+            is_validation,
+        )
+        return self.api_helper(
+            logger_msg,
+            uri,
+            "POST",
+            data=body,
+            headers=headers,
+            verify=self.verify_ssl,
+            proxies=self.proxy,
+            is_validation=is_validation,
+        )
 
     def push(self, data, data_type, sub_type, logger_msg, base_url, is_validation=False):
-        """Call method of post_data with appropriate parameters.
+        """Pack the data into chunks and post them to Azure Sentinel.
+
+        Up to MAX_PARALLEL_CHUNKS chunks are posted concurrently.
 
         :param data: The data to be ingested
         :param data_type: The type of the data being ingested (alerts/events)
@@ -483,7 +527,6 @@ class AzureSentinelClient:
         try:
             workspace_id = self.configuration.get("workspace_id", "").strip()
             shared_key = self.configuration.get("primary_key", "")
-            result = []
             data_types = f"[{data_type}][{sub_type}]"
             result = self.create_payload(data, data_types)
             if not is_validation:
@@ -503,53 +546,59 @@ class AzureSentinelClient:
                 "x-ms-date": rfc1123date,
             }
             headers = self._add_user_agent(headers)
-            page = 0
-            for result_data in result:
-                json_data = json.dumps(result_data)
-                current_chunk_size = sys.getsizeof(json_data)
-                page += 1
-                content_length = len(json_data)
-                signature = self._build_signature(
-                    workspace_id,
-                    shared_key,
-                    rfc1123date,
-                    content_length,
-                    is_validation,
-                )
+            page, current_chunk_size, result_data = 0, 0, 0
 
-                headers["Authorization"] = signature
+            def post(page, body, count):
                 msg = ""
                 if not is_validation:
                     msg = (
                         f", sharing {data_types} for batch {page}, "
-                        f"batch size: {current_chunk_size} and batch "
-                        f"length: {len(result_data)}"
+                        f"batch size: {len(body)} and batch "
+                        f"length: {count}"
                     )
-                self.api_helper(
-                    logger_msg + msg,
+                self.post_payload(
                     uri,
-                    "POST",
-                    data=json_data,
-                    headers=headers,
-                    verify=self.verify_ssl,
-                    proxies=self.proxy,
-                    is_validation=is_validation,
+                    headers,
+                    workspace_id,
+                    shared_key,
+                    rfc1123date,
+                    body,
+                    logger_msg + msg,
+                    is_validation,
                 )
-                total_count += len(result_data)
-                if not is_validation:
-                    log_msg = (
-                        "{} - Successfully ingested {} {}(s) for"
-                        " batch {} to {}. Total {}(s) shared till now: {}"
-                    ).format(
-                        data_types,
-                        len(result_data),
-                        data_type,
-                        page,
-                        PLUGIN_NAME,
-                        data_type,
-                        total_count,
-                    )
-                    self.logger.info(f"{self.log_prefix}: {log_msg}")
+                return count
+
+            max_workers = min(MAX_PARALLEL_CHUNKS, len(result))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(post, page, body, count)
+                    for page, (body, count) in enumerate(result, start=1)
+                ]
+                try:
+                    for page, future in enumerate(futures, start=1):
+                        current_chunk_size = len(result[page - 1][0])
+                        result_data = result[page - 1][1]
+                        total_count += future.result()
+                        if not is_validation:
+                            log_msg = (
+                                "{} - Successfully ingested {} {}(s) for"
+                                " batch {} to {}. Total {}(s) shared till"
+                                " now: {}"
+                            ).format(
+                                data_types,
+                                result_data,
+                                data_type,
+                                page,
+                                PLUGIN_NAME,
+                                data_type,
+                                total_count,
+                            )
+                            self.logger.info(f"{self.log_prefix}: {log_msg}")
+                except Exception:
+                    # Do not start the chunks that are still queued.
+                    for future in futures:
+                        future.cancel()
+                    raise
 
             if not is_validation:
                 log_msg = "{} - Successfully ingested {} {}(s) to {}.".format(
@@ -569,7 +618,7 @@ class AzureSentinelClient:
                 f"Failed to share {data_types} for "
                 f"batch {page}, batch size: "
                 f"{current_chunk_size} and batch "
-                f"length: {len(result_data)}. "
+                f"length: {result_data}. "
                 f"{str(exp)}"
             )
             self.logger.error(
@@ -67,7 +67,7 @@ ATTRIBUTE_DTYPE_MAP = {
 }
 MODULE_NAME = "CLS"
 PLUGIN_NAME = "Microsoft Azure Sentinel"
-PLUGIN_VERSION = "3.0.3"
+PLUGIN_VERSION = "3.0.5"
 VALIDATION_ALPHANUM_PATTERN = r"^[a-zA-Z0-9_]+$"
 VALIDATION_DIGITS_PATTERN = r"^[\d_]+$"
 MAX_API_CALL = 3
@@ -75,3 +75,4 @@ DEFAULT_WAIT = 30
 TARGET_SIZE_MB = 25
 BATCH_SIZE = 10000
 TARGET_SIZE_BYTES = TARGET_SIZE_MB * 1024 * 1024
+MAX_PARALLEL_CHUNKS = 4
@@ -33,13 +33,13 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """CLS Google Chronicle Plugin."""
 
 
-import sys
 import time
 import datetime
 import traceback
 import json
 import re
 import urllib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import List
 from jsonpath import jsonpath
 
@@ -55,7 +55,7 @@ from .utils.chronicle_client import (
 )
 from .utils.chronicle_helper import (
     get_chronicle_mappings,
-    split_into_size
+    pack_into_bodies
 )
 from .utils.chronicle_udm_generator import (  # NOQA: E501
     UDMGenerator,
@@ -73,6 +73,8 @@ from .utils.chronicle_constants import (
     SCOPES,
     DUMMY_DATA,
     DEFAULT_URL,
+    MAX_PARALLEL_REQUESTS,
+    MAX_PAYLOAD_SIZE_BYTES,
     MODULE_NAME,
     PLUGIN_NAME,
     PLUGIN_VERSION
@@ -401,12 +403,6 @@ class ChroniclePlugin(PluginBase):
             PushResult: Result indicating ingesting outcome and message
         """
         try:
-            batch_size = sys.getsizeof(f"{transformed_data}") / (1024 * 1024)
-            if batch_size > 1:
-                transformed_data = split_into_size(transformed_data)
-            else:
-                transformed_data = [transformed_data]
-
             chronicle_client = ChronicleClient(
                 self.configuration,
                 self.logger,
@@ -414,31 +410,56 @@ class ChroniclePlugin(PluginBase):
                 self.plugin_name
             )
             headers = self._add_user_agent()
+            prefix, suffix = chronicle_client.get_payload_framing()
 
             skipped_count = 0
             total_count = 0
             page = 0
-
-            for chunk in transformed_data:
-                page += 1
-                try:
-                    chronicle_client.ingest(chunk, headers=headers)
-                    log_msg = (
-                        f"[{data_type}]:[{subtype}] Successfully ingested "
-                        f"{len(chunk)} {data_type} for page {page} to {self.plugin_name}."
-                    )
-                    self.logger.info(f"{self.log_prefix}: {log_msg}")
-                    total_count += len(chunk)
-                except Exception as err:
-                    self.logger.error(
-                        message=(
-                            f"{self.log_prefix}: [{data_type}]:[{subtype}] "
-                            f"Error occurred while ingesting data. Error: {err}"
-                        ),
-                        details=str(traceback.format_exc()),
+            pending = {}
+
+            def collect(futures):
+                """Log the outcome of the completed chunks."""
+                nonlocal skipped_count, total_count
+                for future in futures:
+                    chunk_page, count = pending.pop(future)
+                    try:
+                        future.result()
+                        log_msg = (
+                            f"[{data_type}]:[{subtype}] Successfully ingested "
+                            f"{count} {data_type} for page {chunk_page} to {self.plugin_name}."
+                        )
+                        self.logger.info(f"{self.log_prefix}: {log_msg}")
+                        total_count += count
+                    except Exception as err:
+                        self.logger.error(
+                            message=(
+                                f"{self.log_prefix}: [{data_type}]:[{subtype}] "
+                                f"Error occurred while ingesting data. Error: {err}"
+                            ),
+                            details=str(traceback.format_exc()),
+                        )
+                        skipped_count += count
+
+            # At most MAX_PARALLEL_REQUESTS chunks are in flight, the next
+            # chunk is only packed once one of them has completed.
+            with ThreadPoolExecutor(
+                max_workers=MAX_PARALLEL_REQUESTS
+            ) as executor:
+                for body, count in pack_into_bodies(
+                    transformed_data,
+                    MAX_PAYLOAD_SIZE_BYTES,
+                    prefix=prefix,
+                    suffix=suffix,
+                ):
+                    if len(pending) >= MAX_PARALLEL_REQUESTS:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    page += 1
+                    future = executor.submit(
+                        chronicle_client.ingest, body, headers=headers
                     )
-                    skipped_count += len(chunk)
-                    continue
+                    pending[future] = (page, count)
+                collect(wait(pending).done)
             if skipped_count > 0:
                 self.logger.info(
                     f"{self.log_prefix}: Skipped {skipped_count} records "
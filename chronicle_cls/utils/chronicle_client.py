@@ -33,6 +33,10 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """CLS Google Chronicle Plugin Client."""
 
 
+import gzip
+import hashlib
+import threading
+import time
 import traceback
 import requests
 import json
@@ -44,11 +48,86 @@ from google.auth.transport import requests as gRequest
 from .chronicle_constants import (
     SCOPES,
     DEFAULT_URL,
+    MAX_BACKOFF_SECONDS,
+    MAX_CACHED_SESSIONS,
+    MAX_QUOTA_RETRIES,
+    MIN_BACKOFF_SECONDS,
+    QUOTA_STATUS_CODES,
 )
 
 from .chronicle_exceptions import GoogleChroniclePluginException
 
 
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+class QuotaBackoff:
+    """Backoff shared by the requests of a service account.
+
+    Every quota error doubles the delay and pauses all the requests until it
+    has elapsed, every successful request halves it again.
+    """
+
+    def __init__(self):
+        """Init method."""
+        self.delay = 0
+        self.resume_at = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Sleep until the requests are allowed to resume."""
+        with self.lock:
+            remaining = self.resume_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def throttle(self, retry_after=0):
+        """Increase the delay after a quota error and return it."""
+        with self.lock:
+            self.delay = min(
+                MAX_BACKOFF_SECONDS, max(MIN_BACKOFF_SECONDS, self.delay * 2)
+            )
+            delay = max(self.delay, retry_after)
+            self.resume_at = max(self.resume_at, time.monotonic() + delay)
+            return delay
+
+    def recover(self):
+        """Decrease the delay after a successful request."""
+        with self.lock:
+            self.delay = self.delay / 2 if self.delay > MIN_BACKOFF_SECONDS else 0
+
+
+def get_authorized_session(service_account_key):
+    """Get the authorized session and backoff of a service account key.
+
+    Sessions are cached per key so that the credentials are parsed and the
+    access token is fetched only once, and the connections are reused across
+    pushes. The access token is refreshed by the session when it expires.
+    A session evicted from the cache is not closed, it may still be in use
+    by another push and its connections are released once it is dropped.
+    """
+    key = hashlib.sha256(service_account_key.encode("utf-8")).hexdigest()
+    with _sessions_lock:
+        cached = _sessions.get(key)
+    if cached is not None:
+        return cached
+
+    credentials = service_account.Credentials.from_service_account_info(
+        json.loads(service_account_key),
+        scopes=SCOPES,
+    )
+    created = (gRequest.AuthorizedSession(credentials), QuotaBackoff())
+    with _sessions_lock:
+        cached = _sessions.setdefault(key, created)
+        while len(_sessions) > MAX_CACHED_SESSIONS:
+            _sessions.pop(next(iter(_sessions)))
+    if cached is not created:
+        # Lost the race to another push, this session was never handed out.
+        created[0].close()
+    return cached
+
+
 class ChronicleClient:
     """Chronicle Client."""
 
@@ -61,22 +140,56 @@ class ChronicleClient:
         self.create_session()
 
     def create_session(self):
-        """To Create a new session with credentials to make push requests."""
+        """Get the cached session of the credentials to make push requests."""
+        self.http_session, self.backoff = get_authorized_session(
+            self.configuration["service_account_key"]
+        )
+
+    def _get_retry_after(self, response):
+        """Get the Retry-After header of a response in seconds."""
         try:
-            credentials = (
-                service_account.Credentials.from_service_account_info(
-                    json.loads(self.configuration["service_account_key"]),
-                    scopes=SCOPES,
-                )
+            return max(0, float(response.headers.get("Retry-After", 0)))
+        except (TypeError, ValueError):
+            return 0
+
+    def _request(self, url, headers, **kwargs):
+        """Make a request, retrying quota errors with the shared backoff."""
+        for attempt in range(MAX_QUOTA_RETRIES + 1):
+            self.backoff.wait()
+            response = self.http_session.request(
+                "POST", url, headers=headers, **kwargs
             )
-            self.http_session = gRequest.AuthorizedSession(credentials)
-        except Exception:
-            raise
+            if (
+                response.status_code not in QUOTA_STATUS_CODES
+                or attempt == MAX_QUOTA_RETRIES
+            ):
+                break
+            delay = self.backoff.throttle(self._get_retry_after(response))
+            self.logger.info(
+                f"{self.log_prefix}: Received status code "
+                f"{response.status_code} from {self.plugin_name}, "
+                f"retrying after {round(delay, 2)} seconds. "
+                f"Retry count: {attempt + 1}."
+            )
+        if response.status_code not in QUOTA_STATUS_CODES:
+            self.backoff.recover()
+        return response
+
+    def get_payload_framing(self):
+        """Return the bytes surrounding the events of an ingestion body.
+
+        The events packed between them form the same body ingest would
+        build for a list of events.
+        """
+        customer_id = json.dumps(self.configuration["customer_id"].strip())
+        prefix = f'{{"customer_id": {customer_id}, "events": ['
+        return prefix.encode("utf-8"), b"]}"
 
     def ingest(self, transformed_data, headers, is_validate=False):
         """Call the API for data Ingestion.
 
-        :transformed_data : The transformed data to be ingested.
+        :transformed_data : The transformed data to be ingested, either a
+        list of events or a body already framed with get_payload_framing.
         """
         try:
             if self.configuration.get("region", "") == "custom":
@@ -85,17 +198,23 @@ class ChronicleClient:
                 BASE_URL = DEFAULT_URL[self.configuration.get("region", "usa")]
 
             url = f"{BASE_URL}/v2/udmevents:batchCreate"
-            payload = {
-                "customer_id": self.configuration["customer_id"].strip(),
-                "events": transformed_data,
-            }
-
-            response = self.http_session.request(
-                "POST",
-                url,
-                headers=headers,
-                json=payload,
-            )
+            if isinstance(transformed_data, bytes):
+                headers = {
+                    **headers,
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                }
+                response = self._request(
+                    url,
+                    headers,
+                    data=gzip.compress(transformed_data, compresslevel=6),
+                )
+            else:
+                payload = {
+                    "customer_id": self.configuration["customer_id"].strip(),
+                    "events": transformed_data,
+                }
+                response = self._request(url, headers, json=payload)
             response = response.json()
 
             if is_validate and response == {}:
@@ -34,7 +34,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 MODULE_NAME = "CLS"
 PLUGIN_NAME = "Google Chronicle"
-PLUGIN_VERSION = "2.1.0"
+PLUGIN_VERSION = "2.2.0"
 
 DEFAULT_URL = {
    "usa": "https://malachiteingestion-pa.googleapis.com",
@@ -42,6 +42,15 @@ DEFAULT_URL = {
    "asia": "https://asia-southeast1-malachiteingestion-pa.googleapis.com",
 }
 SCOPES = ["https://www.googleapis.com/auth/malachite-ingestion"]
+MAX_PAYLOAD_SIZE_BYTES = 1024 * 1024
+MAX_PARALLEL_REQUESTS = 4
+MAX_CACHED_SESSIONS = 16
+# Status codes of quota and overload errors, these requests are retried
+# after a backoff shared by all the requests of the same service account.
+QUOTA_STATUS_CODES = (429, 503)
+MAX_QUOTA_RETRIES = 5
+MIN_BACKOFF_SECONDS = 1
+MAX_BACKOFF_SECONDS = 60
 
 SEVERITY_LOW = "Low"
 SEVERITY_MEDIUM = "Medium"
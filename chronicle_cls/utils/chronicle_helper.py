@@ -33,7 +33,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """CLS Google Chronicle Plugin Helper."""
 
 
-import sys
+import json
 from jsonschema import validate
 
 from .chronicle_exceptions import (
@@ -243,31 +243,52 @@ def extract_subtypes(mappings, data_type):
     return [subtype for subtype in taxonomy]
 
 
-def split_into_size(data_list):
+def serialize_json(record):
+    """Serialize a record to its JSON wire bytes."""
+    return json.dumps(record).encode("utf-8")
+
+
+def pack_into_bodies(
+    records,
+    max_bytes,
+    max_records=None,
+    serialize=serialize_json,
+    prefix=b"[",
+    separator=b",",
+    suffix=b"]",
+):
     """
-    Split a list into parts, each approximately with a target size in MB.
+    Serialize each record once and pack the records into request bodies.
 
-    Parameters:
-    - data_list: The list of data to be split.
+    Records are packed greedily in order, each body is
+    prefix + separator.join(serialized records) + suffix and is bounded by
+    max_bytes and max_records. A record larger than max_bytes on its own is
+    yielded alone. Bodies are built lazily, one at a time.
 
-    Returns:
-    A list of parts, each with a total size approximately equal to the target size.
+    Parameters:
+    - records: The records to be packed.
+    - max_bytes: Maximum size of a body in bytes.
+    - max_records: Maximum number of records in a body, None for no limit.
+    - serialize: Callable returning the wire bytes of a record.
+    - prefix, separator, suffix: Bytes framing the serialized records.
+
+    Yields:
+    A tuple of the body bytes and the number of records in it.
     """
-    result = []
-    current_part = []
-    current_size_mb = 0
-
-    for item in data_list:
-        item_size_mb = sys.getsizeof(f"{item}") / (1024 * 1024)  # Convert bytes to MB
-        if current_size_mb + item_size_mb <= 1:
-            current_part.append(item)
-            current_size_mb += item_size_mb
-        else:
-            result.append(current_part)
-            current_part = [item]
-            current_size_mb = item_size_mb
-
-    if current_part:
-        result.append(current_part)
-
-    return result
+    framing = len(prefix) + len(suffix)
+    step = len(separator)
+    chunk, size = [], framing
+    for record in records:
+        record = serialize(record)
+        if chunk and (
+            size + step + len(record) > max_bytes
+            or len(chunk) == max_records
+        ):
+            yield prefix + separator.join(chunk) + suffix, len(chunk)
+            chunk, size = [], framing
+        if chunk:
+            size += step
+        size += len(record)
+        chunk.append(record)
+    if chunk:
+        yield prefix + separator.join(chunk) + suffix, len(chunk)
@@ -36,6 +36,7 @@ plugin's methods.
 import datetime
 import ipaddress
 import re
+import time
 import traceback
 from typing import Dict, Generator, List, Tuple, Union
 
@@ -70,6 +71,9 @@ from .utils.crowdstrike_constants import (
     ENDPOINT_DETECTION_DETAILS_BATCH_SIZE,
     INTEGER_THRESHOLD,
     INTERNAL_TYPES_TO_CROWDSTRIKE,
+    IOC_CACHE_DIR,
+    IOC_CACHE_RECONCILE_MAX_PAGES,
+    IOC_CACHE_TTL,
     IOC_MANAGEMENT,
     IOC_MANAGEMENT_INDICATORS_LIMIT,
     IOC_MANAGEMENT_PULL_PAGE_LIMIT,
@@ -93,6 +97,8 @@ from .utils.crowdstrike_helper import (
     CrowdstrikePluginException,
     CrowdStrikePluginHelper,
 )
+from .utils.crowdstrike_ioc_cache import IOCCache, get_cache_path
+from .utils.retraction import pull_snapshot
 
 
 class CrowdStrikePlugin(PluginBase):
@@ -228,9 +234,7 @@ class CrowdStrikePlugin(PluginBase):
                 "description": indicator.comments,
                 "expiration": expiration,
             }
-            ioc_value = indicator.value
-            if indicator.type in CASE_INSENSITIVE_IOC_TYPES:
-                ioc_value = ioc_value.lower()
+            ioc_value = self._get_cache_value(indicator)
             # If URL is there then extract host and validate it.
             if indicator.type in BIFURCATE_INDICATOR_TYPES:
                 try:
@@ -284,16 +288,25 @@ class CrowdStrikePlugin(PluginBase):
         return generated_payload
 
     def _verify_ioc_existence(
-        self, headers: Dict, indicators: Dict, action: str
+        self,
+        headers: Dict,
+        indicators: Dict,
+        action: str,
+        ioc_cache: IOCCache = None,
     ) -> Tuple:
         """Verify existence of indicators on CrowdStrike IOC Management.
 
+        Values found in the IOC cache are not verified again, the ids of
+        the values verified are added to it.
+
         Args:
             headers (Dict): Dictionary containing auth token.
             indicators (Dict): Indicator payloads.
+            ioc_cache (IOCCache): IOC cache, None to verify every value.
 
         Returns:
             Tuple: List of indicators to share, List of indicators to update
+                and values of the indicators to update found in the cache.
         """
         base_url = self.configuration.get("base_url", "").strip()
         query_endpoint = f"{base_url}/iocs/combined/indicator/v1"  # noqa
@@ -302,8 +315,23 @@ class CrowdStrikePlugin(PluginBase):
             f"{IOC_MANAGEMENT}."
         )
         push_payload, update_payload = [], []
-        verification_payload = list(indicators.keys())
-        total_verification_count = len(verification_payload)
+        cached_ids = {}
+        if ioc_cache:
+            cached_ids = self._get_cached_ids(ioc_cache, list(indicators))
+            for value, ioc_id in cached_ids.items():
+                indicators[value]["id"] = ioc_id
+                update_payload.append(indicators[value])
+            hit_rate = len(cached_ids) / len(indicators) if indicators else 0
+            self.logger.info(
+                f"{self.log_prefix}: IOC cache hit rate for this push is "
+                f"{hit_rate:.1%}, {len(cached_ids)} of {len(indicators)} "
+                "indicator(s) are known to exist on "
+                f"{IOC_MANAGEMENT} and will not be verified."
+            )
+        verification_payload = [
+            value for value in indicators if value not in cached_ids
+        ]
+        total_verification_count = len(indicators)
         for batch in self.divide_in_chunks(
             verification_payload, IOC_MANAGEMENT_PULL_PAGE_LIMIT
         ):
@@ -336,6 +364,10 @@ class CrowdStrikePlugin(PluginBase):
                 resource.get("value"): resource.get("id")
                 for resource in resources
             }
+            if ioc_cache:
+                self._put_cached_ids(
+                    ioc_cache, self._get_cache_entries(resources)
+                )
 
             for value in batch:
                 if value in tmp_dict:
@@ -358,7 +390,153 @@ class CrowdStrikePlugin(PluginBase):
             f"be shared and {len(update_payload)} indicator(s) will be updated"
             f" within {IOC_MANAGEMENT}."
         )
-        return push_payload, update_payload
+        return push_payload, update_payload, list(cached_ids)
+
+    def _open_ioc_cache(self, base_url: str, client_id: str) -> IOCCache:
+        """Open the IOC cache of the tenant.
+
+        Args:
+            base_url (str): Base URL of the tenant.
+            client_id (str): Client ID of the tenant.
+
+        Returns:
+            IOCCache: IOC cache, None if it could not be opened.
+        """
+        try:
+            return IOCCache(
+                get_cache_path(IOC_CACHE_DIR, base_url, client_id),
+                IOC_CACHE_TTL,
+            )
+        except Exception as exp:
+            self.logger.error(
+                f"{self.log_prefix}: Unable to open the IOC cache, every "
+                f"indicator will be verified on {IOC_MANAGEMENT}. "
+                f"Error: {exp}",
+                details=str(traceback.format_exc()),
+            )
+            return None
+
+    def _get_cache_entries(self, resources: List[Dict]):
+        """Get the cache entries of the IOC Management resources."""
+        return (
+            (
+                resource.get("value"),
+                resource.get("id"),
+                resource.get("expiration"),
+            )
+            for resource in resources
+        )
+
+    def _get_cache_value(self, indicator: Indicator) -> str:
+        """Get the value an indicator is cached with."""
+        if indicator.type in CASE_INSENSITIVE_IOC_TYPES:
+            return indicator.value.lower()
+        return indicator.value
+
+    def _get_cached_ids(self, ioc_cache: IOCCache, values: List) -> Dict:
+        """Get the cached ids of values, none if the cache fails."""
+        try:
+            return ioc_cache.get_ids(values)
+        except Exception as exp:
+            self.logger.error(
+                f"{self.log_prefix}: Error occurred while reading the IOC "
+                f"cache, every indicator will be verified on {IOC_MANAGEMENT}."
+                f" Error: {exp}",
+                details=str(traceback.format_exc()),
+            )
+            return {}
+
+    def _put_cached_ids(self, ioc_cache: IOCCache, iocs):
+        """Add value and id pairs to the IOC cache."""
+        try:
+            ioc_cache.put(iocs)
+        except Exception as exp:
+            self.logger.error(
+                f"{self.log_prefix}: Error occurred while updating the IOC "
+                f"cache. Error: {exp}",
+                details=str(traceback.format_exc()),
+            )
+
+    def _remove_cached_ids(self, ioc_cache: IOCCache, values: List):
+        """Remove values from the IOC cache."""
+        try:
+            ioc_cache.remove(values)
+        except Exception as exp:
+            self.logger.error(
+                f"{self.log_prefix}: Error occurred while updating the IOC "
+                f"cache. Error: {exp}",
+                details=str(traceback.format_exc()),
+            )
+
+    def _reconcile_ioc_cache(self, ioc_cache: IOCCache, headers: Dict):
+        """Add the indicators modified on IOC Management to the IOC cache.
+
+        Indicators shared by Cloud Exchange are skipped as the cache already
+        has them from the create and update responses. At most
+        IOC_CACHE_RECONCILE_MAX_PAGES pages are pulled per push, the next
+        push resumes from the last modified_on time pulled.
+
+        Args:
+            ioc_cache (IOCCache): IOC cache.
+            headers (Dict): Headers containing auth token.
+        """
+        try:
+            checkpoint = ioc_cache.get_checkpoint()
+            if not checkpoint:
+                # A new cache is filled by the verify responses, only the
+                # indicators modified from now on are reconciled.
+                ioc_cache.set_checkpoint(
+                    datetime.datetime.now(datetime.timezone.utc).strftime(
+                        DATE_FORMAT_FOR_IOCS
+                    )
+                )
+                return
+            base_url = self.configuration.get("base_url", "").strip()
+            query_endpoint = f"{base_url}/iocs/combined/indicator/v1"
+            query_params = {
+                "limit": IOC_MANAGEMENT_PULL_PAGE_LIMIT,
+                "sort": "modified_on.asc",
+                "filter": f"modified_on:>='{checkpoint}'+tags:!'{DEFAULT_NETSKOPE_TAG}'",  # noqa
+            }
+            reconciled = 0
+            for page in range(1, IOC_CACHE_RECONCILE_MAX_PAGES + 1):
+                resp_json = self.crowdstrike_helper.api_helper(
+                    url=query_endpoint,
+                    method="GET",
+                    headers=headers,
+                    params=query_params,
+                    is_handle_error_required=True,
+                    logger_msg=(
+                        f"reconciling the IOC cache with {IOC_MANAGEMENT} "
+                        f"for page {page}"
+                    ),
+                    configuration=self.configuration,
+                )
+                resources = resp_json.get("resources", [])
+                ioc_cache.put(self._get_cache_entries(resources))
+                reconciled += len(resources)
+                if resources and resources[-1].get("modified_on"):
+                    ioc_cache.set_checkpoint(resources[-1]["modified_on"])
+                pagination = resp_json.get("meta", {}).get("pagination", {})
+                after = pagination.get("after")
+                if (
+                    not after
+                    or len(resources) < IOC_MANAGEMENT_PULL_PAGE_LIMIT
+                ):
+                    break
+                query_params["after"] = after
+            self.logger.debug(
+                f"{self.log_prefix}: Reconciled {reconciled} indicator(s) "
+                f"modified on {IOC_MANAGEMENT} since {checkpoint} with the "
+                "IOC cache."
+            )
+        except Exception as exp:
+            self.logger.error(
+                f"{self.log_prefix}: Error occurred while reconciling the IOC "
+                f"cache with {IOC_MANAGEMENT}, it will be resumed in the next"
+                f" push. Error: {exp}",
+                details=str(traceback.format_exc()),
+            )
 
     def _get_detection_detailed(
         self,
@@ -1617,37 +1795,63 @@ class CrowdStrikePlugin(PluginBase):
                 plugin_name=plugin_name,
             )
 
-            # Step-2 Verify existence of indicators.
-            push_payloads, update_payloads = self._verify_ioc_existence(
-                headers=headers,
-                indicators=indicator_payloads,
-                action=target_action,
-            )
+            ioc_cache = self._open_ioc_cache(base_url, client_id)
+            try:
+                if ioc_cache:
+                    self._reconcile_ioc_cache(ioc_cache, headers)
 
-            # Step-3
-            # Update Indicators in Custom IOC Management.
-            if update_payloads:
-                self._update_indicators_in_ioc_management(
-                    payloads=update_payloads,
+                # Step-2 Verify existence of indicators.
+                (
+                    push_payloads,
+                    update_payloads,
+                    cached_values,
+                ) = self._verify_ioc_existence(
                     headers=headers,
-                    batch_size=batch_size,
+                    indicators=indicator_payloads,
+                    action=target_action,
+                    ioc_cache=ioc_cache,
                 )
 
-            # Step-4
-            # Share indicators with Custom IOC Management.
-            if is_push_accepted is False and len(push_payloads) > 0:
-                self.logger.info(
-                    f"{self.log_prefix}: Skipped sharing of "
-                    f"{len(push_payloads)} indicator(s) on {IOC_MANAGEMENT} as"
-                    " it already has 1 Million indicators on it. Remove "
-                    "existing indicators to remain under this limit."
-                )
-            elif push_payloads:
-                self._push_indicators_to_ioc_management(
-                    payloads=push_payloads,
-                    headers=headers,
-                    batch_size=batch_size,
-                )
+                # Step-3
+                # Update Indicators in Custom IOC Management.
+                if update_payloads:
+                    failed_payloads = (
+                        self._update_indicators_in_ioc_management(
+                            payloads=update_payloads,
+                            headers=headers,
+                            batch_size=batch_size,
+                            ioc_cache=ioc_cache,
+                        )
+                    )
+                    push_payloads += self._retry_cached_updates(
+                        headers=headers,
+                        payloads=failed_payloads,
+                        cached_values=cached_values,
+                        action=target_action,
+                        batch_size=batch_size,
+                        ioc_cache=ioc_cache,
+                    )
+
+                # Step-4
+                # Share indicators with Custom IOC Management.
+                if is_push_accepted is False and len(push_payloads) > 0:
+                    self.logger.info(
+                        f"{self.log_prefix}: Skipped sharing of "
+                        f"{len(push_payloads)} indicator(s) on "
+                        f"{IOC_MANAGEMENT} as it already has 1 Million "
+                        "indicators on it. Remove existing indicators to "
+                        "remain under this limit."
+                    )
+                elif push_payloads:
+                    self._push_indicators_to_ioc_management(
+                        payloads=push_payloads,
+                        headers=headers,
+                        batch_size=batch_size,
+                        ioc_cache=ioc_cache,
+                    )
+            finally:
+                if ioc_cache:
+                    ioc_cache.close()
             log_msg = (
                 f'Successfully executed push method for "{action_label}" '
                 f"target action."
@@ -1671,20 +1875,97 @@ class CrowdStrikePlugin(PluginBase):
                 message=err_msg,
             )
 
+    def _retry_cached_updates(
+        self,
+        headers: Dict,
+        payloads: List[Dict],
+        cached_values: List[str],
+        action: str,
+        batch_size: int,
+        ioc_cache: IOCCache,
+    ) -> List[Dict]:
+        """Verify again the cached indicators of the failed update batches.
+
+        A cached id of an indicator deleted or expired on IOC Management
+        fails its whole update batch. The cached indicators of the failed
+        batches are verified again, those still existing are updated once
+        more and the others are returned to be shared.
+
+        Args:
+            headers (Dict): Headers dictionary containing auth token.
+            payloads (List[Dict]): Payloads of the failed updates.
+            cached_values (List[str]): Values whose id came from the cache.
+            action (str): Action of the indicators.
+            batch_size (int): Batch size to consider while updating.
+            ioc_cache (IOCCache): IOC cache.
+
+        Returns:
+            List[Dict]: Payloads of the indicators to share.
+        """
+        cached_values = set(cached_values)
+        indicators = {}
+        for payload in payloads:
+            if payload["value"] in cached_values:
+                payload.pop("id", None)
+                indicators[payload["value"]] = payload
+        if not indicators:
+            return []
+        self.logger.info(
+            f"{self.log_prefix}: Verifying {len(indicators)} cached "
+            f"indicator(s) of the failed update batches again on "
+            f"{IOC_MANAGEMENT}."
+        )
+        push_payloads, update_payloads, _ = self._verify_ioc_existence(
+            headers=headers,
+            indicators=indicators,
+            action=action,
+            ioc_cache=ioc_cache,
+        )
+        if update_payloads:
+            self._update_indicators_in_ioc_management(
+                payloads=update_payloads,
+                headers=headers,
+                batch_size=batch_size,
+                ioc_cache=ioc_cache,
+            )
+        return push_payloads
+
+    def _cache_response_iocs(self, ioc_cache: IOCCache, response):
+        """Add the indicators of a create or update response to the cache."""
+        try:
+            resp_json = response.json()
+        except Exception:
+            return
+        self._put_cached_ids(
+            ioc_cache,
+            self._get_cache_entries(resp_json.get("resources") or []),
+        )
+
     def divide_in_chunks(self, indicators, chunk_size):
         """Return Fixed size chunks from list."""
         for i in range(0, len(indicators), chunk_size):
             yield indicators[i : i + chunk_size]  # noqa
 
     def _update_indicators_in_ioc_management(
-        self, headers: Dict, payloads: List[Dict], batch_size: int
+        self,
+        headers: Dict,
+        payloads: List[Dict],
+        batch_size: int,
+        ioc_cache: IOCCache = None,
     ):
         """Update indicators in IOC Management.
 
+        The values of the batches which fail to update are removed from the
+        IOC cache so that they are verified again.
+
         Args:
             headers (Dict): Headers dictionary containing auth token.
             payloads (List[Dict]): Json payloads.
             batch_size (int): Batch size to consider while updating.
+            ioc_cache (IOCCache): IOC cache, None if not used.
+
+        Returns:
+            List[Dict]: Payloads of the batches which failed to update.
         """
         self.logger.info(
             f"{self.log_prefix}: Updating indicator(s) on {IOC_MANAGEMENT}."
@@ -1698,6 +1979,7 @@ class CrowdStrikePlugin(PluginBase):
         )
         total_indicators_count = len(payloads)
         update_success, update_failed = 0, 0
+        failed_payloads = []
         for payload_list in self.divide_in_chunks(payloads, batch_size):
             chunk_size = len(payload_list)
             json_body = {
@@ -1719,6 +2001,8 @@ class CrowdStrikePlugin(PluginBase):
                 )
                 if response.status_code in [200, 201]:
                     update_success += chunk_size
+                    if ioc_cache:
+                        self._cache_response_iocs(ioc_cache, response)
                     self.logger.info(
                         f"{self.log_prefix}: Successfully updated "
                         f"{update_success} indicator(s) out of "
@@ -1728,6 +2012,12 @@ class CrowdStrikePlugin(PluginBase):
 
                 elif response.status_code in [400, 500]:
                     update_failed += chunk_size
+                    failed_payloads += payload_list
+                    if ioc_cache:
+                        self._remove_cached_ids(
+                            ioc_cache,
+                            [payload["value"] for payload in payload_list],
+                        )
                     resp_json = self.crowdstrike_helper.parse_response(
                         response
                     )
@@ -1753,6 +2043,12 @@ class CrowdStrikePlugin(PluginBase):
                     details=str(traceback.format_exc()),
                 )
                 update_failed += chunk_size
+                failed_payloads += payload_list
+                if ioc_cache:
+                    self._remove_cached_ids(
+                        ioc_cache,
+                        [payload["value"] for payload in payload_list],
+                    )
             except Exception as exp:
                 err_msg = (
                     f"Unexpected error occurred while updating indicators "
@@ -1763,17 +2059,25 @@ class CrowdStrikePlugin(PluginBase):
                     details=str(traceback.format_exc()),
                 )
                 update_failed += chunk_size
+                failed_payloads += payload_list
+                if ioc_cache:
+                    self._remove_cached_ids(
+                        ioc_cache,
+                        [payload["value"] for payload in payload_list],
+                    )
         self.logger.info(
             f"{self.log_prefix}: Successfully updated {update_success} "
             f"indicator(s) and {update_failed} indicator(s) were not "
             f"updated on {IOC_MANAGEMENT}."
         )
+        return failed_payloads
 
     def _push_indicators_to_ioc_management(
         self,
         headers: Dict,
         payloads: List[Dict],
         batch_size: int,
+        ioc_cache: IOCCache = None,
     ) -> Dict:
         """Push the indicator to the CrowdStrike IOC Management.
 
@@ -1783,6 +2087,8 @@ class CrowdStrikePlugin(PluginBase):
             headers (Dict): Header dictionary having OAUTH2 access token
             payload (List[Dit]): List of python dictionary object of
             JSON response model as per CrowdStrike API.
+            ioc_cache (IOCCache): IOC cache the created indicators are
+            added to, None if not used.
         Returns:
             Dict: JSON response dict received after successful push.
         """
@@ -1819,6 +2125,8 @@ class CrowdStrikePlugin(PluginBase):
                 )
                 if response.status_code == 201:
                     push_success += chunk_size
+                    if ioc_cache:
+                        self._cache_response_iocs(ioc_cache, response)
                     self.logger.info(
                         f"{self.log_prefix}: Successfully shared "
                         f"{push_success} indicator(s) out of "
@@ -2390,72 +2698,112 @@ class CrowdStrikePlugin(PluginBase):
             "indicator_source_page"
         )
         end_time = datetime.datetime.now()
-        for source_ioc_list in source_indicators:
-            try:
-                management_iocs = set()
-                endpoint_ioc = set()
-                for ioc in source_ioc_list:
-                    if NON_CROWDSTRIKE_DISCOVERED in ioc.tags:
-                        management_iocs.add(ioc.value)
-                    else:
-                        endpoint_ioc.add(ioc.value)
-
-                start_time = end_time - datetime.timedelta(
-                    days=retraction_interval
-                )
+        start_time = end_time - datetime.timedelta(days=retraction_interval)
+        # The pages are pulled once per cycle, on the first chunk that needs
+        # them, and every chunk is checked against the same snapshots.
+        snapshots = {}
+        try:
+            for source_ioc_list in source_indicators:
+                try:
+                    management_iocs = set()
+                    endpoint_ioc = set()
+                    for ioc in source_ioc_list:
+                        if NON_CROWDSTRIKE_DISCOVERED in ioc.tags:
+                            management_iocs.add(ioc.value)
+                        else:
+                            endpoint_ioc.add(ioc.value)
 
-                if (
-                    endpoint_ioc
-                    and "endpoint_detections" in indicator_source_page
-                ):
-                    endpoint_detection_pulled_iocs = (
-                        self._pull_iocs_from_endpoint_detections(
-                            threat_data_type=threat_data_type,
-                            initial_check_point=start_time.strftime(
-                                DATE_FORMAT
+                    if (
+                        endpoint_ioc
+                        and "endpoint_detections" in indicator_source_page
+                    ):
+                        endpoint_ioc = self._get_retracted_iocs(
+                            snapshots=snapshots,
+                            source_page="Endpoint Detections",
+                            iocs=endpoint_ioc,
+                            pull=lambda: (
+                                self._pull_iocs_from_endpoint_detections(
+                                    threat_data_type=threat_data_type,
+                                    initial_check_point=start_time.strftime(
+                                        DATE_FORMAT
+                                    ),
+                                    storage={},
+                                    is_retraction=True,
+                                )
                             ),
-                            storage={},
-                            is_retraction=True,
                         )
-                    )
-                    for iocs in endpoint_detection_pulled_iocs:
-                        endpoint_ioc = endpoint_ioc - iocs
 
-                if (
-                    management_iocs
-                    and "ioc_management" in indicator_source_page
-                ):
-                    ioc_management_pulled_iocs = (
-                        self._pull_iocs_from_ioc_management(
-                            threat_data_type=threat_data_type,
-                            initial_check_point=start_time.strftime(
-                                DATE_FORMAT
+                    if (
+                        management_iocs
+                        and "ioc_management" in indicator_source_page
+                    ):
+                        management_iocs = self._get_retracted_iocs(
+                            snapshots=snapshots,
+                            source_page="IOC Management",
+                            iocs=management_iocs,
+                            pull=lambda: self._pull_iocs_from_ioc_management(
+                                threat_data_type=threat_data_type,
+                                initial_check_point=start_time.strftime(
+                                    DATE_FORMAT
+                                ),
+                                storage={},
+                                is_retraction=True,
                             ),
-                            storage={},
-                            is_retraction=True,
                         )
+
+                    combined_ioc = endpoint_ioc.union(management_iocs)
+
+                    self.logger.info(
+                        f"{self.log_prefix}: {len(combined_ioc)}"
+                        " indicator(s) will be marked as retracted "
+                        f"from total {len(source_ioc_list)} indicator(s)."
+                    )
+                    yield list(combined_ioc), False
+                except Exception as err:
+                    err_msg = (
+                        f"Error while fetching modified indicators from"
+                        f" {PLATFORM_NAME}."
+                    )
+                    self.logger.error(
+                        message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
+                        details=traceback.format_exc(),
                     )
-                    for iocs in ioc_management_pulled_iocs:
-                        management_iocs = management_iocs - iocs
+                    raise CrowdstrikePluginException(err_msg)
+        finally:
+            for snapshot in snapshots.values():
+                snapshot.close()
 
-                combined_ioc = endpoint_ioc.union(management_iocs)
+    def _get_retracted_iocs(
+        self, snapshots: Dict, source_page: str, iocs: set, pull
+    ) -> set:
+        """Get the indicators which are no longer on a source page.
 
-                self.logger.info(
-                    f"{self.log_prefix}: {len(combined_ioc)}"
-                    " indicator(s) will be marked as retracted "
-                    f"from total {len(source_ioc_list)} indicator(s)."
-                )
-                yield list(combined_ioc), False
-            except Exception as err:
-                err_msg = (
-                    f"Error while fetching modified indicators from"
-                    f" {PLATFORM_NAME}."
-                )
-                self.logger.error(
-                    message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
-                    details=traceback.format_exc(),
-                )
-                raise CrowdstrikePluginException(err_msg)
+        Args:
+            snapshots (Dict): Snapshots of the pages pulled in this cycle.
+            source_page (str): Source page to check the indicators against.
+            iocs (set): Indicator values to check.
+            pull (Callable): Function pulling the indicators of the page.
+
+        Returns:
+            set: Indicator values not on the source page.
+        """
+        if source_page not in snapshots:
+            pull_start = time.monotonic()
+            snapshots[source_page] = pull_snapshot(pull())
+            self.logger.info(
+                f"{self.log_prefix}: Pulled a snapshot of "
+                f"{snapshots[source_page].size} indicator(s) from "
+                f"{source_page} in "
+                f"{time.monotonic() - pull_start:.2f} second(s)."
+            )
+        diff_start = time.monotonic()
+        retracted_iocs = snapshots[source_page].get_missing(iocs)
+        self.logger.debug(
+            f"{self.log_prefix}: Checked {len(iocs)} indicator(s) against "
+            f"the {source_page} snapshot in "
+            f"{time.monotonic() - diff_start:.2f} second(s)."
+        )
+        return retracted_iocs
 
     def retract_indicators(
         self,
@@ -2505,41 +2853,56 @@ class CrowdStrikePlugin(PluginBase):
         )
         query_endpoint = f"{base_url}/iocs/entities/indicators/v1"
         retraction_batch_count = 1
-        for retraction_batch in retracted_indicators_lists:
-            ioc_values = [ioc.value for ioc in retraction_batch]
-            page = 1
-            for batch in self.divide_in_chunks(
-                ioc_values, IOC_MANAGEMENT_PULL_PAGE_LIMIT
-            ):
-                chunk_size = len(batch)
-                query_params = {
-                    "limit": IOC_MANAGEMENT_PULL_PAGE_LIMIT,
-                    "filter": f"value: {batch}+modified_on:>='{date_filter}'",
+        ioc_cache = self._open_ioc_cache(base_url, client_id)
+        try:
+            for retraction_batch in retracted_indicators_lists:
+                ioc_values = [ioc.value for ioc in retraction_batch]
+                cache_values = {
+                    ioc.value: self._get_cache_value(ioc)
+                    for ioc in retraction_batch
                 }
-                self.crowdstrike_helper.api_helper(
-                    url=query_endpoint,
-                    method="DELETE",
-                    params=query_params,
-                    headers=headers,
-                    is_handle_error_required=True,
-                    logger_msg=(
-                        f"deleting indicator(s) for {chunk_size} IoC(s)"
-                        f" for page {page} from {IOC_MANAGEMENT}"
+                page = 1
+                for batch in self.divide_in_chunks(
+                    ioc_values, IOC_MANAGEMENT_PULL_PAGE_LIMIT
+                ):
+                    chunk_size = len(batch)
+                    query_params = {
+                        "limit": IOC_MANAGEMENT_PULL_PAGE_LIMIT,
+                        "filter": f"value: {batch}+modified_on:>='{date_filter}'",  # noqa
+                    }
+                    self.crowdstrike_helper.api_helper(
+                        url=query_endpoint,
+                        method="DELETE",
+                        params=query_params,
+                        headers=headers,
+                        is_handle_error_required=True,
+                        logger_msg=(
+                            f"deleting indicator(s) for {chunk_size} IoC(s)"
+                            f" for page {page} from {IOC_MANAGEMENT}"
+                        ),
+                        configuration=self.configuration,
+                        show_params=False,
+                    )
+                    if ioc_cache:
+                        self._remove_cached_ids(
+                            ioc_cache,
+                            [cache_values[value] for value in batch],
+                        )
+                    self.logger.info(
+                        f"{self.log_prefix}: Successfully retracted "
+                        f"{chunk_size} indicator(s) in page {page} from "
+                        f"{IOC_MANAGEMENT}."
+                    )
+                    page += 1
+
+                yield ValidationResult(
+                    success=True,
+                    message=(
+                        "Completed execution for batch "
+                        f"{retraction_batch_count} for retraction."
                     ),
-                    configuration=self.configuration,
-                    show_params=False,
                 )
-                self.logger.info(
-                    f"{self.log_prefix}: Successfully retracted {chunk_size}"
-                    f" indicator(s) in page {page} from {IOC_MANAGEMENT}."
-                )
-                page += 1
-
-            yield ValidationResult(
-                success=True,
-                message=(
-                    f"Completed execution for batch {retraction_batch_count}"
-                    " for retraction."
-                ),
-            )
-            retraction_batch_count += 1
+                retraction_batch_count += 1
+        finally:
+            if ioc_cache:
+                ioc_cache.close()
@@ -32,6 +32,9 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 CTE CrowdStrike plugin constants.
 """
 
+import os
+import tempfile
+
 from netskope.integrations.cte.models import IndicatorType, SeverityType
 
 BASE_URLS = [
@@ -44,7 +47,7 @@ PAGE_SIZE = 9999
 MODULE_NAME = "CTE"
 PLUGIN_NAME = "CrowdStrike"
 PLATFORM_NAME = "CrowdStrike"
-PLUGIN_VERSION = "2.2.0"
+PLUGIN_VERSION = "2.2.1"
 MAX_API_CALLS = 3
 DEFAULT_WAIT_TIME = 60
 DEFAULT_BATCH_SIZE = 200
@@ -60,6 +63,16 @@ DATE_FORMAT_FOR_IOCS = r"%Y-%m-%dT%H:%M:%SZ"
 ENDPOINT_DETECTION = "CrowdStrike Endpoint Detections"
 IOC_MANAGEMENT = "CrowdStrike Custom IOC Management"
 IOC_MANAGEMENT_PULL_PAGE_LIMIT = 2000
+# Values known to exist on IOC Management are cached on disk with their ids
+# and verified again once older than IOC_CACHE_TTL seconds. Each push
+# reconciles at most IOC_CACHE_RECONCILE_MAX_PAGES pages of the indicators
+# modified since the last one.
+IOC_CACHE_DIR = os.getenv(
+    "CROWDSTRIKE_IOC_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "crowdstrike_ioc_cache"),
+)
+IOC_CACHE_TTL = 7 * 24 * 60 * 60
+IOC_CACHE_RECONCILE_MAX_PAGES = 10
 DEFAULT_NETSKOPE_TAG = "netskope-ce"
 THREAT_TYPES = ["sha256", "md5", "domain", "ipv4", "ipv6"]
 THREAT_MAPPING = {
@@ -0,0 +1,161 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2021, Netskope OSS
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+CTE CrowdStrike plugin IOC Management existence cache.
+"""
+
+import calendar
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Bound on the parameters of a single statement, below the SQLite default.
+QUERY_BATCH_SIZE = 500
+RECONCILE_CHECKPOINT = "reconcile_checkpoint"
+EXPIRATION_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+class IOCCache:
+    """On-disk index of the IOC Management indicator values to their ids.
+
+    The index is filled from the verify, create and update responses of the
+    pushes and from the indicators modified on IOC Management since the last
+    reconcile. Entries verified more than ttl seconds ago or past the
+    expiration of their indicator are not returned, so indicators deleted
+    outside of the plugin or expired are verified again.
+    """
+
+    def __init__(self, path: str, ttl: int):
+        """Open a cache, creating it if it does not exist.
+
+        Args:
+            path (str): Path of the SQLite database.
+            ttl (int): Seconds after which an entry is verified again.
+        """
+        self.ttl = ttl
+        self._connection = sqlite3.connect(path, timeout=30)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS iocs (value TEXT PRIMARY KEY,"
+                " id TEXT NOT NULL, verified_at REAL NOT NULL,"
+                " expires_at REAL) WITHOUT ROWID"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL) WITHOUT ROWID"
+            )
+            self._connection.commit()
+        except Exception:
+            self._connection.close()
+            raise
+
+    def get_ids(self, values: List[str]) -> Dict[str, str]:
+        """Get the ids of the values verified within the TTL, not expired."""
+        now = time.time()
+        verified_after = now - self.ttl
+        ids = {}
+        for start in range(0, len(values), QUERY_BATCH_SIZE):
+            batch = values[start : start + QUERY_BATCH_SIZE]  # noqa
+            rows = self._connection.execute(
+                "SELECT value, id FROM iocs WHERE verified_at > ? AND"
+                " (expires_at IS NULL OR expires_at > ?) AND value"
+                f" IN ({','.join('?' * len(batch))})",
+                [verified_after, now, *batch],
+            )
+            ids.update(rows)
+        return ids
+
+    def put(self, iocs: Iterable[Tuple[str, str, Optional[str]]]):
+        """Add or refresh the ids of values known to exist.
+
+        Args:
+            iocs: Value, id and expiration of the indicators, the
+                expiration is None if the indicator does not expire.
+        """
+        verified_at = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO iocs VALUES (?, ?, ?, ?)",
+                (
+                    (value, ioc_id, verified_at, parse_expiration(expiration))
+                    for value, ioc_id, expiration in iocs
+                    if value and ioc_id
+                ),
+            )
+
+    def remove(self, values: Iterable[str]):
+        """Remove values which do not exist anymore or are in doubt."""
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM iocs WHERE value = ?",
+                ((value,) for value in values),
+            )
+
+    def get_checkpoint(self) -> str:
+        """Get the modified_on time the next reconcile starts from."""
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (RECONCILE_CHECKPOINT,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_checkpoint(self, checkpoint: str):
+        """Store the modified_on time the next reconcile starts from."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                (RECONCILE_CHECKPOINT, checkpoint),
+            )
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
+
+
+def parse_expiration(expiration: Optional[str]) -> Optional[float]:
+    """Get the epoch time of an IOC Management expiration, in UTC."""
+    if not expiration:
+        return None
+    try:
+        return calendar.timegm(
+            time.strptime(expiration[:19], EXPIRATION_FORMAT)
+        )
+    except ValueError:
+        return None
+
+
+def get_cache_path(cache_dir: str, base_url: str, client_id: str) -> str:
+    """Get the cache path of a tenant, shared by its configurations."""
+    os.makedirs(cache_dir, exist_ok=True)
+    key = hashlib.sha256(f"{base_url}|{client_id}".encode("utf-8"))
+    return os.path.join(cache_dir, f"{key.hexdigest()[:32]}.db")
@@ -46,6 +46,7 @@ from netskope.integrations.cls.plugin_base import PluginBase, ValidationResult
 from .utils.constant import (
     CE_LOG_SOURCE,
     CE_LOG_SOURCE_IDENTIFIER,
+    MAX_PAYLOAD_CHUNK_SIZE_IN_BYTES,
     MODULE_NAME,
     PLATFORM_NAME,
     PLUGIN_VERSION,
@@ -55,7 +56,7 @@ from .utils.exception import (
     MappingValidationError,
 )
 from .utils.helper import CrowdStrikeNGSIEMPluginHelper
-from .utils.utilities import get_crowdstrike_ngsiem_mappings, split_into_size
+from .utils.utilities import get_crowdstrike_ngsiem_mappings, pack_into_bodies
 from .utils.validator import CrowdStrikeNGSIEMValidator
 
 
@@ -348,20 +349,31 @@ class CrowdStrikeNGSIEMPlugin(PluginBase):
             if transformed_data:
                 start = time.time()
                 batch = 1
-                for chunk in split_into_size(transformed_data, log_fields):
-                    chunk_size = len(chunk)
-                    payload_str = "\n".join(chunk)
+                for payload, chunk_size in pack_into_bodies(
+                    transformed_data,
+                    MAX_PAYLOAD_CHUNK_SIZE_IN_BYTES,
+                    serialize=lambda event: json.dumps(
+                        {
+                            "event": event,
+                            "timestamp": event.get("timestamp"),
+                            "fields": log_fields,
+                        }
+                    ).encode("utf-8"),
+                    prefix=b"",
+                    separator=b"\n",
+                    suffix=b"",
+                ):
                     batch_start = time.time()
-                    size = round(len(payload_str) / 1000, 2)
+                    size = round(len(payload) / 1000, 2)
                     self.crowdstrike_ngsiem_helper.api_helper(
                         url=url,
                         method="POST",
                         headers=headers,
-                        data=payload_str,
+                        data=payload,
                         proxies=self.proxy,
                         verify=True,
                         logger_msg=(
-                            f"ingesting {len(chunk)} log(s) of "
+                            f"ingesting {chunk_size} log(s) of "
                             f'datatype "{data_type}" and subtype '
                             f'"{subtype}" in batch {batch} into '
                             f'{PLATFORM_NAME} having UUID "{uid}"'
@@ -34,7 +34,7 @@ CrowdStrike Next-Gen SIEM Constants.
 
 PLATFORM_NAME = "CrowdStrike Next-Gen SIEM"
 MODULE_NAME = "CLS"
-PLUGIN_VERSION = "1.0.0"
+PLUGIN_VERSION = "1.0.1"
 MAX_RETRY_COUNT = 4
 DEFAULT_WAIT_TIME = 60
 MAX_RETRY_AFTER_IN_MIN = 5
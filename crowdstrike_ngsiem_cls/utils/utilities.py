@@ -33,12 +33,11 @@ CrowdStrike Next-Gen SIEM Helper
 """
 
 import json
-import sys
 
 from jsonschema import validate
 from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
 
-from .constant import MAX_PAYLOAD_CHUNK_SIZE_IN_BYTES, PLATFORM_NAME
+from .constant import PLATFORM_NAME
 from .exception import MappingValidationError
 
 
@@ -257,43 +256,52 @@ def get_crowdstrike_ngsiem_mappings(mappings, data_type):
     )
 
 
-def split_into_size(total_payload, log_fields):
-    """
-    Split a list into parts, each approximately with a target
-    size in 1024 bytes.
+def serialize_json(record):
+    """Serialize a record to its JSON wire bytes."""
+    return json.dumps(record).encode("utf-8")
 
-    Parameters:
-    - total_payload: The list of data to be split.
 
-    Returns:
-    - A list of parts, each with a total size approximately equal
-      to the target size.
+def pack_into_bodies(
+    records,
+    max_bytes,
+    max_records=None,
+    serialize=serialize_json,
+    prefix=b"[",
+    separator=b",",
+    suffix=b"]",
+):
     """
-    result = []
-    current_part = []
-    current_size_bytes = 0
-
-    for chunk in total_payload:
-        updated_chunk = json.dumps(
-            {
-                "event": chunk,
-                "timestamp": chunk.get("timestamp"),
-                "fields": log_fields,
-            }
-        )
-        item_size_bytes = sys.getsizeof(updated_chunk)
-        if (
-            current_size_bytes + item_size_bytes
-            >= MAX_PAYLOAD_CHUNK_SIZE_IN_BYTES
-        ):
-            result.append(current_part)
-            current_part = []
-            current_size_bytes = 0
-
-        current_part.append(updated_chunk)
-        current_size_bytes += item_size_bytes
+    Serialize each record once and pack the records into request bodies.
 
-    if current_part:
-        result.append(current_part)
+    Records are packed greedily in order, each body is
+    prefix + separator.join(serialized records) + suffix and is bounded by
+    max_bytes and max_records. A record larger than max_bytes on its own is
+    yielded alone. Bodies are built lazily, one at a time.
 
-    return result
+    Parameters:
+    - records: The records to be packed.
+    - max_bytes: Maximum size of a body in bytes.
+    - max_records: Maximum number of records in a body, None for no limit.
+    - serialize: Callable returning the wire bytes of a record.
+    - prefix, separator, suffix: Bytes framing the serialized records.
+
+    Yields:
+    A tuple of the body bytes and the number of records in it.
+    """
+    framing = len(prefix) + len(suffix)
+    step = len(separator)
+    chunk, size = [], framing
+    for record in records:
+        record = serialize(record)
+        if chunk and (
+            size + step + len(record) > max_bytes
+            or len(chunk) == max_records
+        ):
+            yield prefix + separator.join(chunk) + suffix, len(chunk)
+            chunk, size = [], framing
+        if chunk:
+            size += step
+        size += len(record)
+        chunk.append(record)
+    if chunk:
+        yield prefix + separator.join(chunk) + suffix, len(chunk)
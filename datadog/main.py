@@ -34,7 +34,6 @@ Datadog Plugin.
 
 import gzip
 import json
-import sys
 import traceback
 from datetime import datetime
 from typing import List
@@ -48,9 +47,11 @@ from .utils.datadog_constants import (
     CE_TENANT_NAME,
     DATADOG_SITES,
     LOGS_TIME_FORMAT,
+    MAX_LOGS_PER_PAYLOAD,
     MODULE_NAME,
     PLATFORM_NAME,
     PLUGIN_VERSION,
+    TARGET_SIZE_BYTES,
 )
 from .utils.datadog_exceptions import (
     DatadogPluginException,
@@ -796,14 +797,6 @@ class DatadogPlugin(PluginBase):
         E.g. subtypes of alert is "dlp", "policy" etc.
         """
         try:
-            batch_size = sys.getsizeof(f"{transformed_data}") / (1024 * 1024)
-            if batch_size > 1:
-                transformed_data = self.datadog_helper.split_into_size(
-                    transformed_data
-                )
-            else:
-                transformed_data = [transformed_data]
-
             skipped_count = 0
             total_count = 0
             page = 0
@@ -813,18 +806,14 @@ class DatadogPlugin(PluginBase):
                 "ddsource": "netskope-ce",
                 "ddtags": self.configuration.get("dd_tags", ""),
             }
-            for chunk in transformed_data:
+            for json_data, count in self.datadog_helper.pack_into_bodies(
+                transformed_data, TARGET_SIZE_BYTES, MAX_LOGS_PER_PAYLOAD
+            ):
                 page += 1
                 try:
-                    json_data = json.dumps(chunk)
-
                     if data_type == "webtx":
                         headers["Content-Encoding"] = "gzip"
-
-                        # Convert to bytes
-                        encoded = json_data.encode("utf-8")
-                        # Compress
-                        json_data = gzip.compress(encoded)
+                        json_data = gzip.compress(json_data)
 
                     self.datadog_helper.api_helper(
                         logger_msg="ingesting data for page {}".format(page),
@@ -838,13 +827,13 @@ class DatadogPlugin(PluginBase):
                     log_msg = "[{}]:[{}] Successfully ingested {} {}(s) for page {} to {}.".format(
                         data_type,
                         subtype,
-                        len(chunk),
+                        count,
                         data_type,
                         page,
                         self.plugin_name,
                     )
                     self.logger.info(f"{self.log_prefix}: {log_msg}")
-                    total_count += len(chunk)
+                    total_count += count
                 except (DatadogPluginException, Exception) as err:
                     self.logger.error(
                         message=(
@@ -854,7 +843,7 @@ class DatadogPlugin(PluginBase):
                         ),
                         details=str(traceback.format_exc()),
                     )
-                    skipped_count += len(chunk)
+                    skipped_count += count
                     continue
             if skipped_count > 0:
                 self.logger.info(
@@ -35,7 +35,6 @@ CLS Datadog plugin helper module.
 import json
 import traceback
 import time
-import sys
 import requests
 from netskope.common.utils import add_user_agent
 
@@ -43,7 +42,6 @@ from .datadog_constants import (
     DEFAULT_WAIT_TIME,
     MAX_RETRIES,
     MODULE_NAME,
-    TARGET_SIZE_MB,
 )
 
 from .datadog_exceptions import (
@@ -325,33 +323,55 @@ class DatadogPluginHelper(object):
             )
             raise DatadogPluginException(err_msg)
 
-    def split_into_size(self, data_list):
-        """
-        Split a list into parts, each approximately with a target size in MB.
-
-        Parameters:
-        - data_list: The list of data to be split.
+    def serialize_json(self, record):
+        """Serialize a record to its JSON wire bytes."""
+        return json.dumps(record).encode("utf-8")
 
-        Returns:
-        A list of parts, each with a total size approximately equal to the target size.
+    def pack_into_bodies(
+        self,
+        records,
+        max_bytes,
+        max_records=None,
+        serialize=None,
+        prefix=b"[",
+        separator=b",",
+        suffix=b"]",
+    ):
         """
-        result = []
-        current_part = []
-        current_size_mb = 0
-
-        for item in data_list:
-            item_size_mb = sys.getsizeof(json.dumps(item)) / (
-                1024**2
-            )  # Convert bytes to MB
-            if current_size_mb + item_size_mb <= TARGET_SIZE_MB:
-                current_part.append(item)
-                current_size_mb += item_size_mb
-            else:
-                result.append(current_part)
-                current_part = [item]
-                current_size_mb = item_size_mb
+        Serialize each record once and pack the records into request bodies.
 
-        if current_part:
-            result.append(current_part)
+        Records are packed greedily in order, each body is
+        prefix + separator.join(serialized records) + suffix and is bounded by
+        max_bytes and max_records. A record larger than max_bytes on its own is
+        yielded alone. Bodies are built lazily, one at a time.
 
-        return result
+        Parameters:
+        - records: The records to be packed.
+        - max_bytes: Maximum size of a body in bytes.
+        - max_records: Maximum number of records in a body, None for no limit.
+        - serialize: Callable returning the wire bytes of a record,
+          defaults to serialize_json.
+        - prefix, separator, suffix: Bytes framing the serialized records.
+
+        Yields:
+        A tuple of the body bytes and the number of records in it.
+        """
+        if serialize is None:
+            serialize = self.serialize_json
+        framing = len(prefix) + len(suffix)
+        step = len(separator)
+        chunk, size = [], framing
+        for record in records:
+            record = serialize(record)
+            if chunk and (
+                size + step + len(record) > max_bytes
+                or len(chunk) == max_records
+            ):
+                yield prefix + separator.join(chunk) + suffix, len(chunk)
+                chunk, size = [], framing
+            if chunk:
+                size += step
+            size += len(record)
+            chunk.append(record)
+        if chunk:
+            yield prefix + separator.join(chunk) + suffix, len(chunk)
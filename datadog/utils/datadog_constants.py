@@ -33,7 +33,7 @@ Datadog Constants."""
 
 PLATFORM_NAME = "Datadog"
 MODULE_NAME = "CLS"
-PLUGIN_VERSION = "1.1.0"
+PLUGIN_VERSION = "1.1.1"
 MAX_RETRIES = 4
 DEFAULT_WAIT_TIME = 60
 RETRY_SLEEP_TIME = 50
@@ -41,6 +41,8 @@ MAX_PAGE_SIZE = 1000
 PAGE_LIMIT = 100
 DATE_FORMAT_FOR_IOCS = "%Y-%m-%dT%H:%M:%S.%f%z"
 TARGET_SIZE_MB = 5
+TARGET_SIZE_BYTES = TARGET_SIZE_MB * 1024 * 1024
+MAX_LOGS_PER_PAYLOAD = 1000
 DATADOG_SITES = [
     "datadoghq.com",
     "us3.datadoghq.com",
@@ -33,15 +33,14 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """GCP Storage Plugin."""
 
 
-import os
 from typing import List
-from tempfile import NamedTemporaryFile
 from netskope.integrations.cls.plugin_base import PluginBase, ValidationResult
 from .utils.gcp_validator import (
     GCPValidator,
 )
 from .utils.gcp_client import (
     GCPClient,
+    WebTxStream,
 )
 
 
@@ -58,18 +57,9 @@ class GCPStoragePlugin(PluginBase):
         try:
             gcp_client = GCPClient(self.configuration, self.logger)
 
-            temp_obj_file = NamedTemporaryFile("wb", delete=False)
-            for data in transformed_data:
-                temp_obj_file.write(data)
-            temp_obj_file.flush()
-
-            try:
-                gcp_client.push(temp_obj_file.name, data_type, subtype)
-            except Exception:
-                raise
-            finally:
-                temp_obj_file.close()
-                os.unlink(temp_obj_file.name)
+            gcp_client.push(
+                WebTxStream(transformed_data), data_type, subtype
+            )
         except Exception as e:
             self.logger.error(f"Error while pushing to GCP Storage: {e}")
             raise
@@ -33,12 +33,83 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """GCP client class."""
 
 
+import io
 import time
 import json
 import uuid
+from bisect import bisect_right
+from itertools import accumulate
 from google.cloud import storage
 
 
+class WebTxStream(io.RawIOBase):
+    """Read only file object over the gzip members of a WebTx batch.
+
+    Reads are served straight from the members, so the batch is uploaded
+    without being copied into a temporary file or a single buffer first.
+    """
+
+    def __init__(self, members):
+        """Init method.
+
+        Args:
+            members (List[bytes]): Gzip members, empty members are skipped.
+        """
+        super().__init__()
+        self._members = [memoryview(member) for member in members if member]
+        self._offsets = list(
+            accumulate((len(member) for member in self._members), initial=0)
+        )
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of the members in bytes."""
+        return self._offsets[-1]
+
+    @property
+    def count(self) -> int:
+        """Number of non empty members."""
+        return len(self._members)
+
+    def readable(self) -> bool:
+        """Stream is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Stream is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a new position."""
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        """Fill the buffer from the members starting at the current position."""
+        buffer = memoryview(buffer).cast("B")
+        written = 0
+        index = bisect_right(self._offsets, self._position) - 1
+        while written < len(buffer) and index < len(self._members):
+            start = self._position - self._offsets[index]
+            chunk = self._members[index][start:start + len(buffer) - written]
+            buffer[written:written + len(chunk)] = chunk
+            written += len(chunk)
+            self._position += len(chunk)
+            index += 1
+        return written
+
+
 class GCPClient:
     """GCP Client Class."""
 
@@ -72,8 +143,12 @@ class GCPClient:
             self.logger.error(f"Error occurred while getting bucket: {e}")
             raise
 
-    def push(self, file_name, data_type, subtype):
-        """Push method."""
+    def push(self, file_obj, data_type, subtype):
+        """Push method.
+
+        Args:
+            file_obj (WebTxStream): Readable file object to upload.
+        """
         cur_time = int(time.time())
         if data_type is None:
             object_name = f'{self.configuration["obj_prefix"]}_webtx_{cur_time}_{str(uuid.uuid1())}'
@@ -82,7 +157,7 @@ class GCPClient:
         try:
             bucket = self.get_bucket()
             blob_object = bucket.blob(object_name)
-            blob_object.upload_from_filename(filename=file_name)
+            blob_object.upload_from_file(file_obj, size=file_obj.size)
             self.logger.info(
                 f"Successfully Uploaded to GCP Storage as blob file. {object_name}"
             )
@@ -87,6 +87,14 @@ from .utils.kafka_exceptions import (
     MappingValidationError,
 )
 from .utils.kafka_helper import get_kafka_mappings
+from .utils.kafka_producer_pool import (
+    PooledProducer,
+    acquire_producer,
+    discard_producer,
+    get_producer_key,
+    release_producer,
+    wait_for_delivery,
+)
 from .utils.kafka_validator import KafkaValidator
 
 
@@ -650,15 +658,16 @@ class KafkaPlugin(PluginBase):
             PushResult: Push result object with message and status.
         """
         kafka_topic_name = self.configuration.get("kafka_topic", "").strip()
-        successful_log_push_counter, skipped_logs = 0, 0
+        key_field = self.configuration.get("kafka_message_key", "").strip()
+        skipped_logs = 0
+        producer_key = self._get_producer_key(self.configuration)
         try:
-            (
-                producer,
-                kafka_ca_file,
-                kafka_cert_file,
-                kafka_key_file,
-            ) = self._get_producer(self.configuration)
-
+            pooled = acquire_producer(
+                producer_key,
+                lambda: self._create_pooled_producer(self.configuration),
+                timeout=TIMEOUT,
+            )
+            producer = pooled.producer
         except KafkaException as exp:
             err_msg = (
                 "Error occurred while creating producer "
@@ -680,17 +689,21 @@ class KafkaPlugin(PluginBase):
             )
             raise
 
-        # Log the transformed data to given kafka server
+        # Log the transformed data to given kafka server, the records are
+        # sent asynchronously and their futures are awaited at the end.
+        futures = []
         for data in transformed_data:
             try:
                 if data:
-                    producer.send(
-                        topic=kafka_topic_name,
-                        value=data
-                        if not isinstance(data, dict)
-                        else json.dumps(data),
+                    futures.append(
+                        producer.send(
+                            topic=kafka_topic_name,
+                            value=data
+                            if not isinstance(data, dict)
+                            else json.dumps(data),
+                            key=self._get_message_key(data, key_field),
+                        )
                     )
-                    successful_log_push_counter += 1
                 else:
                     skipped_logs += 1
             except MessageSizeTooLargeError as error:
@@ -722,30 +735,12 @@ class KafkaPlugin(PluginBase):
                     details=traceback.format_exc(),
                 )
         try:
-            producer.flush(timeout=TIMEOUT)
-            if skipped_logs > 0:
-                self.logger.debug(
-                    "{}: Received empty transformed data for {} log(s) hence "
-                    "ingestion of those log(s) will be skipped.".format(
-                        self.log_prefix,
-                        skipped_logs,
-                    )
-                )
-            log_msg = (
-                "[{}] [{}] Successfully ingested {} log(s)"
-                ' to "{}" topic.'.format(
-                    data_type,
-                    subtype,
-                    successful_log_push_counter,
-                    kafka_topic_name,
-                )
-            )
-            self.logger.info(f"{self.log_prefix}: {log_msg}")
-            return PushResult(
-                success=True,
-                message=log_msg,
+            successful_log_push_counter, errors = wait_for_delivery(
+                futures, TIMEOUT
             )
         except Exception as exp:
+            # The producer may be unhealthy, do not reuse it.
+            discard_producer(producer_key, pooled, timeout=TIMEOUT)
             self.logger.error(
                 message=(
                     "{}: Error occurred while transferring "
@@ -756,16 +751,86 @@ class KafkaPlugin(PluginBase):
                 details=traceback.format_exc(),
             )
             raise KafkaException(exp)
-        finally:
-            producer.close(timeout=TIMEOUT)
-            if (
-                kafka_ca_file is not None
-                and kafka_cert_file is not None
-                and kafka_key_file is not None
-            ):
-                os.remove(kafka_ca_file)
-                os.remove(kafka_cert_file)
-                os.remove(kafka_key_file)
+        release_producer(pooled)
+        if errors:
+            self.logger.error(
+                message=(
+                    "{}: {} log(s) could not be delivered to Kafka {} "
+                    "Topic and will be skipped. Error: {}".format(
+                        self.log_prefix,
+                        len(errors),
+                        kafka_topic_name,
+                        errors[0],
+                    )
+                ),
+            )
+        if skipped_logs > 0:
+            self.logger.debug(
+                "{}: Received empty transformed data for {} log(s) hence "
+                "ingestion of those log(s) will be skipped.".format(
+                    self.log_prefix,
+                    skipped_logs,
+                )
+            )
+        log_msg = (
+            "[{}] [{}] Successfully ingested {} log(s)"
+            ' to "{}" topic.'.format(
+                data_type,
+                subtype,
+                successful_log_push_counter,
+                kafka_topic_name,
+            )
+        )
+        self.logger.info(f"{self.log_prefix}: {log_msg}")
+        return PushResult(
+            success=True,
+            message=log_msg,
+        )
+
+    def _create_pooled_producer(self, configuration: dict) -> PooledProducer:
+        """Create a producer to be shared by the pushes of a configuration.
+
+        The certificate files are kept until the producer is closed.
+
+        Args:
+            configuration (dict): Configuration parameters.
+        """
+        producer, *files = self._get_producer(configuration)
+        return PooledProducer(producer, files)
+
+    def _get_producer_key(self, configuration: dict) -> str:
+        """Get the key of the pooled producer for a configuration.
+
+        Args:
+            configuration (dict): Configuration parameters.
+        """
+        return get_producer_key(
+            configuration.get("security_protocol"),
+            configuration.get("kafka_broker", "").strip(),
+            configuration.get("kafka_port"),
+            configuration.get("kafka_ca_certificate"),
+            configuration.get("kafka_client_certificate"),
+            configuration.get("kafka_client_private_key"),
+            configuration.get("kafka_ssl_password", ""),
+            configuration.get("kafka_topic", "").strip(),
+        )
+
+    def _get_message_key(self, data, key_field: str):
+        """Get the message key of a record.
+
+        Records with the same key are sent to the same partition. Only JSON
+        formatted records have fields to read the key from.
+
+        Args:
+            data (dict|str): Record to be sent.
+            key_field (str): Field whose value is used as the key.
+        """
+        if not key_field or not isinstance(data, dict):
+            return None
+        value = data.get(key_field)
+        if value is None:
+            return None
+        return str(value).encode("utf-8")
 
     def _create_tmp_file(
         self,
@@ -835,6 +900,7 @@ class KafkaPlugin(PluginBase):
                     request_timeout_ms=TIMEOUT_MS,
                 )
                 available_topics = consumer.topics()
+                consumer.close()
                 topic_exists = kafka_topic in available_topics
 
                 if not topic_exists:
@@ -878,6 +944,7 @@ class KafkaPlugin(PluginBase):
                 available_topics = (
                     consumer.topics()
                 )  # Returns the list of topics present on Kafka cluster
+                consumer.close()
                 topic_exists = (
                     kafka_topic in available_topics
                 )  # Check whether the topic is present on
@@ -1267,6 +1334,22 @@ class KafkaPlugin(PluginBase):
                 success=False,
                 message=err_msg,
             )
+
+        kafka_message_key = configuration.get("kafka_message_key", "")
+        if not isinstance(kafka_message_key, str):
+            err_msg = (
+                "Invalid Message Key Field found in "
+                "configuration parameters."
+            )
+            self.logger.error(
+                "{}: Validation error occurred. Error: {}".format(
+                    self.log_prefix, err_msg
+                )
+            )
+            return ValidationResult(
+                success=False,
+                message=err_msg,
+            )
         # Validate Server connection.
         kafka_ca_file, kafka_cert_file, kafka_key_file = None, None, None
         try:
@@ -36,7 +36,7 @@ KAFKA_FORMATS = ["CEF"]
 KAFKA_SECURITY_PROTOCOLS = ["PLAINTEXT", "SSL"]
 
 MODULE_NAME = "CLS"
-PLUGIN_VERSION = "1.0.1"
+PLUGIN_VERSION = "1.1.0"
 BATCH_SIZE = 1000000
 TIMEOUT = 300
 LINGER_MS = 50
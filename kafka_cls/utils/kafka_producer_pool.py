@@ -0,0 +1,163 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2021, Netskope OSS
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+Kafka Plugin Producer Pool Module.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Producers not used for this many seconds are closed.
+PRODUCER_IDLE_TIMEOUT = 600
+
+_producers = {}
+_producers_lock = threading.Lock()
+
+
+class PooledProducer:
+    """Producer shared by all the pushes of the same configuration."""
+
+    def __init__(self, producer, files=None):
+        """Init method.
+
+        Args:
+            producer (KafkaProducer): Producer.
+            files (list): Files to be removed when the producer is closed.
+        """
+        self.producer = producer
+        self.files = [file for file in files or [] if file]
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+    def close(self, timeout=None):
+        """Close the producer and remove its files."""
+        try:
+            self.producer.close(timeout=timeout)
+        finally:
+            for file in self.files:
+                try:
+                    os.remove(file)
+                except OSError:
+                    pass
+
+
+def get_producer_key(*params) -> str:
+    """Get the pool key of a producer from its configuration parameters."""
+    return hashlib.sha256(
+        json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def acquire_producer(key, factory, timeout=None) -> PooledProducer:
+    """Get the pooled producer of a key, creating it with factory if needed.
+
+    Producers that have been idle for PRODUCER_IDLE_TIMEOUT seconds are
+    closed. Every acquired producer must be released with release_producer.
+    """
+    now = time.monotonic()
+    with _producers_lock:
+        idle = [
+            pool_key
+            for pool_key, pooled in _producers.items()
+            if not pooled.in_use
+            and now - pooled.last_used > PRODUCER_IDLE_TIMEOUT
+        ]
+        evicted = [_producers.pop(pool_key) for pool_key in idle]
+        pooled = _producers.get(key)
+        if pooled is not None:
+            pooled.in_use += 1
+    for producer in evicted:
+        producer.close(timeout=timeout)
+    if pooled is not None:
+        return pooled
+
+    # Create the producer outside the lock, bootstrapping can be slow.
+    created = factory()
+    with _producers_lock:
+        pooled = _producers.setdefault(key, created)
+        pooled.in_use += 1
+    if pooled is not created:
+        created.close(timeout=timeout)
+    return pooled
+
+
+def release_producer(pooled: PooledProducer):
+    """Release a producer acquired with acquire_producer."""
+    with _producers_lock:
+        pooled.in_use -= 1
+        pooled.last_used = time.monotonic()
+
+
+def discard_producer(key, pooled: PooledProducer, timeout=None):
+    """Remove a failed producer from the pool and close it.
+
+    The producer is closed once it is no longer in use by other pushes.
+    """
+    with _producers_lock:
+        if _producers.get(key) is pooled:
+            del _producers[key]
+        pooled.in_use -= 1
+        should_close = not pooled.in_use
+    if should_close:
+        pooled.close(timeout=timeout)
+
+
+def wait_for_delivery(futures, timeout):
+    """Wait for the futures returned by the producer send calls.
+
+    Args:
+        futures (list): Futures returned by KafkaProducer.send.
+        timeout (int): Maximum number of seconds to wait for all of them.
+
+    Raises:
+        TimeoutError: If the futures are not done within timeout.
+
+    Returns:
+        tuple: Number of delivered records and the errors of the failed ones.
+    """
+    deadline = time.monotonic() + timeout
+    delivered, errors = 0, []
+    for future in futures:
+        try:
+            future.get(timeout=max(deadline - time.monotonic(), 0))
+            delivered += 1
+        except Exception as error:
+            if not future.is_done:
+                raise TimeoutError(
+                    f"{len(futures) - delivered - len(errors)} log(s) were "
+                    f"not delivered within {timeout} seconds."
+                )
+            errors.append(error)
+    return delivered, errors
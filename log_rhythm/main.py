@@ -33,10 +33,6 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """LogRhythm Plugin."""
 
 
-import logging
-import logging.handlers
-import threading
-import socket
 import json
 import os
 import traceback
@@ -66,8 +62,11 @@ from .utils.log_rhythm_exceptions import (
 from .utils.log_rhythm_cef_generator import (
     CEFGenerator,
 )
-from .utils.log_rhythm_ssl import (
-    SSLSyslogHandler,
+from .utils.log_rhythm_transport import (
+    NEWLINE_FRAMING,
+    SYSLOG_FRAMINGS,
+    SyslogTransportError,
+    get_transport,
 )
 
 PLATFORM_NAME = "LogRhythm"
@@ -554,61 +553,24 @@ class LogRhythmPlugin(PluginBase):
             return transformed_data
 
     def init_handler(self, configuration):
-        """Initialize unique LogRhythm handler per thread
-        based on configured protocol."""
-        syslogger = logging.getLogger(
-            "SYSLOG_LOGGER_{}".format(threading.get_ident())
-        )
-        syslogger.setLevel(logging.INFO)
-        syslogger.handlers = []
-        syslogger.propagate = False
-
-        if configuration["log_rhythm_protocol"] == "TLS":
-            tls_handler = SSLSyslogHandler(
-                configuration.get("transformData", True),
-                configuration["log_rhythm_protocol"],
-                address=(
-                    configuration["log_rhythm_server"],
-                    configuration["log_rhythm_port"],
-                ),
-                certs=configuration["log_rhythm_certificate"],
-            )
-            syslogger.addHandler(tls_handler)
-        else:
-            socktype = socket.SOCK_DGRAM  # Set protocol to UDP by default
-            if configuration["log_rhythm_protocol"] == "TCP":
-                socktype = socket.SOCK_STREAM
-
-            # Create a log_rhythm handler with given configuration parameters
-            handler = SSLSyslogHandler(
-                configuration.get("transformData", True),
-                configuration["log_rhythm_protocol"],
-                address=(
-                    configuration["log_rhythm_server"],
-                    configuration["log_rhythm_port"],
-                ),
-                socktype=socktype,
-            )
-
-            if configuration["log_rhythm_protocol"] == "TCP":
-                # This will add a line break to the message before
-                # it is 'emitted' which ensures that the messages are
-                # split up over multiple lines,
-                # see https://bugs.python.org/issue28404
-                handler.setFormatter(logging.Formatter("%(message)s\n"))
-                # In order for the above to work, then we need to ensure
-                # that the null terminator is not included
-                handler.append_nul = False
-
-            syslogger.addHandler(handler)
+        """Get the pooled transport for the configured server.
 
-        return syslogger
+        Connections are reused across pushes, an idle connection is acquired
+        here so that connectivity errors surface before ingestion starts.
+        """
+        transport = get_transport(
+            configuration["log_rhythm_protocol"],
+            configuration["log_rhythm_server"],
+            configuration["log_rhythm_port"],
+            certs=configuration.get("log_rhythm_certificate"),
+        )
+        transport.release(transport.acquire())
+        return transport
 
     def push(self, transformed_data, data_type, subtype) -> PushResult:
         """Push the transformed_data to the 3rd party platform."""
-        successful_log_push_counter, skipped_logs = 0, 0
         try:
-            syslogger = self.init_handler(self.configuration)
+            transport = self.init_handler(self.configuration)
         except Exception as err:
             self.logger.error(
                 "{}: Error occurred during initializing connection. "
@@ -617,63 +579,58 @@ class LogRhythmPlugin(PluginBase):
             raise
 
         # Log the transformed data to given log_rhythm server
-        for data in transformed_data:
-            try:
-                if data:
-                    syslogger.info(
-                        json.dumps(data) if isinstance(data, dict) else data
-                    )
-                    successful_log_push_counter += 1
-                    syslogger.handlers[0].flush()
-                else:
-                    skipped_logs += 1
-            except Exception as err:
-                self.logger.error(
-                    "{}: Error occurred during data ingestion. "
-                    "Error: {}. Record will be skipped.".format(
-                        self.log_prefix, err
-                    )
-                )
-
-        # Clean up
+        records = [
+            json.dumps(data) if isinstance(data, dict) else data
+            for data in transformed_data
+            if data
+        ]
+        skipped_logs = len(transformed_data) - len(records)
         try:
-            syslogger.handlers[0].close()
-            del syslogger.handlers[:]
-            del syslogger
-            if skipped_logs > 0:
-                self.logger.debug(
-                    "{}: Received empty transformed data for {} log(s) hence "
-                    "ingestion of those log(s) will be skipped.".format(
-                        self.log_prefix,
-                        skipped_logs,
-                    )
-                )
-            log_msg = (
-                "[{}] [{}] Successfully ingested {} log(s)"
-                " to {} server.".format(
-                    data_type,
-                    subtype,
-                    successful_log_push_counter,
-                    self.plugin_name,
+            successful_log_push_counter = transport.send(
+                records,
+                framing=self.configuration.get("log_rhythm_framing")
+                or NEWLINE_FRAMING,
+                add_priority=self.configuration.get("transformData", True),
+            )
+        except SyslogTransportError as err:
+            successful_log_push_counter = err.sent
+            self.logger.error(
+                "{}: Error occurred during data ingestion. Error: {}. "
+                "{} record(s) will be skipped.".format(
+                    self.log_prefix,
+                    err,
+                    len(records) - successful_log_push_counter,
                 )
             )
-            self.logger.info(f"{self.log_prefix}: {log_msg}")
-            return PushResult(
-                success=True,
-                message=log_msg,
-            )
-        except Exception as err:
-            self.logger.error(
-                "{}: Error occurred during Clean up. Error: {}".format(
-                    self.log_prefix, err
+
+        if skipped_logs > 0:
+            self.logger.debug(
+                "{}: Received empty transformed data for {} log(s) hence "
+                "ingestion of those log(s) will be skipped.".format(
+                    self.log_prefix,
+                    skipped_logs,
                 )
             )
+        log_msg = (
+            "[{}] [{}] Successfully ingested {} log(s)"
+            " to {} server.".format(
+                data_type,
+                subtype,
+                successful_log_push_counter,
+                self.plugin_name,
+            )
+        )
+        self.logger.info(f"{self.log_prefix}: {log_msg}")
+        return PushResult(
+            success=True,
+            message=log_msg,
+        )
 
     def test_server_connectivity(self, configuration):
         """Tests whether the configured log_rhythm
         server is reachable or not."""
         try:
-            syslogger = self.init_handler(configuration)
+            self.init_handler(configuration)
         except Exception as err:
             self.logger.error(
                 f"{self.log_prefix}: Error occurred while establishing "
@@ -681,12 +638,6 @@ class LogRhythmPlugin(PluginBase):
                 "you have provided correct log_rhythm server and port."
             )
             raise err
-        else:
-            # Clean up for further use
-            syslogger.handlers[0].flush()
-            syslogger.handlers[0].close()
-            del syslogger.handlers[:]
-            del syslogger
 
     def validate(self, configuration: dict) -> ValidationResult:
         """Validate the configuration parameters dict."""
@@ -788,6 +739,18 @@ class LogRhythmPlugin(PluginBase):
             return ValidationResult(
                 success=False, message="Invalid LogRhythm Port provided."
             )
+        if (
+            configuration.get("log_rhythm_framing") or NEWLINE_FRAMING
+        ) not in SYSLOG_FRAMINGS:
+            self.logger.error(
+                "{}: Validation error occurred. Error: Invalid LogRhythm "
+                "Framing found in the configuration parameters.".format(
+                    self.log_prefix
+                )
+            )
+            return ValidationResult(
+                success=False, message="Invalid LogRhythm Framing provided."
+            )
         mappings = self.mappings.get("jsonData", None)
         mappings = json.loads(mappings)
         if type(
@@ -92,6 +92,14 @@ from .utils.event_hub_helper import (
     get_azure_event_hubs_mappings,
     get_config_params,
 )
+from .utils.event_hub_producer_pool import (
+    PooledProducer,
+    acquire_producer,
+    discard_producer,
+    get_producer_key,
+    release_producer,
+    wait_for_delivery,
+)
 from .utils.event_hub_validator import MicrosoftAzureEventHubsValidator
 
 
@@ -708,9 +716,16 @@ class MicrosoftAzureEventHubsPlugin(PluginBase):
         )
 
         event_hub_name = self.configuration.get("event_hub_name", "").strip()
-        successful_log_push_counter, skipped_logs = 0, 0
+        key_field = self.configuration.get("message_key_field", "").strip()
+        skipped_logs = 0
+        producer_key = self._get_producer_key(self.configuration)
         try:
-            producer = self._get_producer(self.configuration)
+            pooled = acquire_producer(
+                producer_key,
+                lambda: PooledProducer(self._get_producer(self.configuration)),
+                timeout=TIMEOUT,
+            )
+            producer = pooled.producer
 
         except MicrosoftAzureEventHubsPluginError as exp:
             err_msg = (
@@ -740,88 +755,80 @@ class MicrosoftAzureEventHubsPlugin(PluginBase):
             )
             raise MicrosoftAzureEventHubsPluginError(err_msg)
 
-        # Log the transformed data to given Microsoft Azure Event Hubs server
-        for data in transformed_data:
-            try:
+        # Log the transformed data to given Microsoft Azure Event Hubs server,
+        # the records are sent asynchronously and their futures are awaited
+        # at the end.
+        futures = []
+        try:
+            for data in transformed_data:
                 if data:
-                    producer.send(
-                        topic=event_hub_name,
-                        value=(
-                            data
-                            if not isinstance(data, dict)
-                            else json.dumps(data)
-                        ),
+                    futures.append(
+                        producer.send(
+                            topic=event_hub_name,
+                            value=(
+                                data
+                                if not isinstance(data, dict)
+                                else json.dumps(data)
+                            ),
+                            key=self._get_message_key(data, key_field),
+                        )
                     )
-                    successful_log_push_counter += 1
                 else:
                     skipped_logs += 1
-            except MessageSizeTooLargeError as error:
-                err_msg = (
-                    "Message too large error occurred while sending "
-                    "logs to Microsoft Azure Event Hubs."
-                )
-                self.logger.error(
-                    message=(
-                        f"{self.log_prefix}: {data_type_sub_type}"
-                        f"{err_msg} Error: {error}"
-                    ),
-                    details=traceback.format_exc(),
-                )
-                raise MicrosoftAzureEventHubsPluginError(err_msg)
-            except KafkaTimeoutError as error:
-                err_msg = (
-                    "Maximum timeout exceeded while sending logs"
-                    " to {}.".format(PLATFORM_NAME)
-                )
-                self.logger.error(
-                    message=(
-                        f"{self.log_prefix}: {data_type_sub_type}"
-                        f"{err_msg} Error: {error}"
-                    ),
-                    details=traceback.format_exc(),
-                )
-                raise MicrosoftAzureEventHubsPluginError(err_msg)
-            except Exception as e:
-                err_msg = (
-                    "Error occurred while sending data to {}"
-                    " {} event hub. Record will be skipped.".format(
-                        PLATFORM_NAME, event_hub_name
-                    )
-                )
-                self.logger.error(
-                    message=(
-                        f"{self.log_prefix}: {data_type_sub_type}"
-                        f"{err_msg} Error: {e}"
-                    ),
-                    details=traceback.format_exc(),
+        except MessageSizeTooLargeError as error:
+            release_producer(pooled)
+            err_msg = (
+                "Message too large error occurred while sending "
+                "logs to Microsoft Azure Event Hubs."
+            )
+            self.logger.error(
+                message=(
+                    f"{self.log_prefix}: {data_type_sub_type}"
+                    f"{err_msg} Error: {error}"
+                ),
+                details=traceback.format_exc(),
+            )
+            raise MicrosoftAzureEventHubsPluginError(err_msg)
+        except KafkaTimeoutError as error:
+            discard_producer(producer_key, pooled, timeout=TIMEOUT)
+            err_msg = (
+                "Maximum timeout exceeded while sending logs"
+                " to {}.".format(PLATFORM_NAME)
+            )
+            self.logger.error(
+                message=(
+                    f"{self.log_prefix}: {data_type_sub_type}"
+                    f"{err_msg} Error: {error}"
+                ),
+                details=traceback.format_exc(),
+            )
+            raise MicrosoftAzureEventHubsPluginError(err_msg)
+        except Exception as e:
+            discard_producer(producer_key, pooled, timeout=TIMEOUT)
+            err_msg = (
+                "Error occurred while sending data to {}"
+                " {} event hub. Record will be skipped.".format(
+                    PLATFORM_NAME, event_hub_name
                 )
-                raise MicrosoftAzureEventHubsPluginError(err_msg)
+            )
+            self.logger.error(
+                message=(
+                    f"{self.log_prefix}: {data_type_sub_type}"
+                    f"{err_msg} Error: {e}"
+                ),
+                details=traceback.format_exc(),
+            )
+            raise MicrosoftAzureEventHubsPluginError(err_msg)
 
         try:
-            producer.flush(timeout=TIMEOUT)
-            if skipped_logs > 0:
-                self.logger.debug(
-                    "{}: {}Received empty transformed data for {} log(s)"
-                    " hence ingestion of those log(s) will be skipped.".format(
-                        self.log_prefix,
-                        data_type_sub_type,
-                        skipped_logs,
-                    )
-                )
-            log_msg = (
-                "{}Successfully ingested {} log(s)"
-                ' to "{}" event hub.'.format(
-                    data_type_sub_type,
-                    successful_log_push_counter,
-                    event_hub_name,
-                )
-            )
-            self.logger.info(f"{self.log_prefix}: {log_msg}")
-            return PushResult(
-                success=True,
-                message=log_msg,
+            successful_log_push_counter, errors = wait_for_delivery(
+                futures, TIMEOUT
             )
+            if errors:
+                raise errors[0]
         except Exception as exp:
+            # The producer may be unhealthy, do not reuse it.
+            discard_producer(producer_key, pooled, timeout=TIMEOUT)
             err_msg = (
                 "Error occurred while transferring "
                 f"logs to {PLATFORM_NAME}."
@@ -834,8 +841,59 @@ class MicrosoftAzureEventHubsPlugin(PluginBase):
                 details=traceback.format_exc(),
             )
             raise MicrosoftAzureEventHubsPluginError(err_msg)
-        finally:
-            producer.close(timeout=TIMEOUT)
+        release_producer(pooled)
+        if skipped_logs > 0:
+            self.logger.debug(
+                "{}: {}Received empty transformed data for {} log(s)"
+                " hence ingestion of those log(s) will be skipped.".format(
+                    self.log_prefix,
+                    data_type_sub_type,
+                    skipped_logs,
+                )
+            )
+        log_msg = (
+            "{}Successfully ingested {} log(s)"
+            ' to "{}" event hub.'.format(
+                data_type_sub_type,
+                successful_log_push_counter,
+                event_hub_name,
+            )
+        )
+        self.logger.info(f"{self.log_prefix}: {log_msg}")
+        return PushResult(
+            success=True,
+            message=log_msg,
+        )
+
+    def _get_producer_key(self, configuration: dict) -> str:
+        """Get the key of the pooled producer for a configuration.
+
+        Args:
+            configuration (dict): Configuration parameters.
+        """
+        bootstrap_server, connection_string, event_hub_name, _ = (
+            get_config_params(configuration)
+        )
+        return get_producer_key(
+            bootstrap_server, connection_string, event_hub_name
+        )
+
+    def _get_message_key(self, data, key_field: str):
+        """Get the message key of a record.
+
+        Records with the same key are sent to the same partition. Only JSON
+        formatted records have fields to read the key from.
+
+        Args:
+            data (dict|str): Record to be sent.
+            key_field (str): Field whose value is used as the key.
+        """
+        if not key_field or not isinstance(data, dict):
+            return None
+        value = data.get(key_field)
+        if value is None:
+            return None
+        return str(value).encode("utf-8")
 
     def _get_custom_logger(self, err_msg, is_validation=False, exception=None):
         """
@@ -893,6 +951,7 @@ class MicrosoftAzureEventHubsPlugin(PluginBase):
                 client_id=self._add_user_agent(),
             )
             available_event_hubs = consumer.topics()
+            consumer.close()
             event_hub_exists = event_hub_name in available_event_hubs
 
             if not event_hub_exists:
@@ -1140,6 +1199,15 @@ class MicrosoftAzureEventHubsPlugin(PluginBase):
                 message=err_msg,
             )
 
+        message_key_field = configuration.get("message_key_field", "")
+        if not isinstance(message_key_field, str):
+            err_msg = (
+                "Invalid Message Key Field found in"
+                " configuration parameters."
+            )
+            self.logger.error(f"{validation_err_msg} {err_msg}")
+            return ValidationResult(success=False, message=err_msg)
+
         mappings = self.mappings.get("jsonData", None)
         mappings = json.loads(mappings)
         if not (
@@ -38,7 +38,7 @@ EVENT_HUBS_SECURITY_PROTOCOL = "SASL_SSL"
 SASL_PLAIN_USERNAME = "$ConnectionString"
 SASL_MECHANISM = "PLAIN"
 MODULE_NAME = "CLS"
-PLUGIN_VERSION = "1.0.1"
+PLUGIN_VERSION = "1.1.0"
 BATCH_SIZE = 1048576
 TIMEOUT = 300
 LINGER_MS = 50
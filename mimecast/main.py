@@ -32,6 +32,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 Mimecast Plugin implementation to push and pull the data from Mimecast."""
 
 import csv
+import time
 import traceback
 from dateutil import parser
 from typing import Dict, Generator, List, Union
@@ -84,6 +85,7 @@ from .utils.mimecast_helper import (
     MimecastPluginException,
     QuotaNotAvailableException
 )
+from .utils.retraction import pull_snapshot
 
 
 class MimecastPlugin(PluginBase):
@@ -1739,69 +1741,106 @@ class MimecastPlugin(PluginBase):
         retraction_interval = int(retraction_interval)
         start_time = datetime.now() - timedelta(days=retraction_interval)
         feed_types = self.configuration.get("feed_type", [])
+        # The feeds are pulled once per cycle, on the first chunk that needs
+        # them, and every chunk is checked against the same snapshots.
+        snapshots = {}
+        try:
+            for source_ioc_list in source_indicators:
+                try:
+                    hash_iocs = set()
+                    url_iocs = set()
+                    for ioc in source_ioc_list:
+                        if ioc.type in [IndicatorType.URL]:
+                            url_iocs.add(ioc.value)
+                        if ioc.type in [
+                            IndicatorType.MD5, IndicatorType.SHA256
+                        ]:
+                            hash_iocs.add(ioc.value)
+                    for pull_location in ["Malware Customer", "Malware Grid"]:
+                        if not (
+                            hash_iocs
+                            and MALWARE_TYPE.get(pull_location) in feed_types
+                        ):
+                            continue
+                        hash_iocs = self._get_retracted_iocs(
+                            snapshots=snapshots,
+                            pull_location=pull_location,
+                            iocs=hash_iocs,
+                            pull=lambda location=pull_location: (
+                                self.pull_hashes(
+                                    start_time=start_time,
+                                    pull_location=location,
+                                    storage={},
+                                    is_retraction=True,
+                                )
+                            ),
+                        )
+                    if url_iocs and "malsite" in feed_types:
+                        url_iocs = self._get_retracted_iocs(
+                            snapshots=snapshots,
+                            pull_location="Malsite",
+                            iocs=url_iocs,
+                            pull=lambda: self.get_rewritten_urls(
+                                start_time=start_time,
+                                storage={},
+                                is_retraction=True,
+                            ),
+                        )
 
-        for source_ioc_list in source_indicators:
-            try:
-                hash_iocs = set()
-                url_iocs = set()
-                for ioc in source_ioc_list:
-                    if ioc.type in [IndicatorType.URL]:
-                        url_iocs.add(ioc.value)
-                    if ioc.type in [IndicatorType.MD5, IndicatorType.SHA256]:
-                        hash_iocs.add(ioc.value)
-                if (
-                    hash_iocs and "malware_customer" in feed_types
-                ):
-                    modified_customer = self.pull_hashes(
-                        start_time=start_time,
-                        pull_location="Malware Customer",
-                        storage={},
-                        is_retraction=True
-                    )
-                    for indicator in modified_customer:
-                        hash_iocs -= indicator
-                if (
-                    hash_iocs and "malware_grid" in feed_types
-                ):
-                    modified_grid = self.pull_hashes(
-                        start_time=start_time,
-                        pull_location="Malware Grid",
-                        storage={},
-                        is_retraction=True
+                    combined_ioc = url_iocs.union(hash_iocs)
+                    self.logger.info(
+                        f"{self.log_prefix}: {len(combined_ioc)} indicator(s) "
+                        f"will be marked as retracted from total "
+                        f"{len(source_ioc_list)} "
+                        "indicator(s) present in Cloud Exchange."
                     )
-                    for indicator in modified_grid:
-                        hash_iocs -= indicator
 
-                if (
-                    url_iocs and "malsite" in feed_types
-                ):
-                    modified_url = self.get_rewritten_urls(
-                        start_time=start_time,
-                        storage={},
-                        is_retraction=True
+                    yield list(combined_ioc), False
+                except Exception as err:
+                    err_msg = (
+                        f"Error while pulling modified indicators from"
+                        f" {PLUGIN_NAME}."
                     )
-                    for indicator in modified_url:
-                        url_iocs -= indicator
+                    self.logger.error(
+                        message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
+                        details=str(traceback.format_exc()),
+                    )
+                    raise MimecastPluginException(err_msg)
+        finally:
+            for snapshot in snapshots.values():
+                snapshot.close()
 
-                combined_ioc = url_iocs.union(hash_iocs)
-                self.logger.info(
-                    f"{self.log_prefix}: {len(combined_ioc)} indicator(s) will "
-                    f"be marked as retracted from total "
-                    f"{len(source_ioc_list)} "
-                    "indicator(s) present in Cloud Exchange."
-                )
+    def _get_retracted_iocs(
+        self, snapshots: Dict, pull_location: str, iocs: set, pull
+    ) -> set:
+        """Get the indicators which are no longer on a feed.
 
-                yield list(combined_ioc), False
-            except Exception as err:
-                err_msg = (
-                    f"Error while pulling modified indicators from"
-                    f" {PLUGIN_NAME}."
-                )
-                self.logger.error(
-                    message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
-                    details=str(traceback.format_exc()),
-                )
-                raise MimecastPluginException(err_msg)
+        Args:
+            snapshots (Dict): Snapshots of the feeds pulled in this cycle.
+            pull_location (str): Feed to check the indicators against.
+            iocs (set): Indicator values to check.
+            pull (Callable): Function pulling the pages of the feed.
+
+        Returns:
+            set: Indicator values not on the feed.
+        """
+        if pull_location not in snapshots:
+            pull_start = time.monotonic()
+            snapshots[pull_location] = pull_snapshot(pull())
+            self.logger.info(
+                f"{self.log_prefix}: Pulled a snapshot of "
+                f"{snapshots[pull_location].size} indicator(s) from "
+                f"{pull_location} in "
+                f"{time.monotonic() - pull_start:.2f} second(s)."
+            )
+        diff_start = time.monotonic()
+        retracted_iocs = snapshots[pull_location].get_missing(iocs)
+        self.logger.debug(
+            f"{self.log_prefix}: Checked {len(iocs)} indicator(s) against "
+            f"the {pull_location} snapshot in "
+            f"{time.monotonic() - diff_start:.2f} second(s)."
+        )
+        return retracted_iocs
 
     def retract_indicators(
         self,
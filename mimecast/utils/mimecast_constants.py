@@ -34,7 +34,7 @@ CTE Mimecast plugin constants.
 
 PLUGIN_NAME = "Mimecast"
 MODULE_NAME = "CTE"
-PLUGIN_VERSION = "2.0.0"
+PLUGIN_VERSION = "2.0.1"
 MAX_REQUEST_URL = 25
 MAX_CREATE_URL = 20
 DEFAULT_WAIT_TIME = 60000
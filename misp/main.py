@@ -34,6 +34,7 @@ Implementation of MISP CTE plugin.
 
 import ipaddress
 import re
+import time
 import traceback
 from datetime import datetime, timedelta
 from typing import Dict, List, Union
@@ -69,6 +70,7 @@ from .utils.constants import (
     SHARING_TAG_CONSTANT,
 )
 from .utils.helper import MISPPluginException, MISPPluginHelper
+from .utils.retraction import pull_snapshot
 
 MISP_TO_INTERNAL_TYPE = {
     "md5": IndicatorType.MD5,
@@ -355,195 +357,232 @@ class MISPPlugin(PluginBase):
             "pulling_mechanism", "incremental"
         )
         end_time = datetime.now()
-        for source_ioc_list in source_indicators:
-            source_unique_iocs = set()
-            for ioc in source_ioc_list:
-                source_unique_iocs.add(ioc.value)
-            self.logger.info(
-                f"{self.log_prefix}: Getting modified indicators status"
-                f" for {len(source_unique_iocs)} indicator(s) from"
-                f" {PLATFORM_NAME}."
-            )
-
-            if pulling_mechanism == "look_back":
-                look_back = self.configuration.get("look_back", 24)
-                if look_back is None:
-                    err_msg = (
-                        "Look Back is a required configuration "
-                        'parameter when "Look Back" is selected as '
-                        "Pulling Mechanism."
-                    )
-                    self.logger.error(f"{self.log_prefix}: {err_msg}")
-                    raise MISPPluginException(err_msg)
-                elif (
-                    not isinstance(look_back, int)
-                    or look_back <= 0
-                    or look_back > MAX_LOOK_BACK
-                ):
-                    err_msg = (
-                        "Invalid value for Look Back provided in"
-                        " configuration parameters. Valid value should be "
-                        "an integer in range 1-8760 i.e. 1 year."
-                    )
-                    self.logger.error(f"{self.log_prefix}: {err_msg}")
-                    raise MISPPluginException(err_msg)
-                else:
-                    start_time = end_time - timedelta(hours=int(look_back))
+        if pulling_mechanism == "look_back":
+            look_back = self.configuration.get("look_back", 24)
+            if look_back is None:
+                err_msg = (
+                    "Look Back is a required configuration "
+                    'parameter when "Look Back" is selected as '
+                    "Pulling Mechanism."
+                )
+                self.logger.error(f"{self.log_prefix}: {err_msg}")
+                raise MISPPluginException(err_msg)
+            elif (
+                not isinstance(look_back, int)
+                or look_back <= 0
+                or look_back > MAX_LOOK_BACK
+            ):
+                err_msg = (
+                    "Invalid value for Look Back provided in"
+                    " configuration parameters. Valid value should be "
+                    "an integer in range 1-8760 i.e. 1 year."
+                )
+                self.logger.error(f"{self.log_prefix}: {err_msg}")
+                raise MISPPluginException(err_msg)
             else:
-                start_time = end_time - timedelta(days=retraction_interval)
+                start_time = end_time - timedelta(hours=int(look_back))
+        else:
+            start_time = end_time - timedelta(days=retraction_interval)
 
-            # create set of excluded events for
-            event_ids = []
-            include_event_name = self.configuration.get("include_event_name")
-            exclude_event = self.configuration.get("event_name", "")
-            exclude_events = []
-            if exclude_event:
-                exclude_events = [
-                    event
-                    for event in exclude_event.strip().split(",")
-                    if event
-                ]
-            base_url, api_key = self.misp_helper.get_credentials(
-                self.configuration
-            )
+        # create set of excluded events for
+        event_ids = []
+        include_event_name = self.configuration.get("include_event_name")
+        exclude_event = self.configuration.get("event_name", "")
+        exclude_events = []
+        if exclude_event:
+            exclude_events = [
+                event
+                for event in exclude_event.strip().split(",")
+                if event
+            ]
+        base_url, api_key = self.misp_helper.get_credentials(
+            self.configuration
+        )
 
-            if include_event_name:
-                for inc_event in include_event_name.strip().split(","):
-                    event_id = self._event_exists(
-                        inc_event, base_url, api_key, is_retraction=True
-                    )[1]
-                    event_ids.append(event_id)
+        if include_event_name:
+            for inc_event in include_event_name.strip().split(","):
+                event_id = self._event_exists(
+                    inc_event, base_url, api_key, is_retraction=True
+                )[1]
+                event_ids.append(event_id)
 
-            misp_tags = [f"!{DEFAULT_IOC_TAG}"]
-            tags = self.configuration.get("tags", "").strip()
-            if tags:
-                misp_tags.extend(tags.split(","))
+        misp_tags = [f"!{DEFAULT_IOC_TAG}"]
+        tags = self.configuration.get("tags", "").strip()
+        if tags:
+            misp_tags.extend(tags.split(","))
 
-            body = {
-                "returnFormat": "json",
-                "limit": PULL_PAGE_SIZE,
-                "page": 1,
-                "attribute_timestamp": [
-                    int(start_time.timestamp()),
-                    int(end_time.timestamp()),
-                ],
-                # Filter attributes based on type, category and tags
-                "category": self.configuration.get("attr_category"),
-                "type": self.configuration.get("attr_type"),
-                "tags": misp_tags,
-                "includeDecayScore": 1,
+        body = {
+            "returnFormat": "json",
+            "limit": PULL_PAGE_SIZE,
+            "page": 1,
+            "attribute_timestamp": [
+                int(start_time.timestamp()),
+                int(end_time.timestamp()),
+            ],
+            # Filter attributes based on type, category and tags
+            "category": self.configuration.get("attr_category"),
+            "type": self.configuration.get("attr_type"),
+            "tags": misp_tags,
+            "includeDecayScore": 1,
+        }
+        published = self.configuration.get("published", [])
+        if published == ["published"]:
+            body["published"] = 1
+        elif published == ["unpublished"]:
+            body["published"] = 0
+
+        to_ids = self.configuration.get("to_ids", [])
+        if to_ids == ["enabled"]:
+            body["to_ids"] = 1
+        elif to_ids == ["disabled"]:
+            body["to_ids"] = 0
+
+        enforce_warning_list = self.configuration.get(
+            "enforce_warning_list", "no"
+        ).strip()
+        if enforce_warning_list == "yes":
+            body["enforceWarninglist"] = 1
+        elif enforce_warning_list == "no":
+            body["enforceWarninglist"] = 0
+
+        if event_ids:
+            body["eventid"] = event_ids
+        score_threshold = self.configuration.get("score_threshold")
+        decaying_models = (
+            self.configuration.get("decaying_models", "")
+            .strip()
+            .split(",")
+        )
+        if score_threshold is not None:
+            model_ids = [
+                int(model_id) for model_id in decaying_models if model_id
+            ]
+            score_params = {
+                "excludeDecayed": 1,
+                "decayingModel": model_ids,
+                "modelOverrides": {"threshold": score_threshold},
             }
-            published = self.configuration.get("published", [])
-            if published == ["published"]:
-                body["published"] = 1
-            elif published == ["unpublished"]:
-                body["published"] = 0
+            body.update(score_params)
 
-            to_ids = self.configuration.get("to_ids", [])
-            if to_ids == ["enabled"]:
-                body["to_ids"] = 1
-            elif to_ids == ["disabled"]:
-                body["to_ids"] = 0
+        # The attributes are pulled once per cycle, on the first chunk, and
+        # every chunk is checked against the same snapshot.
+        snapshot = None
+        try:
+            for source_ioc_list in source_indicators:
+                source_unique_iocs = set()
+                for ioc in source_ioc_list:
+                    source_unique_iocs.add(ioc.value)
+                self.logger.info(
+                    f"{self.log_prefix}: Getting modified indicators status"
+                    f" for {len(source_unique_iocs)} indicator(s) from"
+                    f" {PLATFORM_NAME}."
+                )
+                if snapshot is None:
+                    pull_start = time.monotonic()
+                    snapshot = pull_snapshot(
+                        self._pull_existing_indicators(
+                            body, base_url, api_key, exclude_events
+                        )
+                    )
+                    self.logger.info(
+                        f"{self.log_prefix}: Pulled a snapshot of "
+                        f"{snapshot.size} indicator(s) from {PLATFORM_NAME} "
+                        f"in {time.monotonic() - pull_start:.2f} second(s)."
+                    )
+                diff_start = time.monotonic()
+                source_unique_iocs = snapshot.get_missing(source_unique_iocs)
+                self.logger.debug(
+                    f"{self.log_prefix}: Checked {len(source_ioc_list)} "
+                    "indicator(s) against the snapshot in "
+                    f"{time.monotonic() - diff_start:.2f} second(s)."
+                )
+                yield list(source_unique_iocs), False
+        finally:
+            if snapshot is not None:
+                snapshot.close()
 
-            enforce_warning_list = self.configuration.get(
-                "enforce_warning_list", "no"
-            ).strip()
-            if enforce_warning_list == "yes":
-                body["enforceWarninglist"] = 1
-            elif enforce_warning_list == "no":
-                body["enforceWarninglist"] = 0
+    def _pull_existing_indicators(
+        self, body: Dict, base_url: str, api_key: str, exclude_events: List
+    ):
+        """Pull the indicators still on MISP for retraction.
 
-            if event_ids:
-                body["eventid"] = event_ids
-            score_threshold = self.configuration.get("score_threshold")
-            decaying_models = (
-                self.configuration.get("decaying_models", "")
-                .strip()
-                .split(",")
-            )
-            if score_threshold is not None:
-                model_ids = [
-                    int(model_id) for model_id in decaying_models if model_id
-                ]
-                score_params = {
-                    "excludeDecayed": 1,
-                    "decayingModel": model_ids,
-                    "modelOverrides": {"threshold": score_threshold},
-                }
-                body.update(score_params)
+        Args:
+            body (Dict): restSearch request body.
+            base_url (str): MISP base URL.
+            api_key (str): MISP API key.
+            exclude_events (List): Names or IDs of the events to exclude.
 
-            last_page = False
-            while True:
-                indicators = set()
-                try:
-                    resp_json = self.misp_helper.api_helper(
-                        method="POST",
-                        url=f"{base_url}/attributes/restSearch",
-                        headers=self.misp_helper.get_header(api_key),
-                        json=body,
-                        logger_msg=(
-                            f"pulling indicators for page {body['page']}"
-                            f" to check their existence on {PLATFORM_NAME}"
-                        ),
-                        verify=self.ssl_validation,
-                        proxies=self.proxy,
-                        is_retraction=True,
-                    )
+        Yields:
+            set: Indicator values of each page.
+        """
+        last_page = False
+        while True:
+            indicators = set()
+            try:
+                resp_json = self.misp_helper.api_helper(
+                    method="POST",
+                    url=f"{base_url}/attributes/restSearch",
+                    headers=self.misp_helper.get_header(api_key),
+                    json=body,
+                    logger_msg=(
+                        f"pulling indicators for page {body['page']}"
+                        f" to check their existence on {PLATFORM_NAME}"
+                    ),
+                    verify=self.ssl_validation,
+                    proxies=self.proxy,
+                    is_retraction=True,
+                )
 
-                    for attr in resp_json.get("response", {}).get(
-                        "Attribute", []
+                for attr in resp_json.get("response", {}).get(
+                    "Attribute", []
+                ):
+                    if (
+                        attr.get("Event", {}).get("info", "")
+                        in exclude_events
+                        or attr.get("Event", {}).get("id")
+                        in exclude_events
                     ):
-                        if (
-                            attr.get("Event", {}).get("info", "")
-                            in exclude_events
-                            or attr.get("Event", {}).get("id")
-                            in exclude_events
-                        ):
 
-                            continue
+                        continue
 
-                        if attr.get("type") == "domain|ip":
-                            iocs = attr.get("value", "").split("|")
-                            for ioc in iocs:
-                                if ioc:
-                                    indicators.add(ioc)
-                        elif attr.get("type") in ATTRIBUTE_TYPES:
-                            # Filter already pushed attributes/indicators
-                            indicators.add(attr.get("value"))
+                    if attr.get("type") == "domain|ip":
+                        iocs = attr.get("value", "").split("|")
+                        for ioc in iocs:
+                            if ioc:
+                                indicators.add(ioc)
+                    elif attr.get("type") in ATTRIBUTE_TYPES:
+                        # Filter already pushed attributes/indicators
+                        indicators.add(attr.get("value"))
 
-                    if (
-                        len(
-                            resp_json.get("response", {}).get("Attribute", [])
-                        )
-                        < body["limit"]
-                    ):
-                        last_page = True
-                    # remove existing indicators.
-                    source_unique_iocs = source_unique_iocs - indicators
-                    self.logger.info(
-                        f"{self.log_prefix}: Successfully fetched "
-                        f"{len(indicators)} indicator(s) in "
-                        f"page {body['page']}."
-                    )
-                    body["page"] += 1
-                    # yield indicators, None if last_page else body
-                    if last_page or len(source_unique_iocs) == 0:
-                        break
-                except MISPPluginException:
-                    raise
-                except Exception as exp:
-                    err_msg = (
-                        f"Unexpected error occurred while pulling "
-                        f"indicators for page {body['page']} "
-                        f"from {PLATFORM_NAME}. Error: {exp}"
-                    )
-                    self.logger.error(
-                        message=f"{self.log_prefix}: {err_msg}",
-                        details=str(traceback.format_exc()),
+                if (
+                    len(
+                        resp_json.get("response", {}).get("Attribute", [])
                     )
-                    raise MISPPluginException(err_msg)
-
-            yield list(source_unique_iocs), False
+                    < body["limit"]
+                ):
+                    last_page = True
+                self.logger.info(
+                    f"{self.log_prefix}: Successfully fetched "
+                    f"{len(indicators)} indicator(s) in "
+                    f"page {body['page']}."
+                )
+                body["page"] += 1
+            except MISPPluginException:
+                raise
+            except Exception as exp:
+                err_msg = (
+                    f"Unexpected error occurred while pulling "
+                    f"indicators for page {body['page']} "
+                    f"from {PLATFORM_NAME}. Error: {exp}"
+                )
+                self.logger.error(
+                    message=f"{self.log_prefix}: {err_msg}",
+                    details=str(traceback.format_exc()),
+                )
+                raise MISPPluginException(err_msg)
+            yield indicators
+            if last_page:
+                break
 
     def _get_ioc_type_from_attribute(self, attribute_value):
         """Get IoC type from attribute."""
@@ -68,7 +68,7 @@ ATTRIBUTE_CATEGORIES = [
 PLATFORM_NAME = "MISP"
 PLUGIN_NAME = "MISP"
 MODULE_NAME = "CTE"
-PLUGIN_VERSION = "1.5.0"
+PLUGIN_VERSION = "1.5.1"
 BATCH_SIZE = 2500
 MAX_API_CALLS = 4
 DEFAULT_WAIT_TIME = 60
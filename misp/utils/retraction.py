@@ -0,0 +1,186 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2021, Netskope OSS
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+CTE MISP plugin retraction snapshot.
+"""
+
+import hashlib
+import heapq
+import mmap
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Set
+
+# Digests kept in memory before a sorted run is spilled to disk, 8 bytes
+# each.
+SNAPSHOT_MAX_MEMORY_DIGESTS = 1024 * 1024
+SNAPSHOT_READ_DIGESTS = 64 * 1024
+
+
+def get_digest(value) -> int:
+    """Get the 64 bit digest of an indicator value."""
+    return int.from_bytes(
+        hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(),
+        "little",
+    )
+
+
+def sort_digests(digests) -> array:
+    """Sort digests and drop the duplicates."""
+    unique = array("Q")
+    previous = None
+    for digest in sorted(digests):
+        if digest != previous:
+            unique.append(digest)
+            previous = digest
+    return unique
+
+
+def read_run(run_file) -> Iterator[int]:
+    """Read the digests of a sorted run from the start."""
+    run_file.seek(0)
+    while True:
+        digests = array("Q")
+        digests.frombytes(run_file.read(SNAPSHOT_READ_DIGESTS * 8))
+        if not digests:
+            return
+        yield from digests
+
+
+class RetractionSnapshot:
+    """Set of the indicator values still live on the platform.
+
+    The snapshot is pulled once per retraction cycle and every chunk of
+    source indicators is checked against it. Values are kept as sorted 64
+    bit digests, 8 bytes each, and looked up with a binary search. Once
+    more than max_memory_digests are pulled they are sorted in runs spilled
+    to temporary files, merged into a single memory mapped file.
+    """
+
+    def __init__(self, max_memory_digests: int = SNAPSHOT_MAX_MEMORY_DIGESTS):
+        """Initialize.
+
+        Args:
+            max_memory_digests (int): Digests kept in memory while pulling.
+        """
+        self.max_memory_digests = max_memory_digests
+        self.size = 0
+        self._digests = array("Q")
+        self._runs = []
+        self._file = None
+        self._map = None
+        self._sorted = None
+
+    def update(self, values: Iterable):
+        """Add values pulled from the platform."""
+        for value in values:
+            self._digests.append(get_digest(value))
+            if len(self._digests) >= self.max_memory_digests:
+                self._spill()
+
+    def _spill(self):
+        """Write the digests in memory as a sorted run."""
+        run_file = tempfile.TemporaryFile()
+        run_file.write(sort_digests(self._digests).tobytes())
+        self._runs.append(run_file)
+        self._digests = array("Q")
+
+    def freeze(self):
+        """Sort the snapshot once all the values are pulled."""
+        if not self._runs:
+            self._sorted = sort_digests(self._digests)
+            self._digests = array("Q")
+            self.size = len(self._sorted)
+            return
+        if self._digests:
+            self._spill()
+        self._file = tempfile.TemporaryFile()
+        previous = None
+        merged = array("Q")
+        for digest in heapq.merge(*(read_run(run) for run in self._runs)):
+            if digest == previous:
+                continue
+            previous = digest
+            merged.append(digest)
+            if len(merged) >= SNAPSHOT_READ_DIGESTS:
+                self._file.write(merged.tobytes())
+                merged = array("Q")
+        self._file.write(merged.tobytes())
+        self._file.flush()
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        if self._file.tell():
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self._sorted = memoryview(self._map).cast("Q")
+        else:
+            self._sorted = array("Q")
+        self.size = len(self._sorted)
+
+    def __contains__(self, value) -> bool:
+        """Check if a value is in the snapshot."""
+        digest = get_digest(value)
+        index = bisect_left(self._sorted, digest)
+        return index < len(self._sorted) and self._sorted[index] == digest
+
+    def get_missing(self, values: Iterable) -> Set:
+        """Get the values which are not in the snapshot."""
+        return {value for value in values if value not in self}
+
+    def close(self):
+        """Release the memory and the temporary files of the snapshot."""
+        if isinstance(self._sorted, memoryview):
+            self._sorted.release()
+        self._sorted = array("Q")
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        for run_file in self._runs + [self._file]:
+            if run_file is not None:
+                run_file.close()
+        self._runs = []
+        self._file = None
+
+
+def pull_snapshot(pages: Iterable[Iterable]) -> RetractionSnapshot:
+    """Build a snapshot from the pages of values pulled from the platform."""
+    snapshot = RetractionSnapshot()
+    try:
+        for page in pages:
+            snapshot.update(page)
+        snapshot.freeze()
+    except Exception:
+        snapshot.close()
+        raise
+    return snapshot
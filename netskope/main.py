@@ -1,10 +1,13 @@
 """Netskope Plugin implementation to push and pull the data from Netskope Tenant."""
 
 import datetime
+import hashlib
 import ipaddress
 import json
 import os
 import re
+import tempfile
+import time
 import traceback
 from typing import Dict, List, Tuple
 
@@ -55,13 +58,27 @@ URLS = {
     "V2_URL_LIST_DEPLOY": "{}/api/v2/policy/urllist/deploy",
     "V1_FILEHASH_LIST": "{}/api/v1/updateFileHashList",
     "V2_URL_LIST_REPLACE": "{}/api/v2/policy/urllist/{}/replace",
+    "V2_URL_LIST_APPEND": "{}/api/v2/policy/urllist/{}/append",
+    "V2_URL_LIST_REMOVE": "{}/api/v2/policy/urllist/{}/remove",
     "V2_PRIVATE_APP": "{}/api/v2/steering/apps/private",
     "V2_PRIVATE_APP_PATCH": "{}/api/v2/steering/apps/private/{}",
     "V2_PUBLISHER": "{}/api/v2/infrastructure/publishers",
 }
+# URL lists are synced by appending and removing the URLs changed since the
+# last push, recorded in a manifest per list. The whole list is replaced when
+# the changes exceed URL_LIST_MAX_DELTA_RATIO of the list or the manifest is
+# older than URL_LIST_FULL_SYNC_INTERVAL seconds.
+URL_LIST_MANIFEST_DIR = os.getenv(
+    "NETSKOPE_URL_LIST_MANIFEST_DIR",
+    os.path.join(tempfile.gettempdir(), "netskope_url_list_manifests"),
+)
+URL_LIST_MAX_DELTA_RATIO = 0.5
+URL_LIST_FULL_SYNC_INTERVAL = 24 * 60 * 60
+URL_LIST_SYNC_DELTA = "delta"
+URL_LIST_SYNC_REPLACE = "replace"
 MODULE_NAME = "CTE"
 PLUGIN_NAME = "Netskope CTE"
-PLUGIN_VERSION = "2.1.2"
+PLUGIN_VERSION = "2.1.3"
 
 plugin_provider_helper = PluginProviderHelper()
 
@@ -924,6 +941,266 @@ class NetskopePlugin(PluginBase):
             )
             return PushResult(success=False, message=str(e))
 
+    def _get_url_list_manifest_path(self, tenant_name: str, list_id) -> str:
+        """Get the path of the manifest of a URL list."""
+        key = hashlib.sha256(f"{tenant_name}|{list_id}".encode("utf-8"))
+        return os.path.join(
+            URL_LIST_MANIFEST_DIR, f"{key.hexdigest()[:32]}.txt"
+        )
+
+    def _read_url_list_manifest(
+        self, tenant_name: str, list_id, list_type: str
+    ):
+        """Read the URLs last pushed to a URL list.
+
+        Returns:
+            Tuple: URLs last pushed, URLs rejected by Netskope as invalid, the
+            time of the last full sync and whether the last change has been
+            deployed, None if the manifest is missing, does not match its
+            content hash, is of another list type or is due for a full sync.
+        """
+        path = self._get_url_list_manifest_path(tenant_name, list_id)
+        try:
+            with open(path, "rb") as manifest_file:
+                header = json.loads(manifest_file.readline())
+                content = manifest_file.read()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.logger.debug(
+                f"{self.log_prefix}: Unable to read the manifest of URL list"
+                f" {list_id}.",
+                details=traceback.format_exc(),
+            )
+            return None
+        if (
+            header.get("list_type") != list_type
+            or hashlib.sha256(content).hexdigest() != header.get("hash")
+            or time.time() - header.get("synced_at", 0)
+            >= URL_LIST_FULL_SYNC_INTERVAL
+        ):
+            return None
+        urls = set(content.decode("utf-8").split("\n")) if content else set()
+        return (
+            urls,
+            set(header.get("rejected", [])),
+            header["synced_at"],
+            header.get("deployed", False),
+        )
+
+    def _write_url_list_manifest(
+        self,
+        tenant_name: str,
+        list_id,
+        list_type: str,
+        urls: List[str],
+        rejected_urls: List[str],
+        synced_at: float,
+        deployed: bool = False,
+    ):
+        """Record the URLs pushed to a URL list with their content hash.
+
+        Args:
+            rejected_urls (List[str]): URLs rejected by Netskope as invalid,
+            they are not sent again until the next full sync.
+            synced_at (float): Time of the last full sync of the list.
+            deployed (bool): Whether the URLs have been deployed, set once
+            the deploy of the tenant succeeds otherwise.
+        """
+        path = self._get_url_list_manifest_path(tenant_name, list_id)
+        content = "\n".join(set(urls)).encode("utf-8")
+        header = {
+            "tenant": tenant_name,
+            "list_type": list_type,
+            "hash": hashlib.sha256(content).hexdigest(),
+            "synced_at": synced_at,
+            "changed_at": time.time(),
+            "rejected": sorted(set(rejected_urls)),
+            "deployed": deployed,
+        }
+        try:
+            os.makedirs(URL_LIST_MANIFEST_DIR, exist_ok=True)
+            with open(f"{path}.tmp", "wb") as manifest_file:
+                manifest_file.write(json.dumps(header).encode("utf-8") + b"\n")
+                manifest_file.write(content)
+            os.replace(f"{path}.tmp", path)
+        except Exception:
+            self.logger.debug(
+                f"{self.log_prefix}: Unable to write the manifest of URL list"
+                f" {list_id}, the whole list will be replaced in the next "
+                "push.",
+                details=traceback.format_exc(),
+            )
+            self._remove_url_list_manifest(tenant_name, list_id)
+
+    def _set_url_list_manifests_deployed(
+        self, tenant_name: str, deployed_at: float
+    ):
+        """Mark the URL lists of a tenant changed before a deploy as deployed.
+
+        Args:
+            deployed_at (float): Time the deploy was requested at, lists
+            changed afterwards are deployed again on their next push.
+        """
+        try:
+            names = os.listdir(URL_LIST_MANIFEST_DIR)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if not name.endswith(".txt"):
+                continue
+            path = os.path.join(URL_LIST_MANIFEST_DIR, name)
+            try:
+                with open(path, "rb") as manifest_file:
+                    header = json.loads(manifest_file.readline())
+                    if (
+                        header.get("tenant") != tenant_name
+                        or header.get("deployed")
+                        or header.get("changed_at", 0) >= deployed_at
+                    ):
+                        continue
+                    content = manifest_file.read()
+                header["deployed"] = True
+                with open(f"{path}.tmp", "wb") as manifest_file:
+                    manifest_file.write(
+                        json.dumps(header).encode("utf-8") + b"\n"
+                    )
+                    manifest_file.write(content)
+                os.replace(f"{path}.tmp", path)
+            except Exception:
+                self.logger.debug(
+                    f"{self.log_prefix}: Unable to mark the URL list manifest"
+                    f" {name} as deployed, the list will be deployed again "
+                    "on its next push.",
+                    details=traceback.format_exc(),
+                )
+
+    def _remove_url_list_manifest(self, tenant_name: str, list_id):
+        """Remove the manifest of a URL list in an unknown state."""
+        try:
+            os.remove(self._get_url_list_manifest_path(tenant_name, list_id))
+        except FileNotFoundError:
+            pass
+
+    def _update_url_list(
+        self,
+        tenant_name: str,
+        list_id,
+        operation: str,
+        urls: List[str],
+        list_type: str,
+    ) -> Tuple:
+        """Replace, append or remove the URLs of a URL list.
+
+        If Netskope rejects some of the URLs as invalid, the call is made
+        again without them.
+
+        Args:
+            tenant_name (str): Tenant name.
+            list_id: ID of the URL list.
+            operation (str): One of replace, append or remove.
+            urls (List[str]): URLs to replace the list with, append or
+            remove.
+            list_type (str): Type of the URL list.
+
+        Returns:
+            Tuple: Whether the list was updated, the URLs sent, the invalid
+            URLs and the invalid URLs which are IPv6 addresses.
+        """
+        invalid_indicators, ipv6_iocs = [], []
+        url = URLS[f"V2_URL_LIST_{operation.upper()}"].format(
+            tenant_name, list_id
+        )
+        data = {"data": {"urls": urls, "type": list_type}}
+        success, response = handle_exception(
+            self.session.patch,
+            error_code="CTE_1018",
+            custom_message=f"Error occurred while performing {operation} of indicators on URL list to Netskope",
+            plugin=self.log_prefix,
+            url=url,
+            json=data,
+        )
+        if not success:
+            self.logger.error(
+                f"{self.log_prefix}: Error occurred while performing {operation} of indicators on URL list.",
+                details=repr(response),
+            )
+            return False, urls, invalid_indicators, ipv6_iocs
+        if response.status_code == 400:
+            invalid_indicators, ipv6_iocs = self._extract_invalid_indicators(
+                response.json()
+            )
+            invalid_urls = set(invalid_indicators)
+            urls = [value for value in urls if value not in invalid_urls]
+            if not urls:
+                return True, urls, invalid_indicators, ipv6_iocs
+            data = {"data": {"urls": urls, "type": list_type}}
+            success, response = handle_exception(
+                self.session.patch,
+                error_code="CTE_1029",
+                custom_message=f"Error occurred while performing {operation} of URL list to Netskope",
+                plugin=self.log_prefix,
+                url=url,
+                json=data,
+            )
+            if not success:
+                self.logger.error(
+                    f"{self.log_prefix}: Error occurred while performing {operation} of "
+                    f"indicators on URL list after excluding invalid indicators."
+                )
+                return False, urls, invalid_indicators, ipv6_iocs
+        if response.status_code not in [200, 201]:
+            self.logger.error(
+                f"{self.log_prefix}: Error occurred while performing {operation} of indicators on URL list.",
+                details=response.text,
+            )
+            return False, urls, invalid_indicators, ipv6_iocs
+        handle_status_code(
+            response,
+            error_code="CTE_1030",
+            custom_message=f"Error occurred while performing {operation} of URL list to Netskope",
+            plugin=self.log_prefix,
+        )
+        return True, urls, invalid_indicators, ipv6_iocs
+
+    def _apply_url_list_delta(
+        self,
+        tenant_name: str,
+        list_id,
+        list_type: str,
+        urls: List[str],
+        urls_to_append: List[str],
+        urls_to_remove: List[str],
+    ) -> Tuple:
+        """Append and remove the URLs changed since the last push.
+
+        Returns:
+            Tuple: Whether the delta was applied, whether the list changed,
+            the URLs in the list, the invalid URLs and the invalid URLs
+            which are IPv6 addresses.
+        """
+        invalid_indicators, ipv6_iocs = [], []
+        is_changed = False
+        if urls_to_append:
+            success, appended_urls, invalid_indicators, ipv6_iocs = (
+                self._update_url_list(
+                    tenant_name, list_id, "append", urls_to_append, list_type
+                )
+            )
+            if not success:
+                return False, True, urls, invalid_indicators, ipv6_iocs
+            is_changed = bool(appended_urls)
+        if urls_to_remove:
+            success, *_ = self._update_url_list(
+                tenant_name, list_id, "remove", urls_to_remove, list_type
+            )
+            if not success:
+                return False, True, urls, invalid_indicators, ipv6_iocs
+            is_changed = True
+        invalid_urls = set(invalid_indicators)
+        urls = [value for value in urls if value not in invalid_urls]
+        return True, is_changed, urls, invalid_indicators, ipv6_iocs
+
     def _push_malsites(
         self,
         indicators: List[Indicator],
@@ -932,16 +1209,23 @@ class NetskopePlugin(PluginBase):
         max_size: int,
         default_url: str,
         enable_tagging: bool,
+        sync_mode: str = URL_LIST_SYNC_DELTA,
     ) -> PushResult:
         """
         Pushes malsite indicators to a URL list in Netskope.
 
+        In delta sync mode only the URLs changed since the last push are
+        appended and removed, and the changes are only deployed if the list
+        changed or its last change has not been deployed yet. URLs rejected
+        as invalid are not sent again until the next full sync.
+
         Args:
             indicators (List[Indicator]): A list of malware indicators to push.
             list_name (str): The name of the URL list.
             list_type (str): The type of the URL list.
             max_size (int): The maximum size of the URL list.
             default_url (str): The default URL to be added to the URL list.
+            sync_mode (str): Either delta or replace.
 
         Returns:
             PushResult: An object containing the result of the push operation.
@@ -1018,111 +1302,103 @@ class NetskopePlugin(PluginBase):
                         success=False,
                         message="Could not create new URL list to share indicators.",
                     )
-            url_lists = self.get_url_lists()
-            # append url to list
-            data = {
-                "data": {
-                    "urls": (
-                        indicators_to_push
-                        if total_urls > 0
-                        else [default_url]
-                    ),
-                    "type": list_type,
-                },
-            }
-            (
-                success,
-                append_urllist_netskope,
-            ) = handle_exception(
-                self.session.patch,
-                error_code="CTE_1018",
-                custom_message="Error occurred while appending indicators to URL list to Netskope",
-                plugin=self.log_prefix,
-                url=URLS["V2_URL_LIST_REPLACE"].format(
-                    tenant_name, url_lists[list_name]
-                ),
-                json=data,
-            )
-            if not success:
-                self.logger.error(
-                    f"{self.log_prefix}: Error occurred while appending indicators to URL list.",
-                    details=repr(success),
+                url_lists = self.get_url_lists()
+            list_id = url_lists[list_name]
+            urls = indicators_to_push if total_urls > 0 else [default_url]
+            manifest = None
+            if sync_mode == URL_LIST_SYNC_DELTA:
+                manifest = self._read_url_list_manifest(
+                    tenant_name, list_id, list_type
                 )
-                return PushResult(
-                    success=False,
-                    message="Could not share indicators.",
-                )
-            if total_urls == 0:
-                return PushResult(
-                    success=True,
-                    message="Successfully shared indicators.",
-                    should_run_cleanup=True,
-                )
-            invalid_indicators = []
-            ipv6_iocs = []
-            if append_urllist_netskope.status_code == 400:
-                response_json = append_urllist_netskope.json()
-                invalid_indicators, ipv6_iocs = (
-                    self._extract_invalid_indicators(response_json)
-                )
-                indicators_to_push = list(
-                    set(indicators_to_push) - set(invalid_indicators)
-                )
-                if not indicators_to_push:
+            synced_at = time.time()
+            is_changed, success, deployed = True, False, True
+            invalid_indicators, ipv6_iocs = [], []
+            rejected_urls, last_rejected_urls = set(), None
+            if manifest is not None:
+                pushed_urls, last_rejected_urls, synced_at, deployed = manifest
+                current_urls = set(urls)
+                rejected_urls = last_rejected_urls & current_urls
+                current_urls -= rejected_urls
+                urls_to_append = list(current_urls - pushed_urls)
+                urls_to_remove = list(pushed_urls - current_urls)
+                delta = len(urls_to_append) + len(urls_to_remove)
+                if not delta:
                     self.logger.info(
-                        f"{self.log_prefix}: No URL(s) to share after excluding invalid URL(s)."
+                        f"{self.log_prefix}: URL list {list_name} is unchanged since the last push,"
+                        " hence skipping the update of the list."
                     )
-                    return PushResult(
-                        success=True,
-                        message="No URL(s) to share after excluding invalid URL(s).",
+                    is_changed, success = False, True
+                elif delta <= URL_LIST_MAX_DELTA_RATIO * len(current_urls):
+                    self.logger.info(
+                        f"{self.log_prefix}: Appending {len(urls_to_append)} and removing"
+                        f" {len(urls_to_remove)} URL(s) changed in URL list {list_name} since the last push."
+                    )
+                    (
+                        success,
+                        is_changed,
+                        urls,
+                        invalid_indicators,
+                        ipv6_iocs,
+                    ) = self._apply_url_list_delta(
+                        tenant_name,
+                        list_id,
+                        list_type,
+                        [value for value in urls if value in current_urls],
+                        urls_to_append,
+                        urls_to_remove,
+                    )
+                    if not success:
+                        self.logger.info(
+                            f"{self.log_prefix}: Could not append and remove the changed URL(s),"
+                            f" hence replacing the whole URL list {list_name}."
+                        )
+                        self._remove_url_list_manifest(tenant_name, list_id)
+                        synced_at = time.time()
+                if success:
+                    urls = [value for value in urls if value in current_urls]
+                    rejected_urls.update(invalid_indicators)
+            if not success:
+                success, urls, invalid_indicators, ipv6_iocs = (
+                    self._update_url_list(
+                        tenant_name, list_id, "replace", urls, list_type
                     )
-                data = {
-                    "data": {
-                        "urls": indicators_to_push,
-                        "type": list_type,
-                    },
-                }
-                (
-                    success,
-                    append_urllist_netskope,
-                ) = handle_exception(
-                    self.session.patch,
-                    error_code="CTE_1029",
-                    custom_message="Error occurred while appending URL list to Netskope",
-                    plugin=self.log_prefix,
-                    url=URLS["V2_URL_LIST_REPLACE"].format(
-                        tenant_name, url_lists[list_name]
-                    ),
-                    json=data,
                 )
                 if not success:
-                    self.logger.error(
-                        f"{self.log_prefix}: Error occurred while appending "
-                        f"indicators to URL list after excluding invalid indicators."
-                    )
+                    self._remove_url_list_manifest(tenant_name, list_id)
                     return PushResult(
                         success=False,
                         message="Could not share indicators.",
                     )
-                if append_urllist_netskope.status_code not in [
-                    200,
-                    201,
-                ]:
-                    return PushResult(
-                        success=False,
-                        message="Error occurred while appending URL list to Netskope",
-                    )
-            elif append_urllist_netskope.status_code not in [200, 201]:
+                # Nothing is sent when Netskope rejects every URL.
+                is_changed = bool(urls)
+                rejected_urls = set(invalid_indicators)
+            if is_changed or rejected_urls != last_rejected_urls:
+                self._write_url_list_manifest(
+                    tenant_name,
+                    list_id,
+                    list_type,
+                    urls,
+                    rejected_urls,
+                    synced_at,
+                    deployed=deployed and not is_changed,
+                )
+            # The previous change is deployed again until a deploy succeeds.
+            should_run_cleanup = is_changed or not deployed
+            if not urls:
+                self.logger.info(
+                    f"{self.log_prefix}: No URL(s) to share after excluding invalid URL(s)."
+                )
                 return PushResult(
-                    success=False,
-                    message="Error occurred while appending URL list to Netskope",
+                    success=True,
+                    message="No URL(s) to share after excluding invalid URL(s).",
                 )
-            handle_status_code(
-                append_urllist_netskope,
-                error_code="CTE_1030",
-                custom_message="Error occurred while appending URL list to Netskope",
-                plugin=self.log_prefix,
-            )
+            if total_urls == 0:
+                return PushResult(
+                    success=True,
+                    message="Successfully shared indicators.",
+                    should_run_cleanup=should_run_cleanup,
+                )
+            indicators_to_push = urls
             invalid_iocs_without_valid_ipv6 = list(
                 set(invalid_indicators) - set(ipv6_iocs)
             )
@@ -1153,7 +1429,7 @@ class NetskopePlugin(PluginBase):
             return PushResult(
                 success=True,
                 message="Successfully shared indicators.",
-                should_run_cleanup=True,
+                should_run_cleanup=should_run_cleanup,
             )
         except Exception as e:
             self.notifier.error(
@@ -1221,6 +1497,9 @@ class NetskopePlugin(PluginBase):
                     "enable_tagging", "no"
                 ).lower()
                 == "yes",
+                sync_mode=action_dict.get(
+                    "url_list_sync", URL_LIST_SYNC_DELTA
+                ),
             )
         elif action_value == "file":
             self.session.headers.update(
@@ -1541,6 +1820,7 @@ class NetskopePlugin(PluginBase):
                 )
             )
         )
+        deployed_at = time.time()
         success, deploy_urllist = handle_exception(
             self.session.post,
             error_code="CTE_1019",
@@ -1568,6 +1848,7 @@ class NetskopePlugin(PluginBase):
             custom_message="Error while deploying changes",
             plugin=self.log_prefix,
         )
+        self._set_url_list_manifests_deployed(tenant_name, deployed_at)
 
     def validate_port(self, port):
         """Validate the port."""
@@ -1655,6 +1936,13 @@ class NetskopePlugin(PluginBase):
                     success=False,
                     message="Invalid Default URL.",
                 )
+            if action.parameters.get(
+                "url_list_sync", URL_LIST_SYNC_DELTA
+            ) not in [URL_LIST_SYNC_DELTA, URL_LIST_SYNC_REPLACE]:
+                return ValidationResult(
+                    success=False,
+                    message="Invalid URL List Sync provided.",
+                )
         elif action.value == "private_app":
             self.session = requests.Session()
             self.session.headers.update(
@@ -1880,6 +2168,19 @@ class NetskopePlugin(PluginBase):
                     "mandatory": False,
                     "description": "The default URL to be used when the URL list is empty.",
                 },
+                {
+                    "label": "URL List Sync",
+                    "key": "url_list_sync",
+                    "type": "choice",
+                    "choices": [
+                        {"key": "Delta", "value": URL_LIST_SYNC_DELTA},
+                        {"key": "Full Replace", "value": URL_LIST_SYNC_REPLACE},
+                    ],
+                    "default": URL_LIST_SYNC_DELTA,
+                    "mandatory": False,
+                    "description": "Delta only appends and removes the URLs changed since the last push and "
+                    "deploys the changes if the list changed. Full Replace replaces the whole list on every push.",
+                },
             ]
         if action.value == "file":
             return [
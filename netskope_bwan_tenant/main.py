@@ -27,6 +27,7 @@ from .utils.helper import (
     BWANForbiddenException
 )
 from .utils import constants
+from .utils.field_registry import field_registry
 
 plugin_provider_helper = PluginProviderHelper()
 notifier = Notifier()
@@ -193,6 +194,10 @@ class NetskopeBWANProviderPlugin(PluginBase):
     ):
         """Extract and store keys from list of dictionaries.
 
+        Fields already known to the process wide field registry are skipped
+        without querying the database. The new fields of the page are stored
+        once the whole page has been scanned.
+
         Args:
             items (List[dict]): List of dictionaries. i.e. alerts, or events.
             typeOfField (str): Alert or Event
@@ -200,6 +205,7 @@ class NetskopeBWANProviderPlugin(PluginBase):
         """
         typeOfField = typeOfField.rstrip("s")
         fields = set()
+        new_fields = []
         for item in items:
             if not isinstance(item, dict):
                 item = item.dict()
@@ -208,10 +214,20 @@ class NetskopeBWANProviderPlugin(PluginBase):
             for field in item.keys():
                 if field in fields:
                     continue
-
-                plugin_provider_helper.store_new_field(field, typeOfField)
-
-            fields = fields.union(item.keys())
+                fields.add(field)
+                if field_registry.is_known(typeOfField, sub_type, field, None):
+                    continue
+                new_fields.append((sub_type, field))
+
+        for field_sub_type, field in new_fields:
+            plugin_provider_helper.store_new_field(field, typeOfField)
+            field_registry.remember(typeOfField, field_sub_type, field, None)
+        if new_fields:
+            self.logger.debug(
+                f"{self.log_prefix}: Stored {len(new_fields)} new "
+                f"{typeOfField} field(s). Field registry: "
+                f"{field_registry.get_stats()}."
+            )
 
     def bifurcate_sub_type_data(self, response_data):
         """Bifurcate the response data based on sub type.
@@ -33,7 +33,7 @@ Tenant Netskope Borderless WAN.
 """
 
 MODULE_NAME = "TENANT"
-PLUGIN_VERSION = "1.1.0"
+PLUGIN_VERSION = "1.1.1"
 PLATFORM_NAME = "Netskope Borderless WAN"
 MAX_API_CALLS = 4
 DEFAULT_WAIT_TIME = 60
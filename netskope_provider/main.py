@@ -32,6 +32,7 @@ from .utils.iterator_helper import (
     NetskopeClient,
     NetskopeIteratorBuilder,
 )
+from .utils.field_registry import field_registry
 from .utils.router_helper import get_all_subtypes
 from .utils.webtx_metrics_collector import get_webtx_metrics_data
 from .utils.webtx_parser import WebtxParser
@@ -112,16 +113,31 @@ class NetskopeProviderPlugin(PluginBase):
         """Get the subtypes defined in router_helper."""
         return get_all_subtypes()
 
-    def _transform_webtx_data(self, data, fields, allow_empty_values):
-        """Transform webtx data."""
+    def _transform_webtx_data(
+        self, data, fields, allow_empty_values, columnar=False
+    ):
+        """Transform webtx data.
+
+        Args:
+            data (list): Gzip compressed messages.
+            fields (list): `Fields` attribute of each message.
+            allow_empty_values (bool): Keep empty values as None.
+            columnar (bool): Return a mapping of field name to list of
+                values instead of a list of logs.
+        """
         try:
-            all_logs = []
+            all_logs = {} if columnar else []
             parser = WebtxParser(allow_empty_values)
+            current_fields = None
             for message, message_fields in zip(data, fields):
                 message = gzip.decompress(message).decode("utf-8")
-                parser.fields = message_fields
-                for log in message.split("\n"):
-                    all_logs.append(parser.parse(log))
+                if message_fields != current_fields:
+                    parser.fields = message_fields
+                    current_fields = message_fields
+                if columnar:
+                    parser.parse_message_columnar(message, all_logs)
+                else:
+                    all_logs.extend(parser.parse_message(message))
             return all_logs
         except Exception as exp:
             self.logger.error(
@@ -142,7 +158,10 @@ class NetskopeProviderPlugin(PluginBase):
             fields = kwargs.get("fields")
             allow_empty_values = kwargs.get("allow_empty_values", False)
             return self._transform_webtx_data(
-                raw_data, fields, allow_empty_values
+                raw_data,
+                fields,
+                allow_empty_values,
+                columnar=kwargs.get("columnar", False),
             )
         return raw_data
 
@@ -478,6 +497,7 @@ class NetskopeProviderPlugin(PluginBase):
         override_subtypes=None,
         compress_historical_data=False,
         handle_forbidden=True,
+        page_codec=None,
     ):
         """Pull the Threat information from Netskope Tenant.
 
@@ -491,6 +511,8 @@ class NetskopeProviderPlugin(PluginBase):
             destination_configuration (str, optional): The destination configuration. Defaults to None.
             business_rule (str, optional): The business rule to apply. Defaults to None.
             override_subtypes (list, optional): List of overridden subtypes (For historical). Defaults to None.
+            page_codec (str, optional): Codec of the pulled pages, "gzip" or "none". Selected by the CE
+                core, which passes "none" when it consumes the pages in the same process. Defaults to gzip.
 
         Returns:
             GeneratorObject: List of indicator objects received from Netskope along with types.
@@ -534,6 +556,7 @@ class NetskopeProviderPlugin(PluginBase):
             headers=headers,
             log_prefix=self.log_prefix,
             compress_historical_data=compress_historical_data,
+            page_codec=page_codec,
         )
         if not override_subtypes:
             sub_type_config_mapping, latest_checked = (
@@ -573,6 +596,11 @@ class NetskopeProviderPlugin(PluginBase):
     ):
         """Extract and store keys from list of dictionaries.
 
+        Fields already known to the process wide field registry with the
+        same datatype are skipped without querying the database. The new
+        fields and datatype changes of the page are stored once the whole
+        page has been scanned.
+
         Args:
             items (List[dict]): List of dictionaries. i.e. alerts, or events.
             typeOfField (str): Alert or Event
@@ -580,6 +608,7 @@ class NetskopeProviderPlugin(PluginBase):
         """
         typeOfField = typeOfField.rstrip("s")
         fields = set()
+        new_fields = []
         for item in items:
             if not isinstance(item, dict):
                 item = item.dict()
@@ -595,6 +624,21 @@ class NetskopeProviderPlugin(PluginBase):
                     continue
                 if not field_value:
                     continue
+                fields.add(field)
+                datatype = (
+                    FieldDataType.BOOLEAN
+                    if isinstance(field_value, bool)
+                    else (
+                        FieldDataType.NUMBER
+                        if isinstance(field_value, int)
+                        or isinstance(field_value, float)
+                        else FieldDataType.TEXT
+                    )
+                )
+                if field_registry.is_known(
+                    typeOfField, sub_type, field, datatype
+                ):
+                    continue
                 field_obj = plugin_provider_helper.get_stored_field(field)
                 if (
                     typeOfField == NetskopeFieldType.WEBTX
@@ -634,22 +678,21 @@ class NetskopeProviderPlugin(PluginBase):
                         f"The CE platform has detected new field '{field}' in the {sub_type}"
                         f" event with id {item_id}. Configure CLS to use this field if you wish to sent it to the SIEM."
                     )
+                new_fields.append((sub_type, field, datatype))
 
-                datatype = (
-                    FieldDataType.BOOLEAN
-                    if isinstance(field_value, bool)
-                    else (
-                        FieldDataType.NUMBER
-                        if isinstance(field_value, int)
-                        or isinstance(field_value, float)
-                        else FieldDataType.TEXT
-                    )
-                )
-                plugin_provider_helper.store_new_field(
-                    field, typeOfField, datatype
-                )
-
-            fields = fields.union(item.keys())
+        for field_sub_type, field, datatype in new_fields:
+            plugin_provider_helper.store_new_field(
+                field, typeOfField, datatype
+            )
+            field_registry.remember(
+                typeOfField, field_sub_type, field, datatype
+            )
+        if new_fields:
+            self.logger.debug(
+                f"{self.log_prefix}: Stored {len(new_fields)} new or changed "
+                f"{typeOfField} field(s). Field registry: "
+                f"{field_registry.get_stats()}."
+            )
 
     def client_status_validation(self): 
         """Validate client status endpoint."""
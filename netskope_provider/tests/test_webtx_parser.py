@@ -0,0 +1,37 @@
+"""Webtx parser tests."""
+
+import itertools
+import random
+
+from netskope_provider.utils.webtx_parser import split_log, split_message
+
+TOKENS = ["a", "é", '"', '""', '"a b"', "-", '"-"', " ", "  ", "\n"]
+
+
+def split_lines(message):
+    """Split a message line by line with the regex."""
+    return [split_log(log) for log in message.split("\n")]
+
+
+def test_split_message_matches_split_log_exhaustive():
+    """The csv path tokenizes every short message like the regex."""
+    for length in range(1, 5):
+        for tokens in itertools.product(TOKENS, repeat=length):
+            message = "".join(tokens)
+            assert split_message(message) == split_lines(message), message
+
+
+def test_split_message_matches_split_log_random():
+    """The csv path tokenizes longer random messages like the regex."""
+    rng = random.Random(0)
+    for _ in range(20000):
+        message = "".join(
+            rng.choice(TOKENS) for _ in range(rng.randint(1, 16))
+        )
+        assert split_message(message) == split_lines(message), message
+
+
+def test_split_message_unescapes_unquoted_double_quotes():
+    """Doubled quotes in unquoted values are unescaped."""
+    assert split_message('é""" b') == [['é""', "b"]]
+    assert split_message('a""b "c""d"\n-') == [['a"b', 'c"d'], [None]]
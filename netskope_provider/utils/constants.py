@@ -79,14 +79,45 @@ RESOURCES = {"alert": ALERTS, "event": EVENTS}
 
 DATA_TYPE = {"alert": "alerts", "event": "events"}
 CLIENT_STATUS_CSV = "{}/api/v2/events/dataexport/iterator/{}/events"
-OK_PATTERN = rb"\"ok\"\s*:\s*(\d+)"
-TIMESTAMP_HWM_PATTERN = rb"\"timestamp_hwm\"\s*:\s*(\d+)"
-WAIT_TIME_PATTERN = rb"\"wait_time\"\s*:\s*(\d+)"
+# Fields of the envelope of a JSON page, around its result list.
+ENVELOPE_PATTERN = rb"\"(ok|timestamp_hwm|wait_time)\"\s*:\s*(\d+)"
+RESULT_KEY = b'"result"'
 ID_PATTERN = rb'\"_id"\s*:'
 RESULT = "result"
 TIMESTAMP_HWM = "timestamp_hwm"
 QUEUE_SIZE = 10
 DEFAULT_WAIT_TIME = 30
+# Lines of a CSV partition are compressed whenever this many bytes are pending.
+CSV_PARTITION_FLUSH_SIZE = 1024 * 1024
+CSV_COMPRESS_LEVEL = 3
+# Historical pulls are split into at most HISTORICAL_MAX_SLICES time slices of
+# at least HISTORICAL_MIN_SLICE_SECONDS, each pulled with its own iterator.
+HISTORICAL_MAX_SLICES = 8
+HISTORICAL_MIN_SLICE_SECONDS = 6 * 60 * 60
+# Budget shared by all the historical slices of a tenant.
+HISTORICAL_MAX_CONCURRENT_SLICES = 4
+HISTORICAL_REQUESTS_PER_SECOND = 2
+HISTORICAL_PROGRESS = "historical_progress"
+# Seconds the tenant state read by the pull threads of a client is reused.
+TENANT_STATE_REFRESH_INTERVAL = 30
+# Maintenance pulls run back to back while the iterator is more than
+# POLL_LAG_THRESHOLD seconds behind, every POLL_INTERVAL seconds once caught up
+# and back off exponentially up to POLL_MAX_BACKOFF seconds on empty pages.
+POLL_LAG_THRESHOLD = 300
+POLL_INTERVAL = DEFAULT_WAIT_TIME
+POLL_MAX_BACKOFF = 300
+# Pages handed over by the pull threads are compressed with gzip when they
+# cross a process boundary and left as they are otherwise.
+PAGE_CODEC_NONE = "none"
+PAGE_CODEC_GZIP = "gzip"
+PAGE_COMPRESS_LEVEL = 3
+# Pulling pauses after BACK_PRESSURE_PAUSE_AFTER samples under back pressure in
+# a row and resumes after BACK_PRESSURE_RESUME_AFTER samples without, sampled
+# every BACK_PRESSURE_PAUSED_CHECK_INTERVAL seconds while paused.
+BACK_PRESSURE_CHECK_INTERVAL = 5
+BACK_PRESSURE_PAUSED_CHECK_INTERVAL = 5
+BACK_PRESSURE_PAUSE_AFTER = 1
+BACK_PRESSURE_RESUME_AFTER = 2
 EXPONENTIAL_WAIT_TIME = 180
 WAIT_TIME = "wait_time"
 DEFAULT_RETRY_COUNT = 3
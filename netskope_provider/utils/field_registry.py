@@ -0,0 +1,75 @@
+"""Process wide registry of the fields already stored by the plugin."""
+
+import threading
+import time
+
+# Known fields are verified against the database again after this many
+# seconds, so fields removed or changed outside of this process are noticed.
+FIELD_REGISTRY_TTL = 3600
+
+
+class FieldRegistry:
+    """Cache of the stored fields per field type and subtype."""
+
+    def __init__(self, ttl=FIELD_REGISTRY_TTL):
+        """Field registry init."""
+        self.ttl = ttl
+        self._fields = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def is_known(self, field_type, sub_type, field, datatype) -> bool:
+        """Check if a field is stored with the same datatype.
+
+        Args:
+            field_type (str): Type of the field i.e. alert, event or webtx.
+            sub_type (str): Subtype of the alert or event.
+            field (str): Field name.
+            datatype (str): Datatype of the field value.
+
+        Returns:
+            bool: True if the field is stored with this datatype and the
+                entry has not expired.
+        """
+        key = (field_type, sub_type, field)
+        with self._lock:
+            entry = self._fields.get(key)
+            if (
+                entry is not None
+                and entry[0] == datatype
+                and time.monotonic() < entry[1]
+            ):
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def remember(self, field_type, sub_type, field, datatype):
+        """Remember a field that has been stored with datatype."""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._fields[(field_type, sub_type, field)] = (
+                datatype,
+                expires_at,
+            )
+            self.writes += 1
+
+    def clear(self):
+        """Forget all the fields, they are verified again on next use."""
+        with self._lock:
+            self._fields.clear()
+
+    def get_stats(self) -> dict:
+        """Get the hit, miss and write counters of the registry."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "size": len(self._fields),
+            }
+
+
+field_registry = FieldRegistry()
@@ -0,0 +1,166 @@
+"""Time sliced historical pulling helpers."""
+
+import threading
+import time
+from typing import List, Tuple
+
+from . import constants as CONST
+
+_budgets = {}
+_budgets_lock = threading.Lock()
+
+
+class TenantBudget:
+    """Concurrency and request rate budget shared by the slices of a tenant."""
+
+    def __init__(self, max_concurrency, requests_per_second):
+        """Tenant budget init.
+
+        Args:
+            max_concurrency (int): Maximum number of slices pulling at once.
+            requests_per_second (float): Maximum number of pulls per second.
+        """
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.interval = 1 / requests_per_second
+        self.next_request_at = 0
+        self.lock = threading.Lock()
+
+    def wait_for_request(self):
+        """Sleep until the next pull is allowed by the rate budget."""
+        with self.lock:
+            now = time.monotonic()
+            request_at = max(now, self.next_request_at)
+            self.next_request_at = request_at + self.interval
+        if request_at > now:
+            time.sleep(request_at - now)
+
+
+def get_tenant_budget(tenant_name) -> TenantBudget:
+    """Get the historical pulling budget shared by all pulls of a tenant."""
+    with _budgets_lock:
+        budget = _budgets.get(tenant_name)
+        if budget is None:
+            budget = _budgets[tenant_name] = TenantBudget(
+                CONST.HISTORICAL_MAX_CONCURRENT_SLICES,
+                CONST.HISTORICAL_REQUESTS_PER_SECOND,
+            )
+        return budget
+
+
+def split_time_window(start_time, end_time) -> List[Tuple[int, int]]:
+    """Split a historical window into contiguous, non overlapping slices.
+
+    Slices are at least HISTORICAL_MIN_SLICE_SECONDS long and there are at
+    most HISTORICAL_MAX_SLICES of them. Both bounds of a slice are inclusive
+    epoch seconds, so a record belongs to exactly one slice.
+
+    Args:
+        start_time (int): Start of the window in epoch seconds.
+        end_time (int): End of the window in epoch seconds.
+
+    Returns:
+        List[Tuple[int, int]]: Start and end of each slice.
+    """
+    duration = max(end_time - start_time, 0)
+    count = max(
+        1,
+        min(
+            CONST.HISTORICAL_MAX_SLICES,
+            duration // CONST.HISTORICAL_MIN_SLICE_SECONDS,
+        ),
+    )
+    bounds = [start_time + duration * index // count for index in range(count)]
+    bounds.append(end_time + 1)
+    return [(bounds[index], bounds[index + 1] - 1) for index in range(count)]
+
+
+def get_progress_key(iterator_name) -> str:
+    """Get the tenant storage key of the progress of a historical pull."""
+    return iterator_name.replace(".", "_").replace("$", "_")
+
+
+class HistoricalProgress:
+    """Progress of the slices of a historical pull."""
+
+    def __init__(self, slices, checkpoints=None):
+        """Historical progress init.
+
+        Args:
+            slices (List[Tuple[int, int]]): Start and end of each slice.
+            checkpoints (dict): Slice checkpoints restored from tenant
+                storage, keyed by slice index.
+        """
+        self.slices = slices
+        self.checkpoints = {
+            str(index): dict((checkpoints or {}).get(str(index), {}))
+            for index in range(len(slices))
+        }
+        self.records = sum(
+            checkpoint.get("records", 0)
+            for checkpoint in self.checkpoints.values()
+        )
+        self.started_at = time.monotonic()
+        self.pulled_since_start = 0
+        self.remaining_at_start = self._remaining_seconds()
+        self.lock = threading.Lock()
+
+    def get_checkpoint(self, index) -> dict:
+        """Get the checkpoint of a slice."""
+        with self.lock:
+            return dict(self.checkpoints[str(index)])
+
+    def _remaining_seconds(self):
+        """Get the number of seconds of the window left to pull."""
+        remaining = 0
+        for index, (start, end) in enumerate(self.slices):
+            checkpoint = self.checkpoints[str(index)]
+            if checkpoint.get("done"):
+                continue
+            remaining += end - max(start, checkpoint.get("hwm") or start)
+        return max(remaining, 0)
+
+    def update(self, index, hwm=None, records=0, done=False) -> dict:
+        """Record the progress of a slice.
+
+        Args:
+            index (int): Slice index.
+            hwm (int): Timestamp the slice has been pulled until.
+            records (int): Number of records pulled since the last update.
+            done (bool): Whether the slice is completely pulled.
+
+        Returns:
+            dict: Tenant storage update with the slice checkpoint and the
+                overall progress.
+        """
+        with self.lock:
+            checkpoint = self.checkpoints[str(index)]
+            if hwm:
+                checkpoint["hwm"] = hwm
+            checkpoint["records"] = checkpoint.get("records", 0) + records
+            checkpoint["done"] = checkpoint.get("done", False) or done
+            self.records += records
+            self.pulled_since_start += records
+
+            elapsed = time.monotonic() - self.started_at
+            records_per_second = (
+                self.pulled_since_start / elapsed if elapsed > 0 else 0
+            )
+            remaining = self._remaining_seconds()
+            pulled_seconds = self.remaining_at_start - remaining
+            eta = None
+            if pulled_seconds > 0 and elapsed > 0:
+                eta = int(remaining * elapsed / pulled_seconds)
+            return {
+                f"slices.{index}": dict(checkpoint),
+                "window": [self.slices[0][0], self.slices[-1][1]],
+                "slices_total": len(self.slices),
+                "slices_done": sum(
+                    1
+                    for slice_checkpoint in self.checkpoints.values()
+                    if slice_checkpoint.get("done")
+                ),
+                "records": self.records,
+                "records_per_second": round(records_per_second, 2),
+                "eta_seconds": eta,
+                "updated_at": int(time.time()),
+            }
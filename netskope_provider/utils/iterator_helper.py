@@ -2,12 +2,14 @@
 import threading
 import time
 import re
-import gzip
+import io
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 import traceback
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests.exceptions
@@ -15,7 +17,18 @@ from celery.exceptions import SoftTimeLimitExceeded
 from netskope_api.iterator.const import Const
 from netskope_api.iterator.netskope_iterator import NetskopeIterator
 from . import constants as CONST
+from .historical_helper import (
+    HistoricalProgress,
+    TenantBudget,
+    get_progress_key,
+    get_tenant_budget,
+    split_time_window,
+)
 from .iterator_api_helper import NetskopePluginHelper
+from .page_codec import get_page_codec
+from .pause_controller import PauseController
+from .poll_scheduler import poll_scheduler
+from .tenant_state import TenantStateCache
 from netskope.common.api import __version__
 from netskope.common.utils import (
     Logger,
@@ -33,6 +46,112 @@ connector = DBConnector()
 logger = Logger()
 notifier = Notifier()
 plugin_provider_helper = PluginProviderHelper()
+# Samples the flag set by the back pressure threads of the pulls, the pull
+# threads wait while it pauses instead of returning.
+pause_controller = PauseController(
+    lambda: back_pressure.STOP_PULLING, logger=logger, name="Iterator pulling"
+)
+
+
+def partition_csv_by_version(
+    response: bytes, schema_headers: Dict[bytes, bytes]
+) -> Tuple[int, List[bytes]]:
+    """Split a CSV page into one gzip compressed CSV per schema version.
+
+    The page is scanned once, each line is routed to every version it starts
+    with and streamed into the compressor of that version, so only the
+    compressed partitions and a small pending buffer per version are held in
+    memory besides the page itself.
+
+    Args:
+        response (bytes): CSV page, one record per line.
+        schema_headers (Dict[bytes, bytes]): Mapping of version prefix to
+            the CSV header of that version.
+
+    Returns:
+        Tuple[int, List[bytes]]: Number of lines in the page and the
+            compressed CSV of each version, in schema_headers order. Each CSV
+            is the header followed by the lines of that version.
+    """
+    compressors = []
+    buffers = []
+    chunks = []
+    counts = []
+    for header in schema_headers.values():
+        compressors.append(
+            zlib.compressobj(CONST.CSV_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+        )
+        buffers.append(bytearray(header))
+        chunks.append([])
+        counts.append(0)
+    prefixes = list(enumerate(schema_headers))
+    routes = {}
+    total = 0
+    for line in io.BytesIO(response):
+        total += 1
+        line = line.rstrip(b"\r\n")
+        comma = line.find(b",")
+        version = line if comma == -1 else line[:comma]
+        targets = routes.get(version)
+        if targets is None:
+            # A version prefix never contains a comma, so it matches the line
+            # exactly when it matches the first column.
+            targets = routes[version] = [
+                index for index, key in prefixes if version.startswith(key)
+            ]
+        for index in targets:
+            buffer = buffers[index]
+            buffer += b"\n"
+            buffer += line
+            counts[index] += 1
+            if len(buffer) >= CONST.CSV_PARTITION_FLUSH_SIZE:
+                chunks[index].append(compressors[index].compress(buffer))
+                buffer.clear()
+    contents = []
+    for compressor, buffer, chunk, count in zip(
+        compressors, buffers, chunks, counts
+    ):
+        if not count:
+            buffer += b"\n"
+        chunk.append(compressor.compress(buffer))
+        chunk.append(compressor.flush())
+        contents.append(b"".join(chunk))
+    return total, contents
+
+
+def scan_json_page(
+    response: bytes,
+) -> Tuple[int, Optional[int], Optional[int], Optional[int]]:
+    """Extract the record count, ok, timestamp_hwm and wait_time of a page.
+
+    The page is scanned once to count the records. The other values are
+    read from the envelope around the result list only, so fields of the
+    records with the same names are ignored.
+
+    Args:
+        response (bytes): JSON page.
+
+    Returns:
+        Tuple[int, Optional[int], Optional[int], Optional[int]]: Number of
+            records, ok, timestamp_hwm and wait_time of the page, None for
+            the values missing from the envelope.
+    """
+    count = len(re.findall(CONST.ID_PATTERN, response))
+    envelope = response
+    result_at = response.find(CONST.RESULT_KEY)
+    if result_at != -1:
+        envelope = (
+            response[:result_at] + response[response.rfind(b"]") + 1:]  # noqa: E203
+        )
+    values = {}
+    for key, value in re.findall(CONST.ENVELOPE_PATTERN, envelope):
+        values.setdefault(key, int(value))
+    return (
+        count,
+        values.get(b"ok"),
+        values.get(b"timestamp_hwm"),
+        values.get(b"wait_time"),
+    )
 
 
 class NetskopeIteratorBuilder(NetskopeIterator):
@@ -52,11 +171,13 @@ class NetskopeIteratorBuilder(NetskopeIterator):
         business_rule=None,
         headers=None,
         log_prefix=None,
+        tenant_state=None,
     ):
         """Initialize Netskope iterator."""
         from netskope.common.utils import get_installation_id
 
         self.tenant = tenant
+        self.tenant_state = tenant_state
         self.tenant_name = tenant.get("name") if tenant else ""
         tenant_config_parameters = tenant.get("parameters", {})
         self.tenant_hostname = tenant_config_parameters.get(
@@ -190,6 +311,23 @@ class NetskopeIteratorBuilder(NetskopeIterator):
         ),
         sleep=CONST.DEFAULT_WAIT_TIME,
     )
+    def has_pull_errors_stored(self) -> bool:
+        """Check if the tenant storage has pull errors to clear for the subtype.
+
+        Without a tenant state cache it is unknown, so the errors are always
+        cleared.
+        """
+        if self.tenant_state is None:
+            return True
+        tenant, _ = self.tenant_state.get()
+        tenant_storage = (tenant or {}).get("storage", {})
+        return bool(
+            tenant_storage.get("is_v2_token_expired")
+            or (tenant_storage.get("forbidden_endpoints") or {}).get(
+                self.sub_type
+            )
+        )
+
     def pull(self, parse_response=True, return_schema_headers=False):
         """Pull data from Netskope."""
         from netskope.common.utils.forbidden_notifier import (
@@ -249,6 +387,8 @@ class NetskopeIteratorBuilder(NetskopeIterator):
                     plugin_provider_helper.update_tenant_storage(
                         self.tenant_name, update_set
                     )
+                    if self.tenant_state is not None:
+                        self.tenant_state.invalidate()
                     create_or_ack_forbidden_error_banner()
                 raise IncompleteTransactionError(
                     f"Received error while pulling "
@@ -268,6 +408,8 @@ class NetskopeIteratorBuilder(NetskopeIterator):
                 plugin_provider_helper.update_tenant_storage(
                     self.tenant_name, update_set
                 )
+                if self.tenant_state is not None:
+                    self.tenant_state.invalidate()
                 create_or_ack_forbidden_error_banner()
                 raise e
             except Exception as e:
@@ -281,24 +423,27 @@ class NetskopeIteratorBuilder(NetskopeIterator):
                 raise e
             self.epoch = None
 
-            update_set = {"is_v2_token_expired": False}
-            update_unset = {f"forbidden_endpoints.{self.sub_type}": ""}
-            new_document = plugin_provider_helper.update_tenant_storage(
-                self.tenant_name, update_set, update_unset, True
-            )
-            new_forbidden_endpoints = new_document.get("storage", {}).get("forbidden_endpoints") if new_document else {}
-            current_forbidden_endpoints = self.tenant.get("storage", {}).get(
-                "forbidden_endpoints"
-            ) if self.tenant else {}
-            is_forbidden_value_changed = new_forbidden_endpoints != current_forbidden_endpoints
-            if (
-                (
-                    self.tenant and 
-                    self.tenant.get("storage", {}).get("is_v2_token_expired")
+            if self.has_pull_errors_stored():
+                update_set = {"is_v2_token_expired": False}
+                update_unset = {f"forbidden_endpoints.{self.sub_type}": ""}
+                new_document = plugin_provider_helper.update_tenant_storage(
+                    self.tenant_name, update_set, update_unset, True
                 )
-                or is_forbidden_value_changed
-            ):
-                create_or_ack_forbidden_error_banner()
+                if self.tenant_state is not None:
+                    self.tenant_state.invalidate()
+                new_forbidden_endpoints = new_document.get("storage", {}).get("forbidden_endpoints") if new_document else {}
+                current_forbidden_endpoints = self.tenant.get("storage", {}).get(
+                    "forbidden_endpoints"
+                ) if self.tenant else {}
+                is_forbidden_value_changed = new_forbidden_endpoints != current_forbidden_endpoints
+                if (
+                    (
+                        self.tenant and
+                        self.tenant.get("storage", {}).get("is_v2_token_expired")
+                    )
+                    or is_forbidden_value_changed
+                ):
+                    create_or_ack_forbidden_error_banner()
             if not return_schema_headers:
                 return content
             else:
@@ -318,7 +463,6 @@ class NetskopeClient:
     EVENT = "event"
     MAINTENANCE_PULLING = "maintenance_pulling"
     HISTORICAL_PULLING = "historical_pulling"
-    BACK_PRESSURE_WAIT_TIME = 300
 
     def __init__(
         self,
@@ -335,8 +479,15 @@ class NetskopeClient:
         compress_historical_data=False,
         headers=None,
         log_prefix=None,
+        page_codec=None,
     ):
-        """Initialize netskope client."""
+        """Initialize netskope client.
+
+        Args:
+            page_codec (str): Codec of the pages handed over to the caller,
+                gzip by default. Pages consumed in the same process can be
+                left uncompressed with the none codec.
+        """
         self.tenant = tenant
         self.tenant_name = tenant.get("name") if tenant else ""
         self.type = type_
@@ -368,6 +519,7 @@ class NetskopeClient:
         self.destination_configuration = destination_configuration
         self.business_rule = business_rule
         self.compress_historical_data = compress_historical_data
+        self.page_codec = get_page_codec(page_codec)
         self.headers = headers
         self.headers["Authorization"] = "Bearer {}".format(
             resolve_secret(tenant_config_parameters.get("v2token"))
@@ -380,6 +532,28 @@ class NetskopeClient:
             plugin_name=CONST.PLATFORM_NAME,
             plugin_version=CONST.PLUGIN_VERSION,
         )
+        # Tenant state shared by the pull threads, so that each page does not
+        # read the tenant and the plugin status from the database.
+        self.tenant_state = TenantStateCache(
+            self._load_tenant_state, CONST.TENANT_STATE_REFRESH_INTERVAL
+        )
+        self.pull_status_updated = set()
+
+    def _load_tenant_state(self):
+        """Load the tenant and whether pulling is enabled from the database."""
+        if self.pulling_type == NetskopeClient.HISTORICAL_PULLING:
+            tenant = connector.collection(Collections.NETSKOPE_TENANTS).find_one(
+                {"name": self.tenant_name}
+            )
+            return tenant, True
+        tenant = plugin_provider_helper.get_tenant_details(
+            self.tenant_name, CONST.DATA_TYPE[self.type]
+        )
+        is_enabled = (
+            plugin_provider_helper.is_netskope_plugin_enabled(tenant.get("name"))
+            and plugin_provider_helper.is_module_enabled()
+        )
+        return tenant, is_enabled
 
     def get_iterator(
         self, sub_type, iterator_name, is_historical=False
@@ -397,6 +571,7 @@ class NetskopeClient:
                 business_rule=self.business_rule,
                 headers=self.headers,
                 log_prefix=self.log_prefix,
+                tenant_state=self.tenant_state,
             )
         return self.iterators[iterator_name]
 
@@ -497,7 +672,12 @@ class NetskopeClient:
             )
 
     def update_pull_status(self, sub_type):
-        """Update first alert pull in database."""
+        """Update first alert pull in database.
+
+        The flag is written once per load of the subtype, not on every page.
+        """
+        if sub_type in self.pull_status_updated:
+            return
         name = f"first_{self.type}_pull"
         sub_name = f"first_{sub_type}_pull"
         tenant_storage = self.tenant.get("storage", {}) if self.tenant else {}
@@ -517,12 +697,15 @@ class NetskopeClient:
             #     }
             #     },
             # )
+            self.tenant_state.invalidate()
+        self.pull_status_updated.add(sub_type)
 
     def load(self, sub_type: str, iterator_name: str):
         """Pull mechanism."""
         try:
             start_time = datetime.now()
             iterator = self.get_iterator(sub_type, iterator_name)
+            self.pull_status_updated.discard(sub_type)
 
             tenant_dict_storage = self.tenant.get("storage", {})
             if tenant_dict_storage.get(f"first_{self.type}_pull", {}).get(
@@ -559,6 +742,7 @@ class NetskopeClient:
             )
             back_pressure_thread.start()
 
+            is_paused = False
             while True:
                 if not self.tenant:
                     logger.error(
@@ -573,18 +757,20 @@ class NetskopeClient:
                 if hours >= 1:
                     return {"success": True}
 
-                if back_pressure.STOP_PULLING:
-                    logger.debug(
-                        f"{self.log_prefix}: "
-                        f"Pulling of {sub_type} {self.type}(s) for tenant {self.tenant_name} "
-                        "is stopped due to back pressure."
-                    )
-                    return {"success": False}
+                if pause_controller.poll():
+                    if not is_paused:
+                        logger.debug(
+                            f"{self.log_prefix}: "
+                            f"Pulling of {sub_type} {self.type}(s) for tenant {self.tenant_name} "
+                            "is paused due to back pressure."
+                        )
+                    is_paused = True
+                    time.sleep(pause_controller.get_check_interval())
+                    continue
+                is_paused = False
 
                 try:
-                    self.tenant = plugin_provider_helper.get_tenant_details(
-                        self.tenant_name, CONST.DATA_TYPE[self.type]
-                    )
+                    self.tenant, is_enabled = self.tenant_state.get()
                 except Exception:
                     logger.error(
                         f"{self.log_prefix}: "
@@ -593,12 +779,7 @@ class NetskopeClient:
                     )
                     return {"success": False}
 
-                if not (
-                    plugin_provider_helper.is_netskope_plugin_enabled(
-                        self.tenant.get("name")
-                    )
-                    and plugin_provider_helper.is_module_enabled()
-                ):
+                if not is_enabled:
                     update_set_data = {
                         f"first_{self.type}_pull.first_{sub_type}_pull": True,
                     }
@@ -622,10 +803,11 @@ class NetskopeClient:
                 )
                 if headers:  # data is in CSV format Client status + index name
                     schema_header = headers.get("schema_headers", "")
-                    wait_time = CONST.DEFAULT_WAIT_TIME
+                    wait_time = None
+                    records = 0
                     if schema_header:
                         try:
-                            schema_header = json.loads(headers.replace("'", '"'))
+                            schema_header = json.loads(schema_header.replace("'", '"'))
                         except json.decoder.JSONDecodeError:
                             error_msg = (
                                 "Error occurred while fetching the schema headers. "
@@ -636,32 +818,25 @@ class NetskopeClient:
                                 details=traceback.format_exc(),
                             )
                             return {"success": False}
-                        wait_time = schema_header.get("wait_time", CONST.DEFAULT_WAIT_TIME)
+                        wait_time = schema_header.get("wait_time")
                         schema_headers = {
                             key.encode(): b"version," + value.encode()
                             for key, value in schema_header.items()
                             if key.lower().startswith("v")
                         }
                         if response and schema_headers:
-                            response = response.splitlines()
+                            count, contents = partition_csv_by_version(
+                                response, schema_headers
+                            )
+                            records = count
+                            # Release the page before waiting for the next pull.
+                            response = None
                             logger.info(
                                 f"{self.log_prefix}: "
-                                f"Pulled {len(response)} {sub_type} {self.type}(s) for tenant "
+                                f"Pulled {count} {sub_type} {self.type}(s) for tenant "
                                 f"{self.tenant.get('name')} in CSV format using {iterator_name} index."
                             )
-                            for key, header in schema_headers.items():
-                                batch = b"\n".join(
-                                    [
-                                        header,
-                                        b"\n".join(
-                                            filter(
-                                                lambda x: x.startswith(key),
-                                                response,
-                                            )
-                                        ),
-                                    ]
-                                )
-                                content = gzip.compress(batch, compresslevel=3)
+                            for content in contents:
                                 self.message_queue.put((content, sub_type, False, True))
                         else:
                             logger.info(
@@ -670,11 +845,12 @@ class NetskopeClient:
                                 f"{self.tenant.get('name')} in CSV format using {iterator_name} index."
                             )
                     elif response:
-                        wait_time = headers.get("wait_time", CONST.DEFAULT_WAIT_TIME)
-                        content = gzip.compress(response, compresslevel=3)
+                        wait_time = headers.get("wait_time")
+                        records = len(response.splitlines()) - 1
+                        content = self.page_codec.encode(response)
                         logger.info(
                             f"{self.log_prefix}: "
-                            f"Pulled {len(response.splitlines())-1} {sub_type} {self.type}(s) for tenant "
+                            f"Pulled {records} {sub_type} {self.type}(s) for tenant "
                             f"{self.tenant.get('name')} in CSV format using {iterator_name} index."
                         )
                         self.message_queue.put((content, sub_type, False, True))
@@ -685,19 +861,12 @@ class NetskopeClient:
                             f"{self.tenant.get('name')} in CSV format using {iterator_name} index."
                         )
                 else:
-                    number_of_alerts = len(re.findall(CONST.ID_PATTERN, response))
-                    ok_match = re.search(CONST.OK_PATTERN, response)
-                    timestamp_hwm_match = re.search(
-                        CONST.TIMESTAMP_HWM_PATTERN, response
+                    number_of_alerts, ok, timestamp_hwm, wait_time = (
+                        scan_json_page(response)
                     )
-                    if timestamp_hwm_match:
-                        iterator.timestamp_hwm = int(
-                            timestamp_hwm_match.group(1).decode()
-                        )
-                    wait_time_match = re.search(CONST.WAIT_TIME_PATTERN, response)
-                    if not response or (
-                        ok_match and int(ok_match.group(1).decode()) != 1
-                    ):
+                    if timestamp_hwm:
+                        iterator.timestamp_hwm = timestamp_hwm
+                    if not response or (ok is not None and ok != 1):
                         message = (
                             f"Error occurred while pulling {sub_type} {self.type} from {self.tenant} tenant. "
                             f"Response: {response}"
@@ -708,8 +877,8 @@ class NetskopeClient:
                         )
                         return {"success": False}
                     pull_message = (
-                        f", pulled data till {datetime.fromtimestamp(int(timestamp_hwm_match.group(1).decode()))}."
-                        if timestamp_hwm_match
+                        f", pulled data till {datetime.fromtimestamp(timestamp_hwm)}."
+                        if timestamp_hwm
                         else "."
                     )
                     logger.info(
@@ -717,7 +886,7 @@ class NetskopeClient:
                         f"Pulled {number_of_alerts} {sub_type} {self.type}(s) for tenant "
                         f"{self.tenant.get('name')} in JSON format using {iterator_name} index{pull_message}"
                     )
-                    content = gzip.compress(response, compresslevel=3)
+                    content = self.page_codec.encode(response)
                     self.message_queue.put(
                         (
                             content,
@@ -726,11 +895,20 @@ class NetskopeClient:
                             number_of_alerts != 0
                         )
                     )
-                    wait_time = CONST.DEFAULT_WAIT_TIME
-                    if wait_time_match:
-                        wait_time = int(wait_time_match.group(1).decode())
+                    records = number_of_alerts
                 self.update_pull_status(sub_type)
-                time.sleep(int(wait_time))
+                poll_key = f"{self.tenant_name}.{iterator_name}"
+                delay = poll_scheduler.next_delay(
+                    poll_key, records, iterator.timestamp_hwm, wait_time
+                )
+                lag = poll_scheduler.get_lag(poll_key)
+                logger.debug(
+                    f"{self.log_prefix}: "
+                    f"{iterator_name} index of tenant {self.tenant_name} is "
+                    f"{'unknown' if lag is None else lag} seconds behind, "
+                    f"next pull of {sub_type} {self.type}(s) in {delay} seconds."
+                )
+                time.sleep(delay)
 
         except Exception as ex:
             logger.error(
@@ -760,27 +938,30 @@ class NetskopeClient:
                 self.running_thread -= 1
                 self.message_queue.put(([], sub_type, should_apply_expo_backoff, True))
 
-    def filter_data(self, data: List) -> List:
-        """Return filtered data."""
+    def filter_data(self, data: List, end_time=None) -> List:
+        """Return the leading records with a timestamp up to end_time."""
+        end_time = self.end_time if end_time is None else end_time
+        # Records are ordered by timestamp, most pages are entirely in range.
+        if not data or data[-1].get("timestamp", 0) <= end_time:
+            return data
         filtered = []
         for i in range(len(data)):
             timestamp = data[i].get("timestamp", 0)
-            if timestamp > self.end_time:
+            if timestamp > end_time:
                 return filtered
             filtered.append(data[i])
         return filtered
 
     def load_historical(self, sub_type: str, iterator_name: str):
-        """Pull historical data from Netskope."""
-        iterator = self.get_iterator(sub_type, iterator_name, is_historical=True)
-        # registered = connector.collection(Collections.ITERATOR).find_one(
-        #     {"name": self.iterator_name % sub_type}
-        # )
-
-        # if not registered:
-        iterator.set_timestamp(self.start_time)
+        """Pull historical data from Netskope.
 
-        pull_time = None
+        The window is split into time slices that are pulled concurrently,
+        each with its own iterator, within the historical budget of the
+        tenant. The progress of every slice is checkpointed in the tenant
+        storage, so a restarted pull resumes the slices it had not completed.
+        """
+        slices = split_time_window(self.start_time, self.end_time)
+        progress_key = get_progress_key(iterator_name)
         try:
             self.should_exit.clear()
             back_pressure_thread = threading.Thread(
@@ -790,6 +971,94 @@ class NetskopeClient:
             )
             back_pressure_thread.start()
 
+            tenant = self.tenant_state.get(force=True)[0] or self.tenant or {}
+            saved_progress = (
+                tenant.get("storage", {})
+                .get(CONST.HISTORICAL_PROGRESS, {})
+                .get(progress_key, {})
+            )
+            checkpoints = None
+            if saved_progress.get("window") == [
+                self.start_time,
+                self.end_time,
+            ] and saved_progress.get("slices_total") == len(slices):
+                checkpoints = saved_progress.get("slices")
+            progress = HistoricalProgress(slices, checkpoints)
+            budget = get_tenant_budget(self.tenant_name)
+
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    len(slices), CONST.HISTORICAL_MAX_CONCURRENT_SLICES
+                )
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda index: self.load_historical_slice(
+                            sub_type,
+                            iterator_name,
+                            index,
+                            progress,
+                            budget,
+                            progress_key,
+                        ),
+                        range(len(slices)),
+                    )
+                )
+            if all(result.get("success") for result in results):
+                logger.info(
+                    f"{self.log_prefix}: "
+                    f"Historical pulling of {sub_type} {self.type}(s) for tenant {self.tenant_name} "
+                    f"is done for time window {datetime.fromtimestamp(self.start_time)} "
+                    f"to {datetime.fromtimestamp(self.end_time)}."
+                )
+                return {"success": True}
+            return {"success": False}
+        except Exception as ex:
+            logger.error(
+                f"{self.log_prefix}: "
+                f"Error occurred while pulling {sub_type} {self.type}(s) for "
+                f"the tenant {self.tenant_name}. {ex}",
+                error_code="CE_1111",
+                details=traceback.format_exc(),
+            )
+        finally:
+            self.should_exit.set()
+            with self.lock:
+                self.running_thread -= 1
+                self.message_queue.put(([], sub_type, False, True))
+
+    def load_historical_slice(
+        self,
+        sub_type: str,
+        iterator_name: str,
+        index: int,
+        progress: HistoricalProgress,
+        budget: TenantBudget,
+        progress_key: str,
+    ):
+        """Pull one time slice of a historical window.
+
+        Args:
+            sub_type (str): Subtype to pull.
+            iterator_name (str): Iterator name of the historical pull.
+            index (int): Index of the slice in progress.slices.
+            progress (HistoricalProgress): Progress of the historical pull.
+            budget (TenantBudget): Historical budget of the tenant.
+            progress_key (str): Tenant storage key of the progress.
+        """
+        start_time, end_time = progress.slices[index]
+        checkpoint = progress.get_checkpoint(index)
+        if checkpoint.get("done"):
+            return {"success": True}
+        if len(progress.slices) > 1:
+            iterator_name = f"{iterator_name}_slice{index}"
+        slice_label = f"[slice {index + 1}/{len(progress.slices)}]"
+        iterator = self.get_iterator(sub_type, iterator_name, is_historical=True)
+        iterator.set_timestamp(checkpoint.get("hwm") or start_time)
+
+        pull_time = None
+        is_paused = False
+        with budget.slots:
             while True:
                 if not self.tenant:
                     logger.error(
@@ -798,18 +1067,19 @@ class NetskopeClient:
                         error_code="CE_1034",
                     )
                     return {"success": False}
-                if back_pressure.STOP_PULLING:
-                    logger.debug(
-                        f"{self.log_prefix}: "
-                        f"Historical pulling of {sub_type} {self.type}(s) for tenant {self.tenant_name} "
-                        "is paused due to back pressure."
-                    )
-                    time.sleep(NetskopeClient.BACK_PRESSURE_WAIT_TIME)
+                if pause_controller.poll():
+                    if not is_paused:
+                        logger.debug(
+                            f"{self.log_prefix}: {slice_label} "
+                            f"Historical pulling of {sub_type} {self.type}(s) for tenant {self.tenant_name} "
+                            "is paused due to back pressure."
+                        )
+                    is_paused = True
+                    time.sleep(pause_controller.get_check_interval())
                     continue
+                is_paused = False
 
-                self.tenant = connector.collection(Collections.NETSKOPE_TENANTS).find_one(
-                    {"name": self.tenant.get("name")}
-                )
+                self.tenant, _ = self.tenant_state.get()
                 if not self.tenant:
                     logger.error(
                         f"{self.log_prefix}: "
@@ -818,80 +1088,89 @@ class NetskopeClient:
                     )
                     return {"success": False}
 
+                budget.wait_for_request()
                 response = iterator.pull()
 
                 if not response or response.get("ok") != 1:
                     logger.error(
-                        f"{self.log_prefix}: "
+                        f"{self.log_prefix}: {slice_label} "
                         f"Error occurred while pulling {sub_type} {self.type}(s) "
                         f"from {self.tenant.get('name')} tenant. "
                         f"Response: {response}"
                     )
                     return {"success": False}
 
-                if response.get(CONST.TIMESTAMP_HWM, 0) > self.end_time or (
-                    pull_time == response.get(CONST.TIMESTAMP_HWM, 0)
-                    and not len(response.get(CONST.RESULT, []))
-                ):
-                    logger.info(
-                        f"{self.log_prefix}: "
-                        f"Historical pulling of {sub_type} {self.type}(s) for tenant {self.tenant.get('name')} "
-                        f"is done for time window {datetime.fromtimestamp(self.start_time)} "
-                        f"to {datetime.fromtimestamp(self.end_time)}."
-                    )
-                    return {"success": True}
-
-                filtered_data = self.filter_data(response.get(CONST.RESULT, []))
-                pull_time = response.get(CONST.TIMESTAMP_HWM, 0)
-                pull_message = (
-                    f" until {datetime.fromtimestamp(pull_time)} " if pull_time else " "
+                result = response.get(CONST.RESULT, [])
+                timestamp_hwm = response.get(CONST.TIMESTAMP_HWM, 0)
+                is_done = timestamp_hwm > end_time or (
+                    pull_time == timestamp_hwm and not len(result)
                 )
-                if (
-                    self.source_configuration
-                    and self.destination_configuration
-                    and self.business_rule
-                ):
-                    logger.info(
-                        f"{self.log_prefix}: "
-                        f"Pulled {len(filtered_data)} {sub_type} {self.type}(s) from historical "
-                        f"{self.type}s in JSON format using {iterator_name} index{pull_message}"
-                        f"for SIEM Mapping {self.source_configuration} to {self.destination_configuration} "
-                        f"according to rule business rule {self.business_rule}."
+                # The last page of a slice can still hold records of the
+                # slice, only the ones past its end belong to the next slice.
+                filtered_data = self.filter_data(result, end_time)
+                pull_time = timestamp_hwm
+                if filtered_data or not is_done:
+                    pull_message = (
+                        f" until {datetime.fromtimestamp(min(pull_time, end_time))} "
+                        if pull_time
+                        else " "
                     )
+                    if (
+                        self.source_configuration
+                        and self.destination_configuration
+                        and self.business_rule
+                    ):
+                        logger.info(
+                            f"{self.log_prefix}: {slice_label} "
+                            f"Pulled {len(filtered_data)} {sub_type} {self.type}(s) from historical "
+                            f"{self.type}s in JSON format using {iterator_name} index{pull_message}"
+                            f"for SIEM Mapping {self.source_configuration} to {self.destination_configuration} "
+                            f"according to rule business rule {self.business_rule}."
+                        )
+                    else:
+                        logger.info(
+                            f"{self.log_prefix}: {slice_label} "
+                            f"Pulled {len(filtered_data)} {sub_type} {self.type}(s) from historical "
+                            f"{self.type}s in JSON format using {iterator_name} index{pull_message}"
+                            f"for configuration {self.source_configuration}."
+                        )
+                    records = len(filtered_data)
+                    if self.compress_historical_data and filtered_data:
+                        filtered_data = self.page_codec.encode(json.dumps({CONST.RESULT: filtered_data}).encode('utf-8'))
+                    self.message_queue.put((filtered_data, sub_type, False, True))
                 else:
+                    records = 0
+
+                update_set = progress.update(
+                    index,
+                    hwm=min(timestamp_hwm, end_time) if timestamp_hwm else None,
+                    records=records,
+                    done=is_done,
+                )
+                plugin_provider_helper.update_tenant_storage(
+                    self.tenant_name,
+                    {
+                        f"{CONST.HISTORICAL_PROGRESS}.{progress_key}.{key}": value
+                        for key, value in update_set.items()
+                    },
+                )
+                if is_done:
                     logger.info(
-                        f"{self.log_prefix}: "
-                        f"Pulled {len(filtered_data)} {sub_type} {self.type}(s) from historical "
-                        f"{self.type}s in JSON format using {iterator_name} index{pull_message}"
-                        f"for configuration {self.source_configuration}."
+                        f"{self.log_prefix}: {slice_label} "
+                        f"Historical pulling of {sub_type} {self.type}(s) for tenant {self.tenant_name} "
+                        f"is done for time window {datetime.fromtimestamp(start_time)} "
+                        f"to {datetime.fromtimestamp(end_time)}. "
+                        f"Slices done: {update_set['slices_done']}/{update_set['slices_total']}, "
+                        f"{update_set['records_per_second']} record(s)/second, "
+                        f"ETA: {update_set['eta_seconds']} second(s)."
                     )
-                if self.compress_historical_data and filtered_data:
-                    filtered_data = gzip.compress(json.dumps({CONST.RESULT: filtered_data}).encode('utf-8'), compresslevel=3)
-                self.message_queue.put((filtered_data, sub_type, False, True))
-                # if not registered:
-                #     connector.collection(Collections.ITERATOR).insert_one(
-                #         {"name": self.iterator_name % sub_type}
-                #     )
-                #     registered = True
+                    return {"success": True}
+
                 wait_time = CONST.DEFAULT_WAIT_TIME
-                if len(response.get(CONST.RESULT, [])) != 0:
+                if len(result) != 0:
                     wait_time = response.get(CONST.WAIT_TIME, CONST.DEFAULT_WAIT_TIME)
                 time.sleep(wait_time)
 
-        except Exception as ex:
-            logger.error(
-                f"{self.log_prefix}: "
-                f"Error occurred while pulling {sub_type} {self.type}(s) for "
-                f"the tenant {self.tenant_name}. {ex}",
-                error_code="CE_1111",
-                details=traceback.format_exc(),
-            )
-        finally:
-            self.should_exit.set()
-            with self.lock:
-                self.running_thread -= 1
-                self.message_queue.put(([], sub_type, False, True))
-
     # def get_configured_alerts_in_tenant(self, alerts=None, latest_checked=None):
     #     """Return the latest configured alerts from tenant."""
     #     now = datetime.now()
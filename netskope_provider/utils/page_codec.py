@@ -0,0 +1,66 @@
+"""Codecs of the pages handed over by the pull threads."""
+
+import gzip
+from typing import Dict
+
+from . import constants as CONST
+
+
+class PageCodec:
+    """Codec leaving the pages as they are.
+
+    Used when the pages are consumed in the same process, where compressing
+    them only costs CPU.
+    """
+
+    name = CONST.PAGE_CODEC_NONE
+
+    def encode(self, page: bytes) -> bytes:
+        """Encode a page."""
+        return page
+
+    def decode(self, page: bytes) -> bytes:
+        """Decode a page."""
+        return page
+
+
+class GzipPageCodec(PageCodec):
+    """Codec compressing the pages with gzip.
+
+    Used when the pages cross a process boundary, the consumers of the CE
+    platform expect gzip compressed pages.
+    """
+
+    name = CONST.PAGE_CODEC_GZIP
+
+    def __init__(self, compresslevel=CONST.PAGE_COMPRESS_LEVEL):
+        """Gzip page codec init."""
+        self.compresslevel = compresslevel
+
+    def encode(self, page: bytes) -> bytes:
+        """Encode a page."""
+        return gzip.compress(page, compresslevel=self.compresslevel)
+
+    def decode(self, page: bytes) -> bytes:
+        """Decode a page."""
+        return gzip.decompress(page)
+
+
+PAGE_CODECS: Dict[str, PageCodec] = {
+    codec.name: codec for codec in (PageCodec(), GzipPageCodec())
+}
+
+
+def get_page_codec(name=None) -> PageCodec:
+    """Get a page codec by name, gzip by default.
+
+    Raises:
+        ValueError: If there is no codec with this name.
+    """
+    codec = PAGE_CODECS.get(name or CONST.PAGE_CODEC_GZIP)
+    if codec is None:
+        raise ValueError(
+            f"Unsupported page codec '{name}', supported codecs are "
+            f"{', '.join(PAGE_CODECS)}."
+        )
+    return codec
@@ -0,0 +1,138 @@
+"""Pause and resume of the pulls under back pressure."""
+
+import threading
+import time
+
+from . import constants as CONST
+
+
+class PauseController:
+    """Back pressure state shared by the pull threads of a process.
+
+    The pressure is sampled every check_interval seconds, and every
+    paused_check_interval seconds while paused so that pulling resumes
+    within seconds of the pressure clearing. Pulling is paused after
+    pause_after samples under pressure in a row and only resumed after
+    resume_after samples without, so a pressure flapping around its
+    threshold does not pause and resume the pulls on every sample.
+
+    The pull threads keep their connections and state while paused, they
+    only stop pulling until the controller resumes.
+    """
+
+    def __init__(
+        self,
+        is_under_pressure,
+        logger=None,
+        name="Pulling",
+        check_interval=CONST.BACK_PRESSURE_CHECK_INTERVAL,
+        paused_check_interval=CONST.BACK_PRESSURE_PAUSED_CHECK_INTERVAL,
+        pause_after=CONST.BACK_PRESSURE_PAUSE_AFTER,
+        resume_after=CONST.BACK_PRESSURE_RESUME_AFTER,
+    ):
+        """Pause controller init.
+
+        Args:
+            is_under_pressure (Callable): Function sampling the back
+                pressure, an exception it raises counts as no pressure.
+            logger: Logger the pauses and resumes are logged to.
+            name (str): Name of what is paused in the logs.
+            check_interval (int): Seconds between the samples.
+            paused_check_interval (int): Seconds between the samples while
+                paused.
+            pause_after (int): Samples under pressure in a row after which
+                pulling is paused.
+            resume_after (int): Samples without pressure in a row after
+                which pulling is resumed.
+        """
+        self.is_under_pressure = is_under_pressure
+        self.logger = logger
+        self.name = name
+        self.check_interval = check_interval
+        self.paused_check_interval = paused_check_interval
+        self.pause_after = pause_after
+        self.resume_after = resume_after
+        self.is_paused = False
+        self.pauses = 0
+        self.paused_seconds = 0.0
+        self.last_pause_seconds = None
+        self._paused_at = None
+        self._streak = 0
+        self._sampled_at = None
+        self._lock = threading.Lock()
+
+    def get_check_interval(self) -> int:
+        """Get the seconds until the next sample is due."""
+        if self.is_paused:
+            return self.paused_check_interval
+        return self.check_interval
+
+    def poll(self) -> bool:
+        """Sample the pressure if a sample is due and get the pause state.
+
+        Returns:
+            bool: Whether pulling is paused.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._sampled_at is not None
+                and now - self._sampled_at < self.get_check_interval()
+            ):
+                return self.is_paused
+            self._sampled_at = now
+            try:
+                under_pressure = bool(self.is_under_pressure())
+            except Exception:
+                under_pressure = False
+            if under_pressure != self.is_paused:
+                self._streak += 1
+            else:
+                self._streak = 0
+            if not self.is_paused and self._streak >= self.pause_after:
+                self._pause(now)
+            elif self.is_paused and self._streak >= self.resume_after:
+                self._resume(now)
+            return self.is_paused
+
+    def _pause(self, now):
+        """Pause pulling."""
+        self.is_paused = True
+        self.pauses += 1
+        self._paused_at = now
+        self._streak = 0
+        if self.logger:
+            self.logger.info(f"{self.name} paused due to back pressure.")
+
+    def _resume(self, now):
+        """Resume pulling and record the pause duration."""
+        duration = now - self._paused_at
+        self.is_paused = False
+        self.paused_seconds += duration
+        self.last_pause_seconds = duration
+        self._paused_at = None
+        self._streak = 0
+        if self.logger:
+            self.logger.info(
+                f"{self.name} resumed after {duration:.0f} second(s) of "
+                "back pressure."
+            )
+
+    def get_metrics(self) -> dict:
+        """Get the pause state and durations.
+
+        Returns:
+            dict: `paused`, number of `pauses`, `paused_seconds` in total
+                including the ongoing pause, and `last_pause_seconds` of the
+                last completed pause.
+        """
+        with self._lock:
+            paused_seconds = self.paused_seconds
+            if self.is_paused:
+                paused_seconds += time.monotonic() - self._paused_at
+            return {
+                "paused": self.is_paused,
+                "pauses": self.pauses,
+                "paused_seconds": paused_seconds,
+                "last_pause_seconds": self.last_pause_seconds,
+            }
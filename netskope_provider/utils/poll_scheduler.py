@@ -0,0 +1,86 @@
+"""Adaptive scheduling of the maintenance pulls."""
+
+import threading
+import time
+
+from . import constants as CONST
+
+
+class PollScheduler:
+    """Decide when each iterator pulls its next page.
+
+    An iterator lagging behind the wall clock pulls back to back, an
+    iterator receiving empty pages backs off exponentially and a caught up
+    iterator pulls every POLL_INTERVAL seconds. The wait time returned by
+    the server is honoured as a lower bound whenever it is sent.
+    """
+
+    def __init__(
+        self,
+        lag_threshold=CONST.POLL_LAG_THRESHOLD,
+        interval=CONST.POLL_INTERVAL,
+        max_backoff=CONST.POLL_MAX_BACKOFF,
+    ):
+        """Poll scheduler init.
+
+        Args:
+            lag_threshold (int): Seconds behind the wall clock from which an
+                iterator pulls back to back.
+            interval (int): Seconds between the pulls of a caught up
+                iterator, and first back off after an empty page.
+            max_backoff (int): Maximum seconds between the pulls of an
+                iterator receiving empty pages.
+        """
+        self.lag_threshold = lag_threshold
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.lags = {}
+        self.empty_pages = {}
+        self._lock = threading.Lock()
+
+    def next_delay(self, key, records, timestamp_hwm=None, wait_time=None):
+        """Get the number of seconds to wait before the next pull.
+
+        Args:
+            key (str): Iterator key, unique across tenants.
+            records (int): Number of records in the page just pulled.
+            timestamp_hwm (int): Timestamp the iterator has pulled until,
+                None if unknown.
+            wait_time (int): Wait time sent by the server, None if it did
+                not send any.
+
+        Returns:
+            float: Seconds to wait before the next pull.
+        """
+        lag = None
+        if timestamp_hwm:
+            lag = max(int(time.time()) - int(timestamp_hwm), 0)
+        with self._lock:
+            self.lags[key] = lag
+            empty_pages = 0 if records else self.empty_pages.get(key, 0) + 1
+            self.empty_pages[key] = empty_pages
+        if empty_pages:
+            delay = min(
+                self.interval * 2 ** min(empty_pages - 1, 16),
+                self.max_backoff,
+            )
+        elif lag is not None and lag > self.lag_threshold:
+            delay = 0
+        else:
+            delay = self.interval
+        if wait_time:
+            delay = max(delay, int(wait_time))
+        return delay
+
+    def get_lag(self, key):
+        """Get the seconds an iterator is behind the wall clock."""
+        with self._lock:
+            return self.lags.get(key)
+
+    def get_lags(self) -> dict:
+        """Get the seconds each iterator is behind the wall clock."""
+        with self._lock:
+            return dict(self.lags)
+
+
+poll_scheduler = PollScheduler()
@@ -0,0 +1,273 @@
+"""Append-only spill log of the WebTx messages."""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+# Record header, payload length and crc32 of the payload.
+RECORD_HEADER = struct.Struct(">II")
+# Length of the fields in the payload, followed by the fields and the data.
+FIELDS_HEADER = struct.Struct(">I")
+NO_FIELDS = 0xFFFFFFFF
+SEGMENT_SUFFIX = ".log"
+CURSORS_FILE = "cursors.json"
+
+
+def encode_record(message_data: bytes, message_fields: Optional[str]) -> bytes:
+    """Frame a message as a spill log record."""
+    if message_fields is None:
+        payload = FIELDS_HEADER.pack(NO_FIELDS) + message_data
+    else:
+        fields = message_fields.encode("utf-8")
+        payload = FIELDS_HEADER.pack(len(fields)) + fields + message_data
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_payload(payload) -> Tuple[bytes, Optional[str]]:
+    """Get the message data and fields of a record payload."""
+    (fields_length,) = FIELDS_HEADER.unpack_from(payload)
+    if fields_length == NO_FIELDS:
+        return bytes(payload[FIELDS_HEADER.size:]), None
+    start = FIELDS_HEADER.size + fields_length
+    return (
+        bytes(payload[start:]),
+        bytes(payload[FIELDS_HEADER.size:start]).decode("utf-8"),
+    )
+
+
+class SpillLog:
+    """Segmented append-only log with a read cursor per consumer.
+
+    Records are appended to the active segment and synced to disk before
+    `append` returns, so the messages can be acknowledged once appended.
+    Offsets are positions in the concatenation of the segments, each
+    segment is named after the offset of its first record. Consumers read
+    from their own offset through memory maps and commit it once the
+    records are delivered, segments every consumer has committed past are
+    deleted.
+
+    On open, a record torn by a crash at the end of the last segment is
+    truncated and the consumers resume from their committed offsets, so
+    the records delivered but not committed are read again.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int):
+        """Open a spill log, creating it if it does not exist.
+
+        Args:
+            directory (str): Directory of the segments and cursors.
+            segment_bytes (int): Size after which a new segment is started.
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.cursors: Dict[str, int] = {}
+        self._segments: List[int] = []
+        self._maps = {}
+        self._file = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._segments = sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(SEGMENT_SUFFIX)
+        )
+        if not self._segments:
+            self._segments.append(0)
+        self.end_offset = self._segments[-1] + self._recover(
+            self._segments[-1]
+        )
+        self._open_active()
+        cursors_path = os.path.join(directory, CURSORS_FILE)
+        if os.path.exists(cursors_path):
+            with open(cursors_path) as cursors_file:
+                self.cursors = json.load(cursors_file)
+
+    def _path(self, base: int) -> str:
+        """Get the path of a segment."""
+        return os.path.join(self.directory, f"{base:020d}{SEGMENT_SUFFIX}")
+
+    def _recover(self, base: int) -> int:
+        """Truncate a segment after its last complete record.
+
+        Returns:
+            int: Size of the segment.
+        """
+        path = self._path(base)
+        if not os.path.exists(path):
+            open(path, "wb").close()
+            return 0
+        position = 0
+        with open(path, "r+b") as segment:
+            content = segment.read()
+            while position + RECORD_HEADER.size <= len(content):
+                length, crc = RECORD_HEADER.unpack_from(content, position)
+                start = position + RECORD_HEADER.size
+                payload = content[start:start + length]
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    break
+                position = start + length
+            if position < len(content):
+                segment.truncate(position)
+        return position
+
+    def _open_active(self):
+        """Open the last segment for appending."""
+        self._file = open(self._path(self._segments[-1]), "ab")
+
+    @property
+    def start_offset(self) -> int:
+        """Offset of the oldest record kept."""
+        return self._segments[0]
+
+    def get_size(self) -> int:
+        """Get the bytes kept in the log."""
+        return self.end_offset - self.start_offset
+
+    def register(self, consumers: List[str]):
+        """Set the consumers of the log.
+
+        New consumers start at the end of the log, the cursors of the
+        consumers not in the list are removed so they do not keep segments.
+        """
+        with self._lock:
+            self.cursors = {
+                consumer: self.cursors.get(consumer, self.end_offset)
+                for consumer in consumers
+            }
+            self._save_cursors()
+            self._reclaim()
+
+    def get_cursor(self, consumer: str) -> int:
+        """Get the committed offset of a consumer."""
+        with self._lock:
+            return max(self.cursors[consumer], self.start_offset)
+
+    def append(self, records: List[Tuple[bytes, Optional[str]]]) -> int:
+        """Append messages and sync them to disk.
+
+        Args:
+            records (list): Message data and fields of each message.
+
+        Returns:
+            int: End offset of the log.
+        """
+        with self._lock:
+            for message_data, message_fields in records:
+                if self.end_offset - self._segments[-1] >= self.segment_bytes:
+                    self._roll()
+                record = encode_record(message_data, message_fields)
+                self._file.write(record)
+                self.end_offset += len(record)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            return self.end_offset
+
+    def _roll(self):
+        """Start a new segment."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._segments.append(self.end_offset)
+        self._open_active()
+
+    def _get_map(self, base: int, size: int):
+        """Get a memory map of a segment covering at least size bytes."""
+        segment_map = self._maps.get(base)
+        if segment_map is None or len(segment_map) < size:
+            if segment_map is not None:
+                segment_map.close()
+            with open(self._path(base), "rb") as segment:
+                segment_map = mmap.mmap(
+                    segment.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            self._maps[base] = segment_map
+        return segment_map
+
+    def read(
+        self, offset: int, max_bytes: int, end_offset: int = None
+    ) -> Tuple[List[bytes], List[Optional[str]], int]:
+        """Read the messages from an offset.
+
+        At least one message is read if there is any, even if it is larger
+        than max_bytes.
+
+        Args:
+            offset (int): Offset of the first record.
+            max_bytes (int): Bytes of message data after which to stop.
+            end_offset (int): Offset to stop at, the end of the log if None.
+
+        Returns:
+            tuple: Data and fields of the messages, and the offset of the
+                next record.
+        """
+        messages, fields, size = [], [], 0
+        with self._lock:
+            self._file.flush()
+            end_offset = end_offset or self.end_offset
+            offset = max(offset, self.start_offset)
+            while offset < end_offset and (not messages or size < max_bytes):
+                index = next(
+                    index
+                    for index in range(len(self._segments) - 1, -1, -1)
+                    if self._segments[index] <= offset
+                )
+                base = self._segments[index]
+                if index + 1 < len(self._segments):
+                    segment_end = self._segments[index + 1]
+                else:
+                    segment_end = self.end_offset
+                if offset >= segment_end:
+                    break
+                segment_map = self._get_map(base, segment_end - base)
+                position = offset - base
+                length, _ = RECORD_HEADER.unpack_from(segment_map, position)
+                start = position + RECORD_HEADER.size
+                message_data, message_fields = decode_payload(
+                    memoryview(segment_map)[start:start + length]
+                )
+                messages.append(message_data)
+                fields.append(message_fields)
+                size += len(message_data)
+                offset = base + start + length
+        return messages, fields, offset
+
+    def commit(self, consumer: str, offset: int):
+        """Commit the offset a consumer has delivered until."""
+        with self._lock:
+            if consumer not in self.cursors:
+                return
+            self.cursors[consumer] = max(self.cursors[consumer], offset)
+            self._save_cursors()
+            self._reclaim()
+
+    def _save_cursors(self):
+        """Write the cursors atomically."""
+        path = os.path.join(self.directory, CURSORS_FILE)
+        with open(f"{path}.tmp", "w") as cursors_file:
+            json.dump(self.cursors, cursors_file)
+            cursors_file.flush()
+            os.fsync(cursors_file.fileno())
+        os.replace(f"{path}.tmp", path)
+
+    def _reclaim(self):
+        """Delete the segments all the consumers have committed past."""
+        low = min(self.cursors.values(), default=self.end_offset)
+        while len(self._segments) > 1 and self._segments[1] <= low:
+            base = self._segments.pop(0)
+            segment_map = self._maps.pop(base, None)
+            if segment_map is not None:
+                segment_map.close()
+            os.remove(self._path(base))
+
+    def close(self):
+        """Close the active segment and the memory maps."""
+        with self._lock:
+            for segment_map in self._maps.values():
+                segment_map.close()
+            self._maps = {}
+            if self._file:
+                self._file.close()
@@ -0,0 +1,46 @@
+"""Tenant state shared by the pull threads of a client."""
+
+import threading
+import time
+
+
+class TenantStateCache:
+    """Thread safe cache of a tenant state loaded from the database.
+
+    The pull threads of a client all read the same tenant state, it is
+    loaded at most once per refresh interval whichever thread asks for it.
+    """
+
+    def __init__(self, loader, refresh_interval):
+        """Tenant state cache init.
+
+        Args:
+            loader (Callable): Function loading the tenant state, the
+                exceptions it raises are propagated and nothing is cached.
+            refresh_interval (int): Seconds after which the state is loaded
+                again.
+        """
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.loads = 0
+        self._state = None
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def get(self, force=False):
+        """Get the tenant state, loading it if it is missing or expired."""
+        with self._lock:
+            if (
+                force
+                or self._loaded_at is None
+                or time.monotonic() - self._loaded_at >= self.refresh_interval
+            ):
+                self._state = self.loader()
+                self._loaded_at = time.monotonic()
+                self.loads += 1
+            return self._state
+
+    def invalidate(self):
+        """Load the state again on the next get."""
+        with self._lock:
+            self._loaded_at = None
@@ -1,22 +1,25 @@
 """WebTx helper."""
 
+import heapq
 import json
 import os
 import signal
 import queue
+import re
 import sys
 import threading
 import time
 import traceback
 import logging
 import requests
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from threading import Thread
 from typing import List
 
 from google.cloud.pubsublite.cloudpubsub import SubscriberClient
-from google.cloud.pubsublite.types import FlowControlSettings
+from google.cloud.pubsublite.types import FlowControlSettings, MessageMetadata
 from google.api_core.exceptions import Unauthenticated, Unauthorized, PermissionDenied
 from google.oauth2 import service_account
 
@@ -27,32 +30,66 @@ from netskope.common.utils.plugin_provider_helper import PluginProviderHelper
 from netskope.common.utils import Notifier
 from netskope_api.token_management.netskope_management import NetskopeTokenManagement
 from .message_transforms import message_transformer
+from .pause_controller import PauseController
+from .spill_log import SpillLog
 
 source = None
 webtx_plugin_helper = WebTxPluginHelper()
 plugin_provider_helper = PluginProviderHelper()
 notifier = Notifier()
 logger = webtx_plugin_helper.logger
-data = queue.Queue(maxsize=1000)
-push_queue = queue.Queue(maxsize=8)
+# The subscriber flow control bounds the messages delivered and not
+# acknowledged yet per partition, the queue bounds them across partitions.
+# The callback threads block once it is full.
+DATA_QUEUE_MAX_SIZE = 5000
+data = queue.Queue(maxsize=DATA_QUEUE_MAX_SIZE)
 batch_event = threading.Event()
 timeout_event = threading.Event()
 back_pressure = threading.Event()
 should_exit = False
-should_exit_push = False
 should_restart = False
 streaming_pull_future = None
-push_thread_pool = ThreadPoolExecutor(max_workers=8)
+lanes = {}
 total_batches = 1
-THREAD_COUNT = 256
+# The callback only blocks while the data queue is full, in which case more
+# threads would only queue more messages, a few keep up with the subscriber.
+THREAD_COUNT = min(32, (os.cpu_count() or 1) + 4)
 SIGKILL_WAIT_SEC = 300
 MAX_MESSAGES_OUTSTANDING = 1000
 MAX_BYTES_OUTSTANDING = 10 * 1024 * 1024
 MIN_IDLE_CONNECTION_TIMEOUT = 300
+LANE_MAX_IN_FLIGHT = 2
+LANE_RETRY_INTERVAL = 1
+LANE_MAX_RETRY_INTERVAL = 60
+# Acknowledged messages a batch refused by its full push lane can accumulate,
+# as a number of its size limit, before the subscriber is paused.
+LANE_MAX_PENDING_BATCHES = 4
+# Credit of each destination, halved when it is not keeping up and grown back
+# step by step otherwise. The share of the flow control window held back
+# never exceeds what is left of the window after the largest batch, so that
+# a batch can always fill up.
+FLOW_CONTROL_INTERVAL = 1
+FLOW_CONTROL_MIN_CREDIT = 0.1
+FLOW_CONTROL_CREDIT_STEP = 0.05
+FLOW_CONTROL_QUEUE_HIGH_WATERMARK = 1000
+FLOW_CONTROL_MAX_FLUSH_DELAY_FACTOR = 2
 ENABLE_DEBUG = os.getenv("ENABLE_DEBUG", "false").lower() == "true"
 SOURCE = None
 BACK_PRESSURE_CHECK_INTERVAL = 60
+BACK_PRESSURE_PAUSED_CHECK_INTERVAL = 5
+# Messages are spilled to an append-only log in this directory and
+# acknowledged once synced to disk if set, instead of being held in memory
+# until pushed.
+WEBTX_SPILL_DIR = os.getenv("WEBTX_SPILL_DIR")
+SPILL_SEGMENT_BYTES = 64 * 1024 * 1024
+SPILL_MAX_BYTES = int(os.getenv("WEBTX_SPILL_MAX_BYTES", 1024 * 1024 * 1024))
+# Messages appended and synced at once.
+SPILL_MAX_APPEND = 500
+SPILL_MAX_APPEND_BYTES = 4 * 1024 * 1024
+spill_log = None
 threads = []
+batch_metrics = {}
+batch_metrics_lock = threading.Lock()
 WEBTX_SUBSCRIPTION_KEY_REFRESH_INTERVAL = 24 # IN HOURS
 WEBTX_SUBSCRIPTION_KEY_REFRESH_HOUR = 3 # 3 AM UTC
 
@@ -114,9 +151,10 @@ class WebTxHelper:
                 stdout_logger.debug(
                     f"{self.log_prefix} : {msg}"
                 )
+                message.ack()
             else:
-                data.put((message.data, atributes.get("Fields")))
-            message.ack()
+                # Acknowledged by the flow controller once batched.
+                data.put((message.data, atributes.get("Fields"), message))
             stdout_logger.debug(
                 f"mlen={len(message.data)}, qlen={data.qsize()}, should_exit={should_exit}"
             )
@@ -300,7 +338,9 @@ class WebTxHelper:
             if should_exit:
                 return
             with SubscriberClient(
-                credentials=credentials, message_transformer=message_transformer
+                executor=make_default_thread_pool_executor(),
+                credentials=credentials,
+                message_transformer=message_transformer,
             ) as subscriber_client:
                 streaming_pull_future = subscriber_client.subscribe(
                     subscription_path,
@@ -341,7 +381,8 @@ def terminate_on_timeout(timeout, source):
     """Send SIGINT after 5 minutes."""
     global timeout_event, should_restart
 
-    while timeout_event.wait(timeout):
+    # No message is delivered while paused or held back by the flow control.
+    while timeout_event.wait(timeout) or is_delivery_held():
         if should_exit:
             stdout_logger.debug("Exiting thread.")
             return
@@ -368,7 +409,7 @@ def is_due_by_time(batch: Batch) -> bool:
     Returns:
         bool: Whether batch is due for push or not.
     """
-    if (datetime.now() - batch.started_at).seconds > batch.limit_time:
+    if (datetime.now() - batch.started_at).total_seconds() > batch.limit_time:
         stdout_logger.debug("Batch due by time.")
         return True
     return False
@@ -386,6 +427,394 @@ def is_due_by_size(batch: Batch, next_message: bytes = None) -> bool:
     return False
 
 
+def get_batch_deadline(batch: Batch) -> datetime:
+    """Get the time at which a batch becomes due.
+
+    A spilled batch can start with more pending bytes than its size limit,
+    it is due right away.
+    """
+    if is_due_by_size(batch):
+        return datetime.now()
+    return batch.started_at + timedelta(seconds=batch.limit_time)
+
+
+def update_batch_metrics(destination: str, **kwargs):
+    """Update the metrics of a destination.
+
+    Args:
+        destination (str): Name of the destination configuration.
+        kwargs: Metric names and values. Values of the counters
+            (`queued_batches` and `pushed_batches`) are added to the current
+            value instead of replacing it.
+    """
+    counters = (
+        "queued_batches",
+        "pushed_batches",
+    )
+    with batch_metrics_lock:
+        metrics = batch_metrics.setdefault(
+            destination,
+            {
+                "pending_messages": 0,
+                "pending_bytes": 0,
+                "queued_batches": 0,
+                "pushed_batches": 0,
+                "time_to_flush": None,
+                "push_latency": None,
+                "flushed_at": None,
+            },
+        )
+        for counter in counters:
+            metrics[counter] += kwargs.pop(counter, 0)
+        metrics.update(kwargs)
+
+
+def get_batch_metrics() -> dict:
+    """Get the batching metrics of each destination.
+
+    Returns:
+        dict: Destination name to its metrics, `pending_messages` and
+            `pending_bytes` of the batch being built, `queued_batches`
+            waiting in the push lane, `time_to_flush` and `push_latency` in
+            seconds of the last pushed batch, and the pushed counter.
+    """
+    with batch_metrics_lock:
+        return {
+            destination: dict(metrics)
+            for destination, metrics in batch_metrics.items()
+        }
+
+
+class PushLane:
+    """Push worker of a single destination.
+
+    Each destination gets its own bounded queue and thread so that a slow
+    destination only delays its own batches, until the batch it holds up
+    overflows.
+
+    The push of a spilled batch is retried with an exponential backoff until
+    it succeeds, its offset is only committed then. If the lane exits while
+    a push is failing, none of its next offsets are committed either, so the
+    batch is read from the spill log again after the restart.
+    """
+
+    def __init__(self, source: str, destination: str):
+        """Initialize.
+
+        Args:
+            source (str): Name of the source configuration.
+            destination (str): Name of the destination configuration.
+        """
+        self.source = source
+        self.destination = destination
+        self.queue = queue.Queue(maxsize=LANE_MAX_IN_FLIGHT)
+        self.refused = False
+        self.committing = True
+        self.thread = Thread(
+            target=self.run, name=f"PushLane-{destination}"
+        )
+
+    def start(self):
+        """Start the lane thread."""
+        threads.append(self.thread)
+        self.thread.start()
+
+    def offer(self, batch: Batch, on_pushed=None) -> bool:
+        """Queue a batch without blocking.
+
+        Args:
+            batch (Batch): Batch to push.
+            on_pushed (Callable): Function called once the batch has been
+                pushed, the push is retried until it succeeds if set.
+
+        Returns:
+            bool: False if the lane already has the maximum number of
+                batches in flight.
+        """
+        try:
+            self.queue.put_nowait((batch, on_pushed))
+        except queue.Full:
+            self.refused = True
+            return False
+        update_batch_metrics(self.destination, queued_batches=1)
+        return True
+
+    def put(self, batch: Batch, on_pushed=None):
+        """Queue a batch, waiting for a free slot."""
+        self.queue.put((batch, on_pushed))
+        update_batch_metrics(self.destination, queued_batches=1)
+
+    def close(self):
+        """Stop the lane once the queued batches are pushed."""
+        self.queue.put(None)
+
+    def run(self):
+        """Push the queued batches until the lane is closed."""
+        stdout_logger.debug(f"Starting push lane for {self.destination}.")
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            batch, on_pushed = item
+            pushed = self.push(batch, retry=on_pushed is not None)
+            if on_pushed and not pushed:
+                self.committing = False
+            if on_pushed and self.committing:
+                try:
+                    on_pushed()
+                except Exception as ex:
+                    stdout_logger.debug(
+                        f"{str(repr(ex))} {traceback.format_exc()}"
+                    )
+            if self.refused:
+                # Wake up the batching thread to queue the batch it holds, a
+                # full data queue wakes it up anyway.
+                self.refused = False
+                try:
+                    data.put_nowait(None)
+                except queue.Full:
+                    pass
+        stdout_logger.debug(f"Exiting push lane for {self.destination}.")
+
+    def push(self, batch: Batch, retry: bool) -> bool:
+        """Push a batch, retrying with a backoff until exiting if asked.
+
+        Returns:
+            bool: Whether the batch has been pushed.
+        """
+        delay = LANE_RETRY_INTERVAL
+        while True:
+            try:
+                push_started_at = datetime.now()
+                push_batch(self.source, batch)
+                break
+            except Exception as ex:
+                stdout_logger.debug(f"{str(repr(ex))} {traceback.format_exc()}")
+            if not retry or should_exit:
+                update_batch_metrics(self.destination, queued_batches=-1)
+                return False
+            stdout_logger.debug(
+                f"Retrying the push to {self.destination} in {delay}s."
+            )
+            retry_at = time.monotonic() + delay
+            while not should_exit and time.monotonic() < retry_at:
+                time.sleep(LANE_RETRY_INTERVAL)
+            delay = min(delay * 2, LANE_MAX_RETRY_INTERVAL)
+        now = datetime.now()
+        push_latency = (now - push_started_at).total_seconds()
+        time_to_flush = (now - batch.started_at).total_seconds()
+        update_batch_metrics(
+            self.destination,
+            queued_batches=-1,
+            pushed_batches=1,
+            push_latency=push_latency,
+            time_to_flush=time_to_flush,
+            flushed_at=now,
+        )
+        stdout_logger.debug(
+            f"Batch pushed to {self.destination}, "
+            f"push_latency={push_latency:.2f}s, "
+            f"time_to_flush={time_to_flush:.2f}s."
+        )
+        return True
+
+
+def get_partition(message) -> int:
+    """Get the partition a message was delivered from."""
+    try:
+        return MessageMetadata.decode(message.message_id).partition.value
+    except Exception:
+        return 0
+
+
+class FlowController:
+    """Adaptive credit of the subscriber partitions.
+
+    The flow control settings of the subscriber are fixed once subscribed,
+    they bound the messages and bytes of a partition delivered but not
+    acknowledged. A message is acknowledged once it has been added to the
+    batches of all the destinations, a batch refused by its full push lane
+    keeps accumulating acknowledged messages so that a slow destination does
+    not hold up the others. Each destination has its own credit, the newest
+    messages of a partition are held back for the share of the window owed
+    by the destinations that are behind, each one owing its part of the
+    window times its missing credit. The held share is capped by the window
+    left after the largest batch, otherwise a batch bigger than the credit
+    share would only be flushed by its time limit. Messages are not
+    acknowledged at all while paused, the subscriber then stops delivering.
+    """
+
+    def __init__(
+        self,
+        max_messages=MAX_MESSAGES_OUTSTANDING,
+        max_bytes=MAX_BYTES_OUTSTANDING,
+        max_batch_bytes=0,
+        destinations=(),
+    ):
+        """Initialize.
+
+        Args:
+            max_messages (int): Messages outstanding of the subscriber flow
+                control settings.
+            max_bytes (int): Bytes outstanding of the subscriber flow
+                control settings.
+            max_batch_bytes (int): Size limit of the largest batch.
+            destinations (Iterable): Names of the destinations.
+        """
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_held_share = max(1 - max_batch_bytes / max_bytes, 0)
+        self.credits = dict.fromkeys(destinations, 1.0)
+        self.held = {}
+        self.held_bytes = {}
+        self.paused = False
+        self.adjusted_at = time.monotonic()
+
+    def get_held_share(self) -> float:
+        """Get the share of the window held back for the destinations."""
+        if not self.credits:
+            return 0
+        owed = sum(1 - credit for credit in self.credits.values())
+        return min(owed / len(self.credits), self.max_held_share)
+
+    def buffered(self, message, size: int):
+        """Acknowledge a message added to all the batches, as the credit allows.
+
+        Args:
+            message: Message received from the subscriber.
+            size (int): Size of the message data.
+        """
+        partition = get_partition(message)
+        self.held.setdefault(partition, deque()).append((message, size))
+        self.held_bytes[partition] = self.held_bytes.get(partition, 0) + size
+        self.release(partition)
+
+    def release(self, partition: int):
+        """Acknowledge the held messages of a partition the credit allows."""
+        if self.paused:
+            return
+        held = self.held[partition]
+        held_share = self.get_held_share()
+        min_messages = held_share * self.max_messages
+        min_bytes = held_share * self.max_bytes
+        while held:
+            message, size = held[0]
+            if (
+                len(held) - 1 < min_messages
+                and self.held_bytes[partition] - size < min_bytes
+            ):
+                break
+            held.popleft()
+            self.held_bytes[partition] -= size
+            message.ack()
+
+    def release_all(self):
+        """Acknowledge all the held messages."""
+        for partition, held in self.held.items():
+            while held:
+                held.popleft()[0].ack()
+            self.held_bytes[partition] = 0
+
+    def set_paused(self, paused: bool):
+        """Stop or resume acknowledging messages, which pauses the subscriber."""
+        if paused == self.paused:
+            return
+        self.paused = paused
+        if not paused:
+            for partition in self.held:
+                self.release(partition)
+
+    def is_throttled(self) -> bool:
+        """Check if the credit of a destination is at its minimum."""
+        return any(
+            credit <= FLOW_CONTROL_MIN_CREDIT
+            for credit in self.credits.values()
+        )
+
+    def is_due(self) -> bool:
+        """Check if the credits are due for adjustment."""
+        return time.monotonic() - self.adjusted_at >= FLOW_CONTROL_INTERVAL
+
+    def adjust(self, slow_destinations: set):
+        """Halve the credit of the slow destinations, grow the others by a step."""
+        self.adjusted_at = time.monotonic()
+        held_share = self.get_held_share()
+        for destination, credit in self.credits.items():
+            if destination in slow_destinations:
+                self.credits[destination] = max(
+                    FLOW_CONTROL_MIN_CREDIT, credit / 2
+                )
+            else:
+                self.credits[destination] = min(
+                    1.0, credit + FLOW_CONTROL_CREDIT_STEP
+                )
+            if self.credits[destination] != credit:
+                stdout_logger.debug(
+                    f"Flow control credit of {destination} changed from "
+                    f"{credit:.2f} to {self.credits[destination]:.2f}."
+                )
+        if self.get_held_share() < held_share:
+            for partition in self.held:
+                self.release(partition)
+
+    def get_metrics(self) -> dict:
+        """Get the credits and the held messages and bytes of each partition."""
+        return {
+            "credit": dict(self.credits),
+            "held_messages": {
+                partition: len(held) for partition, held in self.held.items()
+            },
+            "held_bytes": dict(self.held_bytes),
+        }
+
+
+def get_slow_destinations(batches: List[Batch]) -> set:
+    """Get the destinations not keeping up with the subscriber.
+
+    A destination is not when its push lane is full or its last batch took
+    too long to flush, all of them are not when the data queue is deep.
+    """
+    if data.qsize() >= FLOW_CONTROL_QUEUE_HIGH_WATERMARK:
+        return {batch.destination for batch in batches}
+    metrics = get_batch_metrics()
+    slow_destinations = set()
+    for batch in batches:
+        time_to_flush = metrics.get(batch.destination, {}).get("time_to_flush")
+        if lanes[batch.destination].queue.full() or (
+            time_to_flush
+            and time_to_flush
+            > batch.limit_time * FLOW_CONTROL_MAX_FLUSH_DELAY_FACTOR
+        ):
+            slow_destinations.add(batch.destination)
+    return slow_destinations
+
+
+def is_batch_overflowing(batch: Batch) -> bool:
+    """Check if a batch held by its full push lane has grown too large."""
+    return (
+        batch.size
+        >= batch.limit_size * 1024 * 1024 * LANE_MAX_PENDING_BATCHES
+    )
+
+
+def is_delivery_held() -> bool:
+    """Check if the subscriber is kept from delivering messages on purpose.
+
+    It is while paused, including once the spill log is full, while the
+    credit of a destination is at its minimum or while a push lane is full.
+    """
+    return (
+        back_pressure.is_set()
+        or flow_controller.paused
+        or (spill_log is not None and spill_log.get_size() >= SPILL_MAX_BYTES)
+        or flow_controller.is_throttled()
+        or any(lane.queue.full() for lane in list(lanes.values()))
+    )
+
+
+flow_controller = FlowController()
+
+
 def create_from_existing(batch: Batch) -> Batch:
     """Reset a batch.
 
@@ -412,30 +841,206 @@ def create_from_existing(batch: Batch) -> Batch:
 def add_message_to_batch(
     batch: Batch, message_data: bytes, message_fields: str
 ):
-    """Add a message to batch."""
+    """Add a message to batch.
+
+    The message bytes are shared by reference between the batches of all the
+    destinations, fields are only kept for SIEM destinations that parse them.
+    """
     batch.messages.append(message_data)
-    batch.fields.append(message_fields)
+    if batch.isSIEM:
+        batch.fields.append(message_fields)
     batch.size += len(message_data)
 
 
-def evaluate_batch(batch: Batch, message: tuple = None) -> Batch:
+class SpillReader:
+    """Read offset of a batch in the spill log.
+
+    A spilled batch only counts the bytes of its messages, they are read
+    from the log when the batch is flushed, up to its size limit at a time.
+    The offset is committed once the batch has been pushed, so the log is
+    read again from there after a restart.
+    """
+
+    def __init__(self, consumer: str):
+        """Initialize.
+
+        Args:
+            consumer (str): Name of the batch in the spill log cursors.
+        """
+        self.consumer = consumer
+        self.offset = spill_log.get_cursor(consumer)
+
+    def get_pending_bytes(self) -> int:
+        """Get the bytes of the log not read yet."""
+        return max(spill_log.end_offset - self.offset, 0)
+
+    def read(self, batch: Batch, pending: int):
+        """Read the next messages of a batch from the log.
+
+        Args:
+            batch (Batch): Batch to read the messages in.
+            pending (int): Bytes of messages pending for the batch.
+
+        Returns:
+            tuple: Function committing the offset after the messages, and
+                the bytes still pending after them.
+        """
+        messages, fields, offset = spill_log.read(
+            self.offset, batch.limit_size * 1024 * 1024
+        )
+        batch.messages = messages
+        if batch.isSIEM:
+            batch.fields = fields
+        batch.size = sum(len(message) for message in messages)
+        self.offset = offset
+        remaining = 0
+        if self.get_pending_bytes():
+            remaining = max(pending - batch.size, 1)
+        return (
+            lambda: spill_log.commit(self.consumer, offset),
+            remaining,
+        )
+
+
+def flush_batch(batch: Batch, reader: SpillReader = None) -> Batch:
+    """Queue a batch in its destination lane and start a new batch.
+
+    Empty batches are not queued, only their window is restarted. If the
+    lane is full the same batch is returned so it keeps accumulating, the
+    subscriber is paused once it overflows. Spilled batches keep
+    accumulating in the spill log instead.
+    """
+    remaining = 0
+    if batch.messages or (reader and batch.size):
+        lane = lanes[batch.destination]
+        on_pushed = None
+        pending = batch.size
+        if reader and not lane.queue.full():
+            on_pushed, remaining = reader.read(batch, pending)
+        if lane.offer(batch, on_pushed):
+            stdout_logger.debug(
+                f"Adding to push lane of {batch.destination} "
+                f"qlen={lane.queue.qsize()}"
+            )
+        else:
+            stdout_logger.debug(
+                f"Push lane of {batch.destination} is full, holding the batch."
+            )
+            return batch
+        update_batch_metrics(
+            batch.destination, pending_messages=0, pending_bytes=remaining
+        )
+    new_batch = create_from_existing(batch)
+    new_batch.size = remaining
+    return new_batch
+
+
+def evaluate_batch(
+    batch: Batch, message: tuple = None, reader: SpillReader = None
+) -> Batch:
     """Evaluate a batch."""
     message_data = None
     if message:
         message_data, message_fields = message
-        add_message_to_batch(batch, message_data, message_fields)
+        if reader:
+            batch.size += len(message_data)
+        else:
+            add_message_to_batch(batch, message_data, message_fields)
 
     if is_due_by_size(batch, message_data) or is_due_by_time(batch):
-        push_queue.put(batch)
-        stdout_logger.debug(f"Adding to push queue qlen={push_queue.qsize()}")
-        batch = create_from_existing(batch)
+        batch = flush_batch(batch, reader)
     return batch
 
 
+def open_spill_log(source: str, batches: List[Batch]) -> List[SpillReader]:
+    """Open the spill log of a source and create the readers of its batches.
+
+    The batches start with the bytes left in the log by the previous run.
+    Cursors are keyed by the destination name, and by the destination and
+    business rule names for a destination that has several rules, so they
+    do not depend on the order of the configurations.
+    """
+    global spill_log
+    spill_log = SpillLog(
+        os.path.join(WEBTX_SPILL_DIR, re.sub(r"[^\w.-]", "_", source)),
+        SPILL_SEGMENT_BYTES,
+    )
+    destinations = [batch.destination for batch in batches]
+    consumers = [
+        batch.destination
+        if destinations.count(batch.destination) == 1
+        else f"{batch.destination}#{batch.rule}"
+        for batch in batches
+    ]
+    spill_log.register(consumers)
+    readers = [SpillReader(consumer) for consumer in consumers]
+    for batch, reader in zip(batches, readers):
+        batch.size = reader.get_pending_bytes()
+    return readers
+
+
+def receive_messages(message: tuple) -> tuple:
+    """Take the messages waiting in the data queue after a first one.
+
+    Used to sync several messages to the spill log at once.
+
+    Returns:
+        tuple: The messages, and whether a push lane asked to be woken up.
+    """
+    messages = [message]
+    size = len(message[0])
+    woken = False
+    while len(messages) < SPILL_MAX_APPEND and size < SPILL_MAX_APPEND_BYTES:
+        try:
+            message = data.get_nowait()
+            data.task_done()
+        except queue.Empty:
+            break
+        if message is None:
+            woken = True
+        else:
+            messages.append(message)
+            size += len(message[0])
+    return messages, woken
+
+
+def push_batch(source: str, batch: Batch):
+    """Ingest a batch into its destination."""
+    if not batch.messages:
+        return
+    if not batch.isSIEM:
+        webtx_plugin_helper.execute_cls_ingest_task(
+            args=[
+                source,
+                batch.destination,
+                batch.messages,
+                "webtx",
+                "2.0.0",
+            ]
+        )
+    else:
+        webtx_plugin_helper.execute_cls_parse_and_ingest_task(
+            args=[
+                source,
+                batch.destination,
+                batch.rule,
+                batch.messages,
+                batch.fields,
+            ]
+        )
+
+
 # thread
 def check_batches(source: str):
-    """Check batches thread."""
-    global should_exit_push, total_batches
+    """Check batches thread.
+
+    Blocks on the data queue until either a message arrives or the earliest
+    batch deadline is reached, the deadlines of all destinations are kept in
+    a heap. Full batches are handed over to the push lane of their
+    destination. If spilling is enabled, messages are appended to the spill
+    log and acknowledged before being batched.
+    """
+    global total_batches, flow_controller
     try:
         webtx_destination_plugins = webtx_plugin_helper.get_webtx_destination_plugin_ids()
         webtx_destination_configurations = webtx_plugin_helper.get_webtx_destination_configurations(
@@ -445,6 +1050,7 @@ def check_batches(source: str):
         )
         stdout_logger.debug(f"Found {configured_plugins} configured plugin(s).")
         batches = []
+        lanes.clear()
         for rule, configuration in configured_plugins:
             params = configuration.get("parameters")
             batch = Batch()
@@ -460,73 +1066,162 @@ def check_batches(source: str):
             batch.limit_size = params.get("max_file_size", 5)
             batch.limit_time = params.get("max_duration", 30)
             batches.append(batch)
+            if batch.destination not in lanes:
+                lanes[batch.destination] = PushLane(source, batch.destination)
+                lanes[batch.destination].start()
+            update_batch_metrics(batch.destination)
         if not batches:
-            should_exit_push = True
             batch_event.set()
             handle_interrupt()
             return
+        flow_controller = FlowController(
+            max_batch_bytes=max(batch.limit_size for batch in batches)
+            * 1024
+            * 1024,
+            destinations=lanes,
+        )
         total_batches = len(batches)
+        readers = [None] * len(batches)
+        if WEBTX_SPILL_DIR:
+            readers = open_spill_log(source, batches)
         batch_event.set()
         stdout_logger.debug(f"Created {len(batches)} batche(s).")
+        # Heap of (deadline, index, generation), entries whose generation
+        # does not match the current batch of the index are stale.
+        generations = [0] * len(batches)
+        # Whether a retry of the flush of a batch refused by its full push
+        # lane is already scheduled.
+        retrying = [False] * len(batches)
+        deadlines = [
+            (get_batch_deadline(batch), index, 0)
+            for index, batch in enumerate(batches)
+        ]
+        heapq.heapify(deadlines)
         while not data.empty() or not should_exit:
-            message = None
+            timeout = max(
+                min(
+                    (deadlines[0][0] - datetime.now()).total_seconds(),
+                    FLOW_CONTROL_INTERVAL,
+                ),
+                0,
+            )
+            messages = []
+            woken = False
             try:
-                message = data.get_nowait()
+                message = data.get(timeout=timeout)
                 data.task_done()
+                if message is None:
+                    woken = True
+                elif spill_log:
+                    messages, woken = receive_messages(message)
+                    spill_log.append(
+                        [
+                            (message_data, message_fields)
+                            for message_data, message_fields, _ in messages
+                        ]
+                    )
+                else:
+                    messages = [message]
             except queue.Empty:
-                time.sleep(0.5)
-            finally:
-                batches = [evaluate_batch(batch, message) for batch in batches]
+                pass
+            if woken:
+                # A push lane has room again, retry the refused flushes
+                # now, their pending retries become stale.
+                for index, is_retrying in enumerate(retrying):
+                    if is_retrying:
+                        generations[index] += 1
+                        heapq.heappush(
+                            deadlines,
+                            (datetime.now(), index, generations[index]),
+                        )
+            for message_data, message_fields, received in messages:
+                message = (message_data, message_fields)
+                for index, batch in enumerate(batches):
+                    new_batch = evaluate_batch(batch, message, readers[index])
+                    if new_batch is not batch:
+                        generations[index] += 1
+                        retrying[index] = False
+                        heapq.heappush(
+                            deadlines,
+                            (
+                                get_batch_deadline(new_batch),
+                                index,
+                                generations[index],
+                            ),
+                        )
+                    elif not retrying[index] and is_due_by_size(batch):
+                        # Push lane is full, retry after a while as the
+                        # subscriber may not deliver any message until then.
+                        retrying[index] = True
+                        heapq.heappush(
+                            deadlines,
+                            (
+                                datetime.now()
+                                + timedelta(seconds=LANE_RETRY_INTERVAL),
+                                index,
+                                generations[index],
+                            ),
+                        )
+                    batches[index] = new_batch
+                    update_batch_metrics(
+                        new_batch.destination,
+                        pending_messages=len(new_batch.messages),
+                        pending_bytes=new_batch.size,
+                    )
+                flow_controller.buffered(received, len(message_data))
+            now = datetime.now()
+            while deadlines and deadlines[0][0] <= now:
+                _, index, generation = heapq.heappop(deadlines)
+                if generation != generations[index]:
+                    continue
+                stdout_logger.debug("Batch due by time.")
+                batch = batches[index]
+                new_batch = flush_batch(batch, readers[index])
+                if new_batch is batch:
+                    # Push lane is full, retry after a while.
+                    retrying[index] = True
+                    deadline = now + timedelta(seconds=LANE_RETRY_INTERVAL)
+                else:
+                    retrying[index] = False
+                    generations[index] += 1
+                    batches[index] = new_batch
+                    deadline = get_batch_deadline(new_batch)
+                heapq.heappush(
+                    deadlines, (deadline, index, generations[index])
+                )
+            # The spill log absorbs slow destinations, it is bounded by
+            # pausing the subscriber instead of adjusting the credit.
+            flow_controller.set_paused(
+                back_pressure.is_set()
+                or (
+                    spill_log is not None
+                    and spill_log.get_size() >= SPILL_MAX_BYTES
+                )
+                or (
+                    spill_log is None
+                    and any(is_batch_overflowing(batch) for batch in batches)
+                )
+            )
+            if spill_log is None and flow_controller.is_due():
+                flow_controller.adjust(get_slow_destinations(batches))
         if should_exit and batches:
-            for batch in batches:
-                push_queue.put(batch)
+            # Spilled messages not read yet are left in the log, they are
+            # read again after the restart.
+            for batch, reader in zip(batches, readers):
+                if not reader and batch.messages:
+                    lanes[batch.destination].put(batch)
+                    update_batch_metrics(
+                        batch.destination, pending_messages=0, pending_bytes=0
+                    )
     except Exception:
-        should_exit_push = True
         handle_interrupt()
     finally:
-        should_exit_push = True
+        flow_controller.release_all()
+        for lane in lanes.values():
+            lane.close()
         stdout_logger.debug("Exiting thread.")
 
 
-# thread
-def push_batches(source):
-    """Push batches thread."""
-    global should_exit_push
-
-    stdout_logger.debug("Starting.")
-    while not push_queue.empty() or not should_exit_push:
-        try:
-            batch: Batch = push_queue.get_nowait()
-            if batch.messages:
-                if not batch.isSIEM:
-                    webtx_plugin_helper.execute_cls_ingest_task(
-                        args=[
-                            source,
-                            batch.destination,
-                            batch.messages,
-                            "webtx",
-                            "2.0.0",
-                        ]
-                    )
-                else:
-                    webtx_plugin_helper.execute_cls_parse_and_ingest_task(
-                        args=[
-                            source,
-                            batch.destination,
-                            batch.rule,
-                            batch.messages,
-                            batch.fields,
-                        ]
-                    )
-            stdout_logger.debug("Batch pushed.")
-            push_queue.task_done()
-        except queue.Empty:
-            time.sleep(0.5)
-        except Exception as ex:
-            stdout_logger.debug(f"{str(repr(ex))} {traceback.format_exc()}")
-    stdout_logger.debug("Exiting thread.")
-
-
 def handle_interrupt(signum=None, frame=None):
     """Handle interrupt."""
     global streaming_pull_future, should_exit
@@ -542,28 +1237,39 @@ def handle_interrupt(signum=None, frame=None):
     stdout_logger.debug("Terminating WebTx process.")
     should_exit = True
     timeout_event.set()
+    try:
+        # Wake up the batching thread if it is waiting for a message.
+        data.put_nowait(None)
+    except queue.Full:
+        pass
+
+
+pause_controller = PauseController(
+    lambda: not webtx_plugin_helper.back_pressure_mechanism(True),
+    logger=logger,
+    name="Web transaction pulling",
+    check_interval=BACK_PRESSURE_CHECK_INTERVAL,
+    paused_check_interval=BACK_PRESSURE_PAUSED_CHECK_INTERVAL,
+)
 
 
 def monitor_back_pressure():
-    """Monitor back pressure constantly."""
-    while True:
-        global should_restart
-        if not webtx_plugin_helper.back_pressure_mechanism(True):
-            stdout_logger.debug("Back pressure hit. Pulling will be stopped.")
+    """Monitor back pressure constantly.
+
+    The subscriber is paused while under back pressure instead of exiting
+    the process, the flow controller stops acknowledging messages so the
+    subscriber stops delivering until it is resumed.
+    """
+    while not should_exit:
+        if pause_controller.poll():
             back_pressure.set()
-            should_restart = True
-            logger.info(
-                "Web transaction process exiting due to back pressure."
-            )
-            stdout_logger.debug("Exiting thread.")
-            handle_interrupt()
         else:
-            stdout_logger.debug("Back pressure is normal.")
             back_pressure.clear()
-        if should_exit:
-            stdout_logger.debug("Exiting thread.")
-            return
-        time.sleep(BACK_PRESSURE_CHECK_INTERVAL)
+        stdout_logger.debug(
+            f"Back pressure metrics: {pause_controller.get_metrics()}."
+        )
+        time.sleep(pause_controller.get_check_interval())
+    stdout_logger.debug("Exiting thread.")
 
 
 def main(source, log_prefix):
@@ -588,16 +1294,16 @@ def main(source, log_prefix):
         )
         threads.append(timeout_thread)
         timeout_thread.start()
-        push_thread = Thread(target=push_batches, args=(source,))
-        threads.append(push_thread)
-        push_thread.start()
         subscriber_thread = Thread(target=webtx.run)
         threads.append(subscriber_thread)
         stdout_logger.debug("Subscriber thread starting.")
         subscriber_thread.start()
         subscriber_thread.join()
         check_thread.join()
-        push_thread.join()
+        for lane in list(lanes.values()):
+            lane.thread.join()
+        if spill_log:
+            spill_log.close()
         timeout_thread.join()
         back_pressure_thread.join()
     except KeyboardInterrupt:
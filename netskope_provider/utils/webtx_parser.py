@@ -1,8 +1,81 @@
 """Webtx parser."""
 
+import csv
 import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 FIELD_REGEX = r"\"(?:(?:[^\"]|\"\")*)\"|(?:\S+)"
+FIELD_PATTERN = re.compile(FIELD_REGEX)
+FIELDS_DIRECTIVE = "#Fields:"
+EMPTY_VALUE = "-"
+EMPTY_VALUES = {EMPTY_VALUE: None}
+FIELD_PLAN_CACHE_SIZE = 64
+# WebTx logs are space delimited with double quoted values where the quote is
+# escaped by doubling it, which is what the C csv reader understands natively.
+CSV_DIALECT = {
+    "delimiter": " ",
+    "quotechar": '"',
+    "doublequote": True,
+    "skipinitialspace": True,
+    "strict": True,
+}
+# Content the csv reader would tokenize differently than FIELD_REGEX. Messages
+# containing any of these are parsed line by line with the regex instead.
+CSV_FALLBACK_MARKERS = ('"-"', "\t", "\r", " \n")
+# Unquoted values containing a doubled quote, which the regex unescapes and
+# the csv reader keeps as they are.
+UNQUOTED_DOUBLE_QUOTE_PATTERN = re.compile(r'(?:^|\s)[^"\s]\S*""')
+
+
+@lru_cache(maxsize=FIELD_PLAN_CACHE_SIZE)
+def get_field_plan(fields: str) -> Tuple[str, ...]:
+    """Return the ordered field names for a `Fields` attribute.
+
+    The plan is cached per distinct attribute value so the header is only
+    split once per schema instead of once per message.
+    """
+    if fields.startswith(FIELDS_DIRECTIVE):
+        fields = fields[len(FIELDS_DIRECTIVE):].strip()  # noqa: E203
+    return tuple(fields.split(" "))
+
+
+def unquote(value: str) -> str:
+    """Remove the surrounding quotes and unescape doubled quotes."""
+    if value.startswith('"') and value.endswith('"'):
+        value = value[1:-1]
+    return value.replace('""', '"')
+
+
+def split_log(log: str) -> List[str]:
+    """Split a single log line into values, empty values become None."""
+    return [
+        None if token == EMPTY_VALUE else unquote(token)
+        for token in FIELD_PATTERN.findall(log)
+    ]
+
+
+def split_message(message: str) -> List[List[str]]:
+    """Split all the log lines of a message into values.
+
+    The whole message is tokenized in a single pass of the csv reader. If the
+    message contains anything the reader would tokenize differently, it falls
+    back to the quote-aware regex per line. Empty values become None.
+    """
+    lines = message.split("\n")
+    if (
+        not message.endswith(" ")
+        and not any(marker in message for marker in CSV_FALLBACK_MARKERS)
+        and not UNQUOTED_DOUBLE_QUOTE_PATTERN.search(message)
+    ):
+        try:
+            rows = list(csv.reader(lines, **CSV_DIALECT))
+            if len(rows) == len(lines):
+                get = EMPTY_VALUES.get
+                return [list(map(get, row, row)) for row in rows]
+        except csv.Error:
+            pass
+    return [split_log(log) for log in lines]
 
 
 class WebtxParser:
@@ -11,6 +84,7 @@ class WebtxParser:
     def __init__(self, allow_empty_values):
         """Webtx parser init."""
         self.allow_empty_values = allow_empty_values
+        self._fields = ()
 
     @property
     def fields(self):
@@ -20,25 +94,62 @@ class WebtxParser:
     @fields.setter
     def fields(self, fields: str):
         """Fields."""
-        DIRECTIVE = "#Fields:"
-        if fields.startswith(DIRECTIVE):
-            fields = fields[len(DIRECTIVE):].strip()  # noqa: E203
-        self._fields = fields.split(" ")
+        self._fields = get_field_plan(fields)
 
     def parse(self, log: str) -> dict:
         """Parse."""
         if self.allow_empty_values:
-            return {
-                self.fields[i]: (
-                    v[1:-1] if v.startswith('"') and v.endswith('"') else v
-                ).replace('""', '"') if v != "-" else None
-                for i, v in enumerate(re.findall(FIELD_REGEX, log))
-            }
-        else:
-            return {
-                self.fields[i]: (
-                    v[1:-1] if v.startswith('"') and v.endswith('"') else v
-                ).replace('""', '"')
-                for i, v in enumerate(re.findall(FIELD_REGEX, log))
-                if v != "-"
+            return dict(zip(self._fields, split_log(log)))
+        return {
+            field: value
+            for field, value in zip(self._fields, split_log(log))
+            if value is not None
+        }
+
+    def parse_message(self, message: str) -> List[dict]:
+        """Parse all the log lines of a decompressed message."""
+        fields = self._fields
+        rows = split_message(message)
+        if self.allow_empty_values:
+            return [dict(zip(fields, row)) for row in rows]
+        return [
+            {
+                field: value
+                for field, value in zip(fields, row)
+                if value is not None
             }
+            for row in rows
+        ]
+
+    def parse_message_columnar(
+        self, message: str, columns: Dict[str, List] = None
+    ) -> Dict[str, List]:
+        """Parse a decompressed message into a list of values per field.
+
+        Empty values are always returned as None, so that every column keeps
+        the same length regardless of `allow_empty_values`.
+
+        Args:
+            message (str): Decompressed message.
+            columns (Dict[str, List], optional): Existing columns to append
+                to, used to accumulate multiple messages.
+
+        Returns:
+            Dict[str, List]: Mapping of field name to its column of values.
+        """
+        if columns is None:
+            columns = {}
+        rows = len(next(iter(columns.values()))) if columns else 0
+        for field in self._fields:
+            if field not in columns:
+                columns[field] = [None] * rows
+        targets = [columns[field] for field in self._fields]
+        for row in split_message(message):
+            for column, value in zip(targets, row):
+                column.append(value)
+            rows += 1
+            if len(row) < len(targets) or len(targets) < len(columns):
+                for column in columns.values():
+                    if len(column) < rows:
+                        column.append(None)
+        return columns
@@ -1,10 +1,12 @@
 """Netskope CRE plugin."""
 
 import json
+import math
 import os
 import re
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 
 import requests
@@ -45,7 +47,10 @@ from .utils.constants import (
     ADD_REMOVE_USER_BATCH_SIZE,
     APP_INSTANCE_BATCH_SIZE,
     TAG_APP_BATCH_SIZE,
+    SCIM_MAX_WORKERS,
+    SCIM_MAX_FILTER_LOOKUPS,
 )
+from .utils.scim_directory import ScimDirectory, get_scim_directory
 
 plugin_provider_helper = PluginProviderHelper()
 
@@ -572,6 +577,126 @@ class NetskopePlugin(PluginBase):
             ActionWithoutParams(label="No actions", value="generate"),
         ]
 
+    def _get_scim_page(
+        self,
+        session: requests.Session,
+        resource: str,
+        start_at: int,
+        count: int,
+        error_codes: List[str],
+        message: str,
+        log_in_status_check: Optional[bool] = None,
+        scim_filter: Optional[str] = None,
+    ) -> Dict:
+        """Get a page of SCIM resources.
+
+        Args:
+            session (requests.Session): Session to send the request with.
+            resource (str): Key of the SCIM endpoint in URLS.
+            start_at (int): SCIM start index of the page.
+            count (int): Number of resources in the page.
+            error_codes (List[str]): Error codes of the request and status.
+            message (str): Error message.
+            log_in_status_check (bool, optional): Log in status check.
+            scim_filter (str, optional): SCIM filter of the resources.
+
+        Returns:
+            Dict: SCIM list response.
+        """
+        headers = {
+            "Netskope-API-Token": resolve_secret(
+                self.tenant.parameters.get("v2token")
+            )
+        }
+        params = {"count": count, "startIndex": start_at}
+        if scim_filter:
+            params["filter"] = scim_filter
+        success, page = handle_exception(
+            session.get,
+            error_code=error_codes[0],
+            custom_message=message,
+            plugin=PLUGIN,
+            url=(
+                f"{self.tenant.parameters.get('tenantName').replace(' ', '')}"
+                f"{URLS.get(resource)}"
+            ),
+            headers=add_installation_id(add_user_agent(headers)),
+            params=params,
+            proxies=self.proxy,
+        )
+        if not success:
+            raise page
+        status_kwargs = {}
+        if log_in_status_check is not None:
+            status_kwargs["log"] = log_in_status_check
+        page = handle_status_code(
+            page,
+            error_code=error_codes[1],
+            custom_message=message,
+            plugin=PLUGIN,
+            notify=False,
+            **status_kwargs,
+        )
+        if not isinstance(page, dict):
+            page = json.loads(page)
+        return page
+
+    def _get_scim_resources(
+        self,
+        resource: str,
+        error_codes: List[str],
+        message: str,
+        log_in_status_check: Optional[bool] = None,
+    ) -> List:
+        """Get all the SCIM resources of an endpoint.
+
+        The first page gives the total number of resources, the other pages
+        are fetched concurrently. Pages are fetched one after the other
+        until an empty page if the total is not returned.
+
+        Args:
+            resource (str): Key of the SCIM endpoint in URLS.
+            error_codes (List[str]): Error codes of the request and status.
+            message (str): Error message.
+            log_in_status_check (bool, optional): Log in status check.
+
+        Returns:
+            List: List of all the resources.
+        """
+        session = requests.Session()
+
+        def get_page(start_at):
+            return self._get_scim_page(
+                session,
+                resource,
+                start_at,
+                PAGE_SIZE,
+                error_codes,
+                message,
+                log_in_status_check,
+            )
+
+        first_page = get_page(1)
+        all_resources = first_page.get("Resources", [])
+        total = first_page.get("totalResults")
+        if not all_resources:
+            return all_resources
+        if not isinstance(total, int):
+            start_at = 1 + PAGE_SIZE
+            while True:
+                resources_in_page = get_page(start_at).get("Resources", [])
+                if not resources_in_page:
+                    break
+                all_resources += resources_in_page
+                start_at += PAGE_SIZE
+            return all_resources
+        with ThreadPoolExecutor(max_workers=SCIM_MAX_WORKERS) as executor:
+            for page in executor.map(
+                get_page, range(1 + PAGE_SIZE, total + 1, PAGE_SIZE)
+            ):
+                all_resources += page.get("Resources", [])
+        return all_resources
+
     def _get_all_groups(
         self, log_in_status_check=False
     ) -> List:
@@ -583,45 +708,12 @@ class NetskopePlugin(PluginBase):
         Returns:
             List: List of all the groups.
         """
-        all_groups = []
-        start_at = 1
-        while True:
-            headers = {
-                "Netskope-API-Token": resolve_secret(
-                    self.tenant.parameters.get("v2token")
-                )
-            }
-            success, groups = handle_exception(
-                requests.get,
-                error_code="CRE_1015",
-                custom_message="Error occurred while fetching groups",
-                plugin=PLUGIN,
-                url=(
-                    f"{self.tenant.parameters.get('tenantName').replace(' ', '')}"
-                    f"{URLS.get('V2_SCIM_GROUPS')}"
-                ),
-                headers=add_installation_id(add_user_agent(headers)),
-                params={"count": PAGE_SIZE, "startIndex": start_at},
-                proxies=self.proxy,
-            )
-            if not success:
-                raise groups
-            groups = handle_status_code(
-                groups,
-                error_code="CRE_1028",
-                custom_message="Error occurred while fetching groups",
-                plugin=PLUGIN,
-                notify=False,
-                log=log_in_status_check,
-            )
-            if not isinstance(groups, dict):
-                groups = json.loads(groups)
-            groups_in_page = groups.get("Resources", [])
-            if not groups_in_page:
-                break
-            all_groups += groups_in_page
-            start_at += PAGE_SIZE
-        return all_groups
+        return self._get_scim_resources(
+            "V2_SCIM_GROUPS",
+            ["CRE_1015", "CRE_1028"],
+            "Error occurred while fetching groups",
+            log_in_status_check,
+        )
 
     def _get_all_users(self) -> List:
         """Get list of all the users.
@@ -629,41 +721,142 @@ class NetskopePlugin(PluginBase):
         Returns:
             List: List of all the users.
         """
-        all_users = []
-        start_at = 1
-        while True:
-            headers = {
-                "Netskope-API-Token": resolve_secret(
-                    self.tenant.parameters.get("v2token")
+        return self._get_scim_resources(
+            "V2_SCIM_USERS",
+            ["CRE_1016", "CRE_1029"],
+            "Error occurred while fetching users",
+        )
+
+    def _get_scim_directory(self) -> ScimDirectory:
+        """Get the SCIM directory index of the tenant."""
+        return get_scim_directory(
+            self.tenant.parameters.get("tenantName").replace(" ", "")
+        )
+
+    def _lookup_users_by_email(self, emails: List[str]) -> Dict[str, Dict]:
+        """Look up users with a SCIM filter on their email.
+
+        The lookups are sent concurrently and the users found are added to
+        the SCIM directory index.
+
+        Args:
+            emails (List[str]): Emails to look up.
+
+        Returns:
+            Dict[str, Dict]: Email to user, for the users found.
+        """
+        session = requests.Session()
+        directory = self._get_scim_directory()
+
+        def lookup(email):
+            escaped_email = email.replace("\\", "\\\\").replace('"', '\\"')
+            page = self._get_scim_page(
+                session,
+                "V2_SCIM_USERS",
+                1,
+                PAGE_SIZE,
+                ["CRE_1016", "CRE_1029"],
+                "Error occurred while fetching users",
+                scim_filter=f'emails eq "{escaped_email}"',
+            )
+            return self._find_user_by_email(page.get("Resources", []), email)
+
+        users = {}
+        with ThreadPoolExecutor(max_workers=SCIM_MAX_WORKERS) as executor:
+            for email, user in zip(emails, executor.map(lookup, emails)):
+                if user is not None:
+                    directory.add_user(user)
+                    users[email] = user
+        return users
+
+    def _get_users_by_email(self, emails: List[str]) -> Dict[str, Dict]:
+        """Get the users of a list of emails.
+
+        Emails are resolved from the SCIM directory index of the tenant
+        while it is valid, a few emails missing from it are looked up with
+        a SCIM filter and more than that reload the index. Without a valid
+        index, the users are looked up with
+        a filter if that takes fewer requests than loading the whole user
+        directory, otherwise the directory is loaded and indexed.
+
+        Args:
+            emails (List[str]): Emails of the users.
+
+        Returns:
+            Dict[str, Dict]: Email to user, for the users found.
+        """
+        emails = list(dict.fromkeys(emails))
+        directory = self._get_scim_directory()
+        is_loaded = False
+        if not directory.has_users():
+            total = self._get_scim_page(
+                requests.Session(),
+                "V2_SCIM_USERS",
+                1,
+                1,
+                ["CRE_1016", "CRE_1029"],
+                "Error occurred while fetching users",
+            ).get("totalResults")
+            if isinstance(total, int) and len(emails) < math.ceil(
+                total / PAGE_SIZE
+            ):
+                return self._lookup_users_by_email(emails)
+            directory.set_users(self._get_all_users())
+            is_loaded = True
+        users, missing_emails = self._resolve_users_by_email(
+            directory, emails
+        )
+        if missing_emails and not is_loaded:
+            if len(missing_emails) <= SCIM_MAX_FILTER_LOOKUPS:
+                users.update(self._lookup_users_by_email(missing_emails))
+            else:
+                directory.set_users(self._get_all_users())
+                found, _ = self._resolve_users_by_email(
+                    directory, missing_emails
                 )
-            }
-            success, users = handle_exception(
-                requests.get,
-                error_code="CRE_1016",
-                custom_message="Error occurred while fetching users",
-                plugin=PLUGIN,
-                url=f"{self.tenant.parameters.get('tenantName').replace(' ', '')}/api/v2/scim/Users",
-                headers=add_installation_id(add_user_agent(headers)),
-                params={"count": PAGE_SIZE, "startIndex": start_at},
-                proxies=self.proxy,
-            )
-            if not success:
-                raise users
-            users = handle_status_code(
-                users,
-                error_code="CRE_1029",
-                custom_message="Error occurred while fetching users",
-                plugin=PLUGIN,
-                notify=False,
-            )
-            if not isinstance(users, dict):
-                users = json.loads(users)
-            users_in_page = users.get("Resources", [])
-            if not users_in_page:
-                break
-            all_users += users_in_page
-            start_at += PAGE_SIZE
-        return all_users
+                users.update(found)
+        return users
+
+    def _resolve_users_by_email(self, directory, emails: List[str]):
+        """Resolve emails from the SCIM directory index.
+
+        Args:
+            directory (ScimDirectory): SCIM directory index of the tenant.
+            emails (List[str]): Emails of the users.
+
+        Returns:
+            Tuple[Dict[str, Dict], List[str]]: Email to user for the users
+                found, and the emails missing from the index.
+        """
+        users = {}
+        missing_emails = []
+        for email in emails:
+            user = directory.get_user(email)
+            if user is None:
+                missing_emails.append(email)
+            else:
+                users[email] = user
+        return users, missing_emails
+
+    def _get_group_by_name(self, name: str) -> Optional[Dict]:
+        """Get a group by name from the SCIM directory index.
+
+        The group index is loaded if it is not valid or the group is not
+        in it, groups are few so they are not looked up one by one.
+
+        Args:
+            name (str): Name of the group.
+
+        Returns:
+            Optional[Dict]: Group dictionary if found, None otherwise.
+        """
+        directory = self._get_scim_directory()
+        if directory.has_groups():
+            group = directory.get_group(name)
+            if group is not None:
+                return group
+        directory.set_groups(self._get_all_groups())
+        return directory.get_group(name)
 
     def _find_user_by_email(self, users: List, email: str) -> Optional[Dict]:
         """Find user from list by email.
@@ -681,21 +874,6 @@ class NetskopePlugin(PluginBase):
                     return user
         return None
 
-    def _find_group_by_name(self, groups: List, name: str) -> Optional[Dict]:
-        """Find group from list by name.
-
-        Args:
-            groups (List): List of groups dictionaries.
-            name (str): Name to find.
-
-        Returns:
-            Optional[Dict]: Group dictionary if found, None otherwise.
-        """
-        for group in groups:
-            if group.get("displayName") == name:
-                return group
-        return None
-
     def _remove_from_group(
         self, configuration: Dict, user_ids: List[Dict], group_id: str
     ):
@@ -875,6 +1053,7 @@ class NetskopePlugin(PluginBase):
         )
         if not isinstance(response, dict):
             response = json.loads(response)
+        self._get_scim_directory().add_group(response)
         return response
 
     def get_types_to_pull(self, data_type):
@@ -2440,8 +2619,7 @@ Provide Default Host in Static field if you have selected 'Create new private ap
             return
         elif action.value in ["add", "remove"]:
             user = action.parameters.get("user", "")
-            users = self._get_all_users()
-            match = self._find_user_by_email(users, user)
+            match = self._get_users_by_email([user]).get(user)
             if match is None:
                 self.logger.info(
                     f"{self.log_prefix}: User with email {user} not found on Netskope via SCIM."
@@ -2450,9 +2628,8 @@ Provide Default Host in Static field if you have selected 'Create new private ap
             if action.value == "add":
                 group_id = action.parameters.get("group", "")
                 if group_id == "create":
-                    groups = self._get_all_groups()
                     group_name = action.parameters.get("name", "").strip()
-                    group_match = self._find_group_by_name(groups, group_name)
+                    group_match = self._get_group_by_name(group_name)
                     if group_match is None:  # create group
                         group = self._create_group(
                             self.configuration, group_name
@@ -2558,13 +2735,14 @@ Provide Default Host in Static field if you have selected 'Create new private ap
             skip_count = 0
             bulk_payload = []
             action_parameters = first_action.parameters
-            all_users = self._get_all_users()
+            users_by_email = self._get_users_by_email(
+                [action.parameters.get("user", "") for action in actions]
+            )
             if first_action.value == "add":
                 group_id = action_parameters.get("group", "")
                 if group_id == "create":
-                    groups = self._get_all_groups()
                     group_name = action_parameters.get("name", "").strip()
-                    group_match = self._find_group_by_name(groups, group_name)
+                    group_match = self._get_group_by_name(group_name)
                     if group_match is None:  # create group
                         group = self._create_group(
                             self.configuration, group_name
@@ -2577,7 +2755,7 @@ Provide Default Host in Static field if you have selected 'Create new private ap
 
                 for action in actions:
                     user = action.parameters.get("user", "")
-                    match = self._find_user_by_email(all_users, user)
+                    match = users_by_email.get(user)
                     if match is None:
                         self.logger.info(
                             f"{self.log_prefix}: User with email {user} "
@@ -2630,7 +2808,7 @@ Provide Default Host in Static field if you have selected 'Create new private ap
                 group_id = action_parameters.get("group", "")
                 for action in actions:
                     user = action.parameters.get("user", "")
-                    match = self._find_user_by_email(all_users, user)
+                    match = users_by_email.get(user)
                     if match is None:
                         self.logger.info(
                             f"{self.log_prefix}: User with email {user} "
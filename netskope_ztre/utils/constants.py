@@ -10,7 +10,7 @@ REGEX_HOST = (
 REGEX_EMAIL = r"[^@]+@[^@]+\.[^@]+"
 MODULE_NAME = "CRE"
 PLUGIN = "Netskope CRE"
-PLUGIN_VERSION = "1.2.0"
+PLUGIN_VERSION = "1.2.1"
 URLS = {
     "V2_PRIVATE_APP": "{}/api/v2/steering/apps/private",
     "V2_PRIVATE_APP_PATCH": "{}/api/v2/steering/apps/private/{}",
@@ -19,6 +19,7 @@ URLS = {
     "V2_CCI_TAG_UPDATE": "{}/api/v2/services/cci/tags/{}",
     "V1_APP_INSTANCE": "{}/api/v1/app_instances",
     "V2_SCIM_GROUPS": "/api/v2/scim/Groups",
+    "V2_SCIM_USERS": "/api/v2/scim/Users",
 }
 ERROR_TAG_EXISTS = (
     "Tag provided is already present. Hence use PATCH method to add "
@@ -31,3 +32,9 @@ SUCCESS = "Success"
 ADD_REMOVE_USER_BATCH_SIZE = 5000
 APP_INSTANCE_BATCH_SIZE = 500
 TAG_APP_BATCH_SIZE = 100
+
+# SCIM directory index
+SCIM_DIRECTORY_TTL = 15 * 60
+SCIM_MAX_WORKERS = 8
+# Users not found in the index looked up one by one at most.
+SCIM_MAX_FILTER_LOOKUPS = 50
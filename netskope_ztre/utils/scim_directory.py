@@ -0,0 +1,104 @@
+"""Netskope CRE plugin SCIM directory index."""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .constants import SCIM_DIRECTORY_TTL
+
+
+class ScimDirectory:
+    """Index of the SCIM users and groups of a tenant.
+
+    Users are indexed by email and groups by display name. Each index is
+    loaded in full and reused until it is older than the TTL, users and
+    groups looked up or created in between are added to it.
+    """
+
+    def __init__(self, ttl: int = SCIM_DIRECTORY_TTL):
+        """Initialize.
+
+        Args:
+            ttl (int): Seconds after which an index is loaded again.
+        """
+        self.ttl = ttl
+        self.users_by_email: Dict[str, Dict] = {}
+        self.groups_by_name: Dict[str, Dict] = {}
+        self.users_loaded_at = None
+        self.groups_loaded_at = None
+        self.lock = threading.Lock()
+
+    def _is_fresh(self, loaded_at) -> bool:
+        """Check if an index loaded at a given time is still valid."""
+        return loaded_at is not None and time.monotonic() - loaded_at < self.ttl
+
+    def has_users(self) -> bool:
+        """Check if the user index is loaded and valid."""
+        return self._is_fresh(self.users_loaded_at)
+
+    def has_groups(self) -> bool:
+        """Check if the group index is loaded and valid."""
+        return self._is_fresh(self.groups_loaded_at)
+
+    @staticmethod
+    def _index_user(users_by_email: Dict[str, Dict], user: Dict):
+        """Add a user to an index by all of its emails."""
+        for email in user.get("emails", []):
+            if email.get("value"):
+                users_by_email.setdefault(email["value"], user)
+
+    def add_user(self, user: Dict):
+        """Index a user by all of its emails."""
+        with self.lock:
+            self._index_user(self.users_by_email, user)
+
+    def set_users(self, users: List[Dict]):
+        """Replace the user index.
+
+        The new index is built aside and swapped in at once, so lookups in
+        between still see the previous one.
+        """
+        users_by_email = {}
+        for user in users:
+            self._index_user(users_by_email, user)
+        with self.lock:
+            self.users_by_email = users_by_email
+            self.users_loaded_at = time.monotonic()
+
+    def get_user(self, email: str) -> Optional[Dict]:
+        """Get a user by email."""
+        return self.users_by_email.get(email)
+
+    def add_group(self, group: Dict):
+        """Index a group by its display name."""
+        with self.lock:
+            self.groups_by_name.setdefault(group.get("displayName"), group)
+
+    def set_groups(self, groups: List[Dict]):
+        """Replace the group index.
+
+        The new index is built aside and swapped in at once, so lookups in
+        between still see the previous one.
+        """
+        groups_by_name = {}
+        for group in groups:
+            groups_by_name.setdefault(group.get("displayName"), group)
+        with self.lock:
+            self.groups_by_name = groups_by_name
+            self.groups_loaded_at = time.monotonic()
+
+    def get_group(self, name: str) -> Optional[Dict]:
+        """Get a group by display name."""
+        return self.groups_by_name.get(name)
+
+
+_directories: Dict[str, ScimDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def get_scim_directory(tenant_name: str) -> ScimDirectory:
+    """Get the SCIM directory index of a tenant, shared by the plugins."""
+    with _directories_lock:
+        if tenant_name not in _directories:
+            _directories[tenant_name] = ScimDirectory()
+        return _directories[tenant_name]
@@ -0,0 +1,353 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2021, Netskope OSS
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+QRadar Plugin pooled transport."""
+
+
+import select
+import socket
+import ssl
+import threading
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, List
+
+# Priority of user.info, same as the logging based handler.
+SYSLOG_PRIORITY = b"<14>"
+NEWLINE_FRAMING = "newline"
+OCTET_COUNTING_FRAMING = "octet_counting"
+SYSLOG_FRAMINGS = (NEWLINE_FRAMING, OCTET_COUNTING_FRAMING)
+MAX_BUFFER_SIZE = 256 * 1024
+MAX_IDLE_CONNECTIONS = 8
+# Connections and transports not used for this many seconds are closed.
+IDLE_TIMEOUT = 300
+
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+class SyslogTransportError(Exception):
+    """Error raised when records could not be sent.
+
+    Attributes:
+        sent (int): Number of records sent before the error.
+    """
+
+    def __init__(self, message, sent=0):
+        """Init method."""
+        super().__init__(message)
+        self.sent = sent
+
+
+class SyslogConnection:
+    """Single connection to a syslog server."""
+
+    def __init__(self, protocol, address, ssl_context=None):
+        """Connect to the server.
+
+        Args:
+            protocol (str): TLS, TCP or UDP.
+            address (tuple): Server and port.
+            ssl_context (ssl.SSLContext): Context used for TLS.
+        """
+        self.protocol = protocol
+        self.address = address
+        if protocol == "UDP":
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        else:
+            sock = socket.create_connection(address)
+            if protocol == "TLS":
+                sock = ssl_context.wrap_socket(sock)
+            self.socket = sock
+        self.last_used = time.monotonic()
+        self.frames_sent = 0
+
+    def is_stale(self) -> bool:
+        """Check whether the connection can no longer be reused.
+
+        A stream socket is only stale once the server closed it, which
+        reads as end of file. Readable data alone does not mean closed,
+        TLS 1.3 servers send session tickets after the handshake. On TLS
+        those records are processed by a non-blocking read, which only
+        returns end of file on a close_notify or a closed socket. Plain
+        sockets are peeked at without consuming anything.
+        """
+        if time.monotonic() - self.last_used > IDLE_TIMEOUT:
+            return True
+        if self.protocol == "UDP":
+            return False
+        sock = self.socket
+        try:
+            if isinstance(sock, ssl.SSLSocket) and sock.pending():
+                return False
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return False
+            if not isinstance(sock, ssl.SSLSocket):
+                return sock.recv(1, socket.MSG_PEEK) == b""
+            timeout = sock.gettimeout()
+            sock.setblocking(False)
+            try:
+                return sock.recv(1) == b""
+            except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+                return False
+            finally:
+                sock.settimeout(timeout)
+        except (OSError, ValueError):
+            return True
+
+    def send(self, frames: List[bytes]):
+        """Send encoded frames.
+
+        Stream frames are coalesced into a single buffer, datagrams are
+        sent one by one. `frames_sent` is set to the number of frames fully
+        sent, also when an error is raised.
+        """
+        self.frames_sent = 0
+        if self.protocol == "UDP":
+            for frame in frames:
+                self.socket.sendto(frame, self.address)
+                self.frames_sent += 1
+        else:
+            ends = list(accumulate(len(frame) for frame in frames))
+            buffer = memoryview(b"".join(frames))
+            offset = 0
+            try:
+                while offset < len(buffer):
+                    offset += self.socket.send(buffer[offset:])
+            finally:
+                self.frames_sent = bisect_right(ends, offset)
+        self.last_used = time.monotonic()
+
+    def close(self):
+        """Close the connection."""
+        try:
+            self.socket.close()
+        except OSError:
+            pass
+
+
+class SyslogTransport:
+    """Pool of connections to a single syslog server.
+
+    Connections are kept open across pushes and reused by any thread, a
+    connection is only created when no idle one is available. Every
+    acquired connection must be given back with release or discard.
+    """
+
+    def __init__(self, protocol, server, port, certs=None):
+        """Init method.
+
+        Args:
+            protocol (str): TLS, TCP or UDP.
+            server (str): Syslog server.
+            port (int): Syslog port.
+            certs (str): CA certificate(s) in PEM format used for TLS.
+        """
+        self.protocol = protocol
+        self.address = (server, port)
+        self.ssl_context = None
+        if protocol == "TLS":
+            self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            self.ssl_context.check_hostname = False
+            if certs:
+                self.ssl_context.verify_mode = ssl.CERT_REQUIRED
+                self.ssl_context.load_verify_locations(cadata=certs)
+            else:
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+        self._idle = []
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.closed = False
+
+    def acquire(self) -> SyslogConnection:
+        """Get an idle connection or open a new one."""
+        with self._lock:
+            self.in_use += 1
+        try:
+            while True:
+                with self._lock:
+                    connection = self._idle.pop() if self._idle else None
+                if connection is None:
+                    return SyslogConnection(
+                        self.protocol, self.address, self.ssl_context
+                    )
+                if not connection.is_stale():
+                    return connection
+                connection.close()
+        except Exception:
+            self._done()
+            raise
+
+    def release(self, connection: SyslogConnection):
+        """Return a healthy connection to the pool."""
+        with self._lock:
+            self._done()
+            if not self.closed and len(self._idle) < MAX_IDLE_CONNECTIONS:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def discard(self, connection: SyslogConnection):
+        """Close a failed connection instead of returning it to the pool."""
+        connection.close()
+        with self._lock:
+            self._done()
+
+    def _done(self):
+        """Mark an acquired connection as given back."""
+        self.in_use -= 1
+        self.last_used = time.monotonic()
+
+    def close(self):
+        """Close all the idle connections.
+
+        Connections in use are closed when they are released.
+        """
+        with self._lock:
+            self.closed = True
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def encode(self, message, framing=NEWLINE_FRAMING, add_priority=True):
+        """Encode a message into a frame."""
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        if add_priority:
+            message = SYSLOG_PRIORITY + message
+        if self.protocol == "UDP":
+            return message + b"\000"
+        if framing == OCTET_COUNTING_FRAMING:
+            return b"%d %s" % (len(message), message)
+        return message + b"\n"
+
+    def send(
+        self,
+        messages: Iterable,
+        framing=NEWLINE_FRAMING,
+        add_priority=True,
+    ) -> int:
+        """Send messages using a pooled connection.
+
+        Messages are written in buffers of up to MAX_BUFFER_SIZE bytes. If a
+        buffer fails on a connection, it is retried once on a new connection.
+
+        Args:
+            messages (Iterable): Messages as str or bytes.
+            framing (str): NEWLINE_FRAMING or OCTET_COUNTING_FRAMING (RFC
+                6587), ignored for UDP.
+            add_priority (bool): Whether to prefix the syslog priority.
+
+        Raises:
+            SyslogTransportError: If a buffer could not be sent.
+
+        Returns:
+            int: Number of messages sent.
+        """
+        sent = 0
+        connection = self.acquire()
+        try:
+            frames, size = [], 0
+            for message in messages:
+                frame = self.encode(message, framing, add_priority)
+                frames.append(frame)
+                size += len(frame)
+                if size >= MAX_BUFFER_SIZE:
+                    connection = self._send_frames(connection, frames, sent)
+                    sent += len(frames)
+                    frames, size = [], 0
+            if frames:
+                connection = self._send_frames(connection, frames, sent)
+                sent += len(frames)
+        except Exception:
+            self.discard(connection)
+            raise
+        self.release(connection)
+        return sent
+
+    def _send_frames(self, connection, frames, sent) -> SyslogConnection:
+        """Send frames, reconnecting once on failure.
+
+        Only the frames not fully sent on the failed connection are sent
+        again, a frame cut off by the failure is sent again as a whole.
+        """
+        try:
+            connection.send(frames)
+            return connection
+        except OSError:
+            connection.close()
+        frames_sent = connection.frames_sent
+        connection = None
+        try:
+            connection = SyslogConnection(
+                self.protocol, self.address, self.ssl_context
+            )
+            connection.send(frames[frames_sent:])
+            return connection
+        except OSError as err:
+            if connection:
+                frames_sent += connection.frames_sent
+                connection.close()
+            raise SyslogTransportError(
+                f"Error occurred while sending data to "
+                f"{self.address[0]}:{self.address[1]}. {err}",
+                sent=sent + frames_sent,
+            ) from err
+
+
+def get_transport(protocol, server, port, certs=None) -> SyslogTransport:
+    """Get the shared transport for a server.
+
+    Transports are keyed by (server, port, protocol, certs) and shared by
+    all the threads of the process. Transports with no connection in use
+    for IDLE_TIMEOUT seconds are removed and their connections closed.
+    """
+    key = (server, port, protocol, certs)
+    now = time.monotonic()
+    with _transports_lock:
+        idle = [
+            pool_key
+            for pool_key, pooled in _transports.items()
+            if pool_key != key
+            and not pooled.in_use
+            and now - pooled.last_used > IDLE_TIMEOUT
+        ]
+        evicted = [_transports.pop(pool_key) for pool_key in idle]
+        transport = _transports.get(key)
+        if transport is None:
+            transport = SyslogTransport(protocol, server, port, certs)
+            _transports[key] = transport
+    for pooled in evicted:
+        pooled.close()
+    return transport
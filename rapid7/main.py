@@ -33,10 +33,6 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """Rapid7 CLS Plugin."""
 
 import json
-import logging
-import logging.handlers
-import threading
-import socket
 import json
 import traceback
 import time
@@ -69,7 +65,12 @@ from .utils.rapid7_exceptions import (
 from .utils.rapid7_cef_generator import (
     CEFGenerator,
 )
-from .utils.rapid7_ssl import SSLSysLogHandler
+from .utils.rapid7_transport import (
+    NEWLINE_FRAMING,
+    SYSLOG_FRAMINGS,
+    SyslogTransportError,
+    get_transport,
+)
 
 
 class Rapid7Plugin(PluginBase):
@@ -617,53 +618,19 @@ class Rapid7Plugin(PluginBase):
             return transformed_data
 
     def init_handler(self, configuration):
-        """Initialize unique Rapid7 handler per thread
-        based on configured protocol."""
-        syslogger = logging.getLogger(
-            "SYSLOG_LOGGER_{}".format(threading.get_ident())
-        )
-        syslogger.setLevel(logging.INFO)
-        syslogger.handlers = []
-        syslogger.propagate = False
-
-        if configuration.get("rapid7_protocol") == "TLS":
-            tls_handler = SSLSysLogHandler(
-                configuration.get("rapid7_protocol"),
-                address=(
-                    configuration.get("rapid7_server"),
-                    configuration.get("rapid7_port"),
-                ),
-                certs=configuration.get("rapid7_certificate"),
-            )
-            syslogger.addHandler(tls_handler)
-        else:
-            socktype = socket.SOCK_DGRAM  # Set protocol to UDP by default
-            if configuration.get("rapid7_protocol") == "TCP":
-                socktype = socket.SOCK_STREAM
-
-            # Create a rapid7 handler with given configuration parameters
-            handler = SSLSysLogHandler(
-                configuration.get("rapid7_protocol"),
-                address=(
-                    configuration.get("rapid7_server").strip(),
-                    configuration.get("rapid7_port"),
-                ),
-                socktype=socktype,
-            )
-
-            if configuration.get("rapid7_protocol") == "TCP":
-                # This will add a line break to the message before
-                # it is 'emitted' which ensures that the messages are
-                # split up over multiple lines,
-                # see https://bugs.python.org/issue28404
-                handler.setFormatter(logging.Formatter("%(message)s\n"))
-                # In order for the above to work, then we need to ensure that
-                # the null terminator is not included
-                handler.append_nul = False
+        """Get the pooled transport for the configured server.
 
-            syslogger.addHandler(handler)
-
-        return syslogger
+        Connections are reused across pushes, an idle connection is acquired
+        here so that connectivity errors surface before ingestion starts.
+        """
+        transport = get_transport(
+            configuration.get("rapid7_protocol"),
+            configuration.get("rapid7_server").strip(),
+            configuration.get("rapid7_port"),
+            certs=configuration.get("rapid7_certificate"),
+        )
+        transport.release(transport.acquire())
+        return transport
 
     def log_success_msg(
         self, data_type, subtype, successful_log_push_counter, skipped_logs
@@ -696,7 +663,7 @@ class Rapid7Plugin(PluginBase):
         )
         successful_log_push_counter, skipped_logs = 0, 0
         try:
-            syslogger = self.init_handler(self.configuration)
+            transport = self.init_handler(self.configuration)
         except (TimeoutError, ConnectionRefusedError, Exception) as err:
             error_msg = {
                 TimeoutError: (
@@ -714,17 +681,18 @@ class Rapid7Plugin(PluginBase):
             )
             raise Rapid7PluginError(error_msg)
 
+        records = [
+            json.dumps(data) if isinstance(data, dict) else data
+            for data in transformed_data
+            if data
+        ]
+        skipped_logs = len(transformed_data) - len(records)
         try:
-            for data in transformed_data:
-                if data:
-                    syslogger.info(
-                        json.dumps(data) if isinstance(data, dict) else data
-                    )
-                    syslogger.handlers[0].flush()
-                    successful_log_push_counter += 1
-                else:
-                    skipped_logs += 1
-
+            successful_log_push_counter = transport.send(
+                records,
+                framing=self.configuration.get("rapid7_framing")
+                or NEWLINE_FRAMING,
+            )
             log_msg = self.log_success_msg(
                 data_type, subtype, successful_log_push_counter, skipped_logs
             )
@@ -732,8 +700,11 @@ class Rapid7Plugin(PluginBase):
                 success=True,
                 message=log_msg,
             )
+
         except Exception as err:
-            failed_logs = len(transformed_data) - successful_log_push_counter
+            if isinstance(err, SyslogTransportError):
+                successful_log_push_counter = err.sent
+            failed_logs = len(records) - successful_log_push_counter
             _ = self.log_success_msg(
                 data_type, subtype, successful_log_push_counter, skipped_logs
             )
@@ -750,22 +721,10 @@ class Rapid7Plugin(PluginBase):
             )
             raise Rapid7PluginError(error_msg)
 
-        # Clean up
-        finally:
-            try:
-                syslogger.handlers[0].close()
-                del syslogger.handlers[:]
-                del syslogger
-            except Exception as err:
-                error_msg = "Error occurred while cleaning up Rapid7 handler."
-                self.logger.debug(
-                    f"{self.log_prefix}: {error_msg} Error: {err}"
-                )
-
     def test_server_connectivity(self, configuration):
         """Tests whether the configured rapid7 server is reachable or not."""
         try:
-            syslogger = self.init_handler(configuration)
+            self.init_handler(configuration)
         except Exception as err:
             error_msg = (
                 "Error occurred while establishing "
@@ -777,12 +736,6 @@ class Rapid7Plugin(PluginBase):
                 details=str(traceback.format_exc()),
             )
             raise Rapid7PluginError(error_msg)
-        else:
-            # Clean up for further use
-            syslogger.handlers[0].flush()
-            syslogger.handlers[0].close()
-            del syslogger.handlers[:]
-            del syslogger
 
     def validate(self, configuration: dict) -> ValidationResult:
         """Validate the configuration parameters dict."""
@@ -857,6 +810,17 @@ class Rapid7Plugin(PluginBase):
                 message=err_msg,
             )
 
+        rapid7_framing = configuration.get("rapid7_framing") or NEWLINE_FRAMING
+        if rapid7_framing not in SYSLOG_FRAMINGS:
+            err_msg = (
+                "Invalid Rapid7 Framing provided in configuration parameters."
+            )
+            self.logger.error(f"{validation_err_msg} {err_msg}")
+            return ValidationResult(
+                success=False,
+                message=err_msg,
+            )
+
         mappings = self.mappings.get("jsonData", None)
         mappings = json.loads(mappings)
         if not isinstance(
@@ -34,7 +34,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 PLATFORM_NAME = "Rapid7"
 MODULE_NAME = "CLS"
-PLUGIN_VERSION = "3.1.1"
+PLUGIN_VERSION = "3.1.2"
 
 RAPID7_PROTOCOLS = ["UDP", "TCP", "TLS"]
 
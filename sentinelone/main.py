@@ -33,6 +33,7 @@ SentinelOne CTE Plugin implementation to push and pull the data from
 SentinelOne Platform.
 """
 
+import time
 import traceback
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
@@ -64,6 +65,7 @@ from .utils.constants import (
     RETRACTION,
 )
 from .utils.helper import SentinelOnePluginException, SentinelOnePluginHelper
+from .utils.retraction import pull_snapshot
 
 
 class SentinelOnePlugin(PluginBase):
@@ -797,29 +799,52 @@ class SentinelOnePlugin(PluginBase):
         end_time = datetime.now()
         start_time = end_time - timedelta(days=int(retraction_interval))
         start_time = f"{start_time.isoformat()}Z"
-        for source_ioc_list in source_indicators:
-            try:
-                iocs = set()
-                for ioc in source_ioc_list:
-                    if ioc:
-                        iocs.add(ioc.value)
-                modified_indicators = self._pull(
-                    is_retraction=True, retraction_time=start_time
-                )
-                for indicator in modified_indicators:
-                    iocs -= indicator
+        # The indicators are pulled once per cycle, on the first chunk, and
+        # every chunk is checked against the same snapshot.
+        snapshot = None
+        try:
+            for source_ioc_list in source_indicators:
+                try:
+                    iocs = set()
+                    for ioc in source_ioc_list:
+                        if ioc:
+                            iocs.add(ioc.value)
+                    if snapshot is None:
+                        pull_start = time.monotonic()
+                        snapshot = pull_snapshot(
+                            self._pull(
+                                is_retraction=True, retraction_time=start_time
+                            )
+                        )
+                        self.logger.info(
+                            f"{self.log_prefix}: Pulled a snapshot of "
+                            f"{snapshot.size} indicator(s) from "
+                            f"{PLATFORM_NAME} in "
+                            f"{time.monotonic() - pull_start:.2f} second(s)."
+                        )
+                    diff_start = time.monotonic()
+                    total_iocs = len(iocs)
+                    iocs = snapshot.get_missing(iocs)
+                    self.logger.debug(
+                        f"{self.log_prefix}: Checked {total_iocs} "
+                        "indicator(s) against the snapshot in "
+                        f"{time.monotonic() - diff_start:.2f} second(s)."
+                    )
 
-                yield list(iocs), False
-            except Exception as err:
-                err_msg = (
-                    f"Error while fetching modified indicators from"
-                    f" {PLATFORM_NAME}."
-                )
-                self.logger.error(
-                    message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
-                    details=traceback.format_exc(),
-                )
-                raise SentinelOnePluginException(err_msg)
+                    yield list(iocs), False
+                except Exception as err:
+                    err_msg = (
+                        f"Error while fetching modified indicators from"
+                        f" {PLATFORM_NAME}."
+                    )
+                    self.logger.error(
+                        message=(f"{self.log_prefix}: {err_msg} Error: {err}"),
+                        details=traceback.format_exc(),
+                    )
+                    raise SentinelOnePluginException(err_msg)
+        finally:
+            if snapshot is not None:
+                snapshot.close()
 
     def retract_indicators(
         self,
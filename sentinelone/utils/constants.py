@@ -37,7 +37,7 @@ PUSH_PAGE_SIZE = 2500
 MODULE_NAME = "CTE"
 PLUGIN_NAME = "SentinelOne"
 PLATFORM_NAME = "SentinelOne"
-PLUGIN_VERSION = "1.2.0"
+PLUGIN_VERSION = "1.2.1"
 MAX_API_CALLS = 4
 DEFAULT_WAIT_TIME = 60
 MAX_WAIT_TIME = 300
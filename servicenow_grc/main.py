@@ -15,8 +15,14 @@ from netskope.integrations.grc.models.configuration import (
     MappingType,
 )
 
+from .utils.grc_matcher import GRCMatcher
+
 MAX_PER_PAGE = 1000
 MAX_RETRY_COUNT = 4
+# Application values are queried in batches of at most MAX_QUERY_VALUES values
+# and MAX_QUERY_LENGTH characters per IN query.
+MAX_QUERY_VALUES = 100
+MAX_QUERY_LENGTH = 4000
 
 
 class ServiceNowPlugin(PluginBase):
@@ -59,9 +65,10 @@ class ServiceNowPlugin(PluginBase):
         mapping = {"==": "="}
         return mapping[operator]
 
-    def apply_query(self, query):
+    def apply_query(self, query, fields=None):
         """Fetches the vendors from ServiceNow that matches the query"""
         config = self.configuration
+        fields = fields or []
         try:
             url = f"{config['url'].strip('/')}/api/now/table/core_company"
             auth = (config["username"], config["password"])
@@ -70,6 +77,10 @@ class ServiceNowPlugin(PluginBase):
                 "sysparm_offset": 0,
                 "sysparm_query": query,
             }
+            if fields:
+                params["sysparm_fields"] = ",".join(
+                    ["sys_id", "notes"] + fields
+                )
             vendor_results = []
             while True:
                 results = self.api_call_helper(
@@ -83,6 +94,8 @@ class ServiceNowPlugin(PluginBase):
                         "sys_id": vendor["sys_id"],
                         "notes": vendor.get("notes", ""),
                     }
+                    for field in fields:
+                        vendor_details[field] = vendor.get(field, "")
 
                     vendor_results.append(vendor_details)
                 if len(vendors) < MAX_PER_PAGE:
@@ -135,23 +148,86 @@ class ServiceNowPlugin(PluginBase):
         query_builder_dict["query_builder_list"] = final_list
         return query_builder_dict
 
-    def get_query_builder(self, app_dict, mapping_list):
-        """This method help to build query to fetch only vendors data that matches on ServiceNow."""
-        query_list = []
+    def get_application_values(self, app_dict, mapping_list):
+        """Get the values of the mapped application fields as strings."""
+        app_values = {}
         for query_json in mapping_list:
-            mapped_operator = self.map_operator(query_json.get("operator"))
             app_value = app_dict.get(query_json.get("rhs", ""))
-            lhs_app_value = query_json.get("lhs")
             if app_value is None:
                 app_value = ""
             if isinstance(app_value, list):
-                internal_query = ",".join(app_value)
-                query = f"{lhs_app_value}IN{internal_query}"
-                query_list.append(query)
+                app_value = [str(value) for value in app_value]
             else:
-                query = f"{lhs_app_value}{mapped_operator}{app_value}"
-                query_list.append(query)
-        return query_list
+                app_value = str(app_value)
+            app_values[query_json.get("rhs", "")] = app_value
+        return app_values
+
+    def get_batch_queries(self, lhs, values):
+        """Build the queries matching a field with any of the values.
+
+        Values are batched into IN queries, values an IN query can not
+        hold are queried on their own.
+        """
+        batch = []
+        length = 0
+        for value in values:
+            if not value or "," in value:
+                yield f"{lhs}{self.map_operator('==')}{value}"
+                continue
+            if batch and (
+                len(batch) >= MAX_QUERY_VALUES
+                or length + len(value) > MAX_QUERY_LENGTH
+            ):
+                yield f"{lhs}IN{','.join(batch)}"
+                batch = []
+                length = 0
+            batch.append(value)
+            length += len(value) + 1
+        if batch:
+            yield f"{lhs}IN{','.join(batch)}"
+
+    def get_vendor_matcher(self, application_values, query_builder_dict):
+        """Fetch the vendors matching any of the applications and index them.
+
+        Args:
+            application_values (list): Mapped values of each application.
+            query_builder_dict (dict): Operation and rules of the mapping.
+
+        Returns:
+            GRCMatcher: Vendors indexed on the mapped fields.
+        """
+        mapping_list = query_builder_dict["query_builder_list"]
+        matcher = GRCMatcher(mapping_list, query_builder_dict["operation"])
+        fields = list(dict.fromkeys(rule["lhs"] for rule in mapping_list))
+        # A vendor matching all the rules matches the first one, so only the
+        # first rule is queried for "and".
+        if query_builder_dict["operation"] == "and":
+            mapping_list = mapping_list[:1]
+        seen_ids = set()
+        query_count = 0
+        for query_json in mapping_list:
+            values = {}
+            for app_values in application_values:
+                app_value = app_values[query_json.get("rhs", "")]
+                for value in (
+                    app_value if isinstance(app_value, list) else [app_value]
+                ):
+                    values[value] = True
+            for query in self.get_batch_queries(
+                query_json.get("lhs"), values
+            ):
+                query_count += 1
+                for vendor in self.apply_query(query, fields=fields):
+                    if vendor["sys_id"] in seen_ids:
+                        continue
+                    seen_ids.add(vendor["sys_id"])
+                    matcher.add(vendor, vendor)
+        self.logger.info(
+            f"Fetched {len(seen_ids)} vendor(s) from ServiceNow matching "
+            f"{len(application_values)} application(s) with "
+            f"{query_count} query(s)."
+        )
+        return matcher
 
     def push(self, applications, query_builder_list):
         """push method to store the data collected from the Netskope tenant into ServiceNow's VRM.
@@ -164,9 +240,17 @@ class ServiceNowPlugin(PluginBase):
         query_builder_dict = self.get_query_builder_list(query_builder_list)
         skip_count = 0
         total_count = 0
-        for app in applications:
+        mapping_list = query_builder_dict["query_builder_list"]
+        app_dicts = [app.dict() for app in applications]
+        application_values = [
+            self.get_application_values(app_dict, mapping_list)
+            for app_dict in app_dicts
+        ]
+        matcher = self.get_vendor_matcher(
+            application_values, query_builder_dict
+        )
+        for app_dict, app_values in zip(app_dicts, application_values):
             total_count += 1
-            app_dict = app.dict()
             app_details = {
                 "app_id": app_dict.get("applicationId"),
                 "app_name": app_dict.get("applicationName"),
@@ -175,15 +259,7 @@ class ServiceNowPlugin(PluginBase):
                 "category_name": app_dict.get("categoryName"),
                 "deep_link": app_dict.get("deepLink"),
             }
-            mapped_operation = query_builder_dict["operation"]
-            mapping_list = query_builder_dict["query_builder_list"]
-            if mapped_operation == "and":
-                query_list = self.get_query_builder(app_dict, mapping_list)
-                final_query = "^".join(query_list)
-            else:
-                query_list = self.get_query_builder(app_dict, mapping_list)
-                final_query = "^OR".join(query_list)
-            snow_records = self.apply_query(final_query)
+            snow_records = matcher.match(app_values)
 
             if not snow_records:
                 self.logger.warn(
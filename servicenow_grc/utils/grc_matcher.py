@@ -0,0 +1,122 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2021, Netskope OSS
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+ServiceNow ARE plugin vendor matcher.
+"""
+
+from typing import Dict, Iterable, List
+
+
+def get_record_keys(value) -> List:
+    """Get the keys a record field value is indexed on.
+
+    Strings are compared case-insensitively. A multi-valued record field is
+    compared as a whole, which never equals a single application value, so
+    it is not indexed.
+    """
+    if isinstance(value, str):
+        return [value.lower()]
+    if value is None or isinstance(value, (int, float, bool)):
+        return [value]
+    return []
+
+
+def get_match_keys(value) -> List:
+    """Get the keys an application field value is matched on.
+
+    Every value of a multi-valued application field is matched on its own.
+    """
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    keys = []
+    for item in values:
+        keys.extend(get_record_keys(item))
+    return keys
+
+
+class GRCMatcher:
+    """Index of the vendor records on the fields of a mapping.
+
+    Every record is indexed once on each mapped field, an application is
+    then matched with a lookup per rule, joining the matches of the rules
+    with an intersection for "and" and a union for "or". Records are
+    returned in the order they were added.
+    """
+
+    def __init__(self, rules: List[Dict], operation: str):
+        """Initialize.
+
+        Args:
+            rules (List[Dict]): Rules with the `lhs` field of the records
+                and the `rhs` field of the applications.
+            operation (str): "and" or "or".
+        """
+        self.rules = rules
+        self.operation = operation
+        self.records = []
+        self.indexes = {rule["lhs"]: {} for rule in rules}
+
+    def add(self, record, fields: Dict):
+        """Index a record.
+
+        Args:
+            record: Record returned on a match.
+            fields (Dict): Values of the mapped fields of the record.
+        """
+        position = len(self.records)
+        self.records.append(record)
+        for lhs, index in self.indexes.items():
+            for key in get_record_keys(fields.get(lhs)):
+                positions = index.setdefault(key, [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+
+    def add_all(self, records: Iterable, get_fields):
+        """Index records with the function getting their mapped fields."""
+        for record in records:
+            self.add(record, get_fields(record))
+
+    def match(self, application: Dict) -> List:
+        """Get the records matching an application."""
+        matched = None
+        for rule in self.rules:
+            index = self.indexes[rule["lhs"]]
+            positions = set()
+            for key in get_match_keys(application.get(rule["rhs"])):
+                positions.update(index.get(key, ()))
+            if matched is None:
+                matched = positions
+            elif self.operation == "and":
+                matched &= positions
+            else:
+                matched |= positions
+            if self.operation == "and" and not matched:
+                break
+        return [self.records[position] for position in sorted(matched or ())]
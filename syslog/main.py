@@ -31,10 +31,6 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 Syslog Plugin."""
 
-import logging
-import logging.handlers
-import threading
-import socket
 import json
 import traceback
 import time
@@ -57,11 +53,18 @@ from .utils.syslog_helper import get_syslog_mappings
 from .utils.syslog_exceptions import (
     MappingValidationError,
     EmptyExtensionError,
-    FieldNotFoundError,
     SyslogPluginError,
 )
 from .utils.syslog_cef_generator import CEFGenerator
-from .utils.syslog_ssl import SSLSysLogHandler
+from .utils.syslog_transport import (
+    NEWLINE_FRAMING,
+    SYSLOG_FRAMINGS,
+    SyslogTransportError,
+    get_transport,
+)
+
+MAPPING_PLAN_CACHE_SIZE = 128
+MAPPING_PLANS = {}
 
 
 class SyslogPlugin(PluginBase):
@@ -102,33 +105,157 @@ class SyslogPlugin(PluginBase):
             )
         return (PLATFORM_NAME, PLUGIN_VERSION)
 
-    def get_mapping_value_from_json_path(self, data, json_path):
-        """To Fetch the value from given JSON object using given JSON path.
+    def compile_field_getter(self, field_mapping, is_json_path=False):
+        """To Compile a header/extension mapping into a getter.
+
+        The mapping is inspected once, the returned getter only reads the
+        record.
 
         Args:
-            data: JSON object from which the value is to be fetched
-            json_path: JSON path indicating the path of the value in given JSON
+            field_mapping: Dict containing "mapping" and "default" fields
+            is_json_path: Whether the mapped value is \
+                JSON path or direct field name
 
         Returns:
-            fetched value.
+            Getter taking a record and returning the value and whether it
+            was mapped from the record, or None when the value can not be
+            retrieved and the field is to be skipped.
+
+        ---------------------------------------------------------------------
+             Mapping          |    Response    |    Retrieved Value
+        ----------------------|                |
+        default  |  Mapping   |                |
+        ---------------------------------------------------------------------
+           P     |     P      |        P       |           Mapped
+           P     |     P      |        NP      |           Default
+           P     |     NP     |        P       |           Default
+           NP    |     P      |        P       |           Mapped
+           P     |     NP     |        NP      |           Default
+           NP    |     P      |        NP      |           -
+           NP    |     NP     |        P       |           - (Not possible)
+           NP    |     NP     |        NP      |           - (Not possible)
+        -----------------------------------------------------------------------
         """
-        return jsonpath(data, json_path)
+        mapping_field = field_mapping.get("mapping_field")
+        has_default = "default_value" in field_mapping
+        default_value = field_mapping.get("default_value")
+
+        # If mapping is not present, 'default_value' must be there\
+        #  because of validation (case #3 and case #5)
+        if not mapping_field:
+            return lambda data: (default_value, False)
 
-    def get_mapping_value_from_field(self, data, field):
-        """To Fetch the value from given field.
+        if is_json_path:
+
+            def get_json_path_value(data):
+                # If mapping field specified by JSON path is present in data,\
+                #  map that field, else skip it
+                value = jsonpath(data, mapping_field)
+                if value:
+                    return ",".join([str(val) for val in value]), True
+                return None
+
+            return get_json_path_value
+
+        is_timestamp = field_mapping.get("transformation") == "Time Stamp"
+
+        def get_field_value(data):
+            # If mapping is present in data, map that field, \
+            # else skip it
+            if mapping_field in data:  # case #1 and case #4
+                value = data[mapping_field]
+                if is_timestamp and value:
+                    try:
+                        return int(value), True
+                    except Exception:
+                        pass
+                if value or isinstance(value, int):
+                    return value, True
+                return "null", False
+            elif has_default:
+                # If mapped value is not found in response and default is \
+                # mapped, map the default value (case #2)
+                return default_value, False
+            # case #6
+            return None
+
+        return get_field_value
+
+    def get_mapping_plan(self, data_type, subtype, subtype_mapping):
+        """To Get the compiled header and extension getters of a subtype.
+
+        Plans are cached per data type, subtype and mapping content, so the
+        mapping is only compiled again when it is changed.
 
         Args:
-            data: JSON object from which the value is to be fetched
-            field: Field whose value is to be fetched
+            data_type: Data type for which the plan is being compiled
+            subtype: Subtype for which the plan is being compiled
+            subtype_mapping: Header and extension mappings of the subtype
 
         Returns:
-            fetched value.
+            Tuple of (header name, getter) and (extension name, getter) lists
         """
-        return (
-            (data[field], True)
-            if data[field] or isinstance(data[field], int)
-            else ("null", False)
+        key = (
+            data_type,
+            subtype.lower(),
+            json.dumps(subtype_mapping, sort_keys=True),
         )
+        plan = MAPPING_PLANS.get(key)
+        if plan is None:
+            plan = (
+                [
+                    (cef_header, self.compile_field_getter(header_mapping))
+                    for cef_header, header_mapping in subtype_mapping[
+                        "header"
+                    ].items()
+                ],
+                [
+                    (
+                        cef_extension,
+                        self.compile_field_getter(
+                            extension_mapping,
+                            is_json_path="is_json_path" in extension_mapping,
+                        ),
+                    )
+                    for cef_extension, extension_mapping in subtype_mapping[
+                        "extension"
+                    ].items()
+                ],
+            )
+            if len(MAPPING_PLANS) >= MAPPING_PLAN_CACHE_SIZE:
+                MAPPING_PLANS.clear()
+            MAPPING_PLANS[key] = plan
+        return plan
+
+    def get_mapping_variables(self, data_type):
+        """To Resolve the variables that can be used in header mappings.
+
+        The tenant is looked up once per transform call instead of once
+        per record. If the lookup fails the variables are left unresolved,
+        as for webtx, instead of failing the whole transform.
+
+        Args:
+            data_type: Data type for which the headers are being transformed
+
+        Returns:
+            Dict of variable name and its value
+        """
+        if data_type == "webtx":
+            return {}
+        try:
+            helper = AlertsHelper()
+            tenant = helper.get_tenant_cls(self.source)
+        except Exception as err:
+            self.logger.error(
+                message=(
+                    f"{self.log_prefix}: [{data_type}] Error occurred while "
+                    f"fetching the tenant details. Error: {err}. Mapping "
+                    "variables such as $tenant_name will not be resolved."
+                ),
+                details=str(traceback.format_exc()),
+            )
+            return {}
+        return {"$tenant_name": tenant.name}
 
     def get_subtype_mapping(self, mappings, subtype):
         """To Retrieve subtype mappings (mappings for subtypes of \
@@ -148,178 +275,60 @@ class SyslogPlugin(PluginBase):
         else:
             return mappings[subtype.upper()]
 
-    def get_headers(self, header_mappings, data, data_type, subtype):
-        """To Create a dictionary of CEF headers from given header mappings\
-              for given Netskope alert/event record.
+    def get_headers(self, header_plan, data, mapping_variables):
+        """To Create a dictionary of CEF headers from compiled header\
+              getters for given Netskope alert/event record.
 
         Args:
-            subtype: Subtype for which the headers are being transformed
-            data_type: Data type for which the headers are being transformed
-            header_mappings: CEF header mapping with Netskope fields
+            header_plan: List of CEF header and its compiled getter
             data: The alert/event for which the CEF header is being generated
+            mapping_variables: Variables resolved by get_mapping_variables
 
         Returns:
             header dict
         """
         headers = {}
-        mapping_variables = {}
-        if data_type != "webtx":
-            helper = AlertsHelper()
-            tenant = helper.get_tenant_cls(self.source)
-            mapping_variables = {"$tenant_name": tenant.name}
-
-        missing_fields = []
         mapped_field_flag = False
         # Iterate over mapped headers
-        for cef_header, header_mapping in header_mappings.items():
-            try:
-                (
-                    headers[cef_header],
-                    mapped_field,
-                ) = self.get_field_value_from_data(
-                    header_mapping, data, data_type, subtype, False
-                )
-
-                if mapped_field:
-                    mapped_field_flag = mapped_field
-
-                # Handle variable mappings
-                if (
-                    isinstance(headers[cef_header], str)
-                    and headers[cef_header].lower() in mapping_variables
-                ):
-                    headers[cef_header] = mapping_variables[
-                        headers[cef_header].lower()
-                    ]
-            except FieldNotFoundError as err:
-                missing_fields.append(str(err))
+        for cef_header, getter in header_plan:
+            result = getter(data)
+            if result is None:
+                continue
+            value, mapped_field = result
+            if mapped_field:
+                mapped_field_flag = mapped_field
+
+            # Handle variable mappings
+            if isinstance(value, str) and value.lower() in mapping_variables:
+                value = mapping_variables[value.lower()]
+            headers[cef_header] = value
 
         return headers, mapped_field_flag
 
-    def get_extensions(self, extension_mappings, data, data_type, subtype):
-        """Fetch extensions from given mappings.
+    def get_extensions(self, extension_plan, data):
+        """Fetch extensions from compiled extension getters.
 
         Args:
-            subtype: Subtype for which the headers are being transformed
-            data_type: Data type for which the headers are being transformed
-            extension_mappings: Mapping of extensions
+            extension_plan: List of CEF extension and its compiled getter
             data: The data to be transformed
 
         Returns:
             extensions (dict)
         """
         extension = {}
-        missing_fields = []
         mapped_field_flag = False
 
         # Iterate over mapped extensions
-        for cef_extension, extension_mapping in extension_mappings.items():
-            try:
-                (
-                    extension[cef_extension],
-                    mapped_field,
-                ) = self.get_field_value_from_data(
-                    extension_mapping,
-                    data,
-                    data_type,
-                    subtype,
-                    is_json_path="is_json_path" in extension_mapping,
-                )
-
-                if mapped_field:
-                    mapped_field_flag = mapped_field
-            except FieldNotFoundError as err:
-                missing_fields.append(str(err))
+        for cef_extension, getter in extension_plan:
+            result = getter(data)
+            if result is None:
+                continue
+            extension[cef_extension], mapped_field = result
+            if mapped_field:
+                mapped_field_flag = mapped_field
 
         return extension, mapped_field_flag
 
-    def get_field_value_from_data(
-        self, extension_mapping, data, data_type, subtype, is_json_path=False
-    ):
-        """To Fetch the value of extension based on "mapping" \
-            and "default" fields.
-
-        Args:
-            extension_mapping: Dict containing "mapping" and "default" fields
-            data: Data instance retrieved from Netskope
-            subtype: Subtype for which the extension are being transformed
-            data_type: Data type for which the headers are being transformed
-            is_json_path: Whether the mapped value is \
-                JSON path or direct field name
-
-        Returns:
-            Fetched values of extension
-
-        ---------------------------------------------------------------------
-             Mapping          |    Response    |    Retrieved Value
-        ----------------------|                |
-        default  |  Mapping   |                |
-        ---------------------------------------------------------------------
-           P     |     P      |        P       |           Mapped
-           P     |     P      |        NP      |           Default
-           P     |     NP     |        P       |           Default
-           NP    |     P      |        P       |           Mapped
-           P     |     NP     |        NP      |           Default
-           NP    |     P      |        NP      |           -
-           NP    |     NP     |        P       |           - (Not possible)
-           NP    |     NP     |        NP      |           - (Not possible)
-        -----------------------------------------------------------------------
-        """
-        # mapped_field will be returned as true only if the value returned is\
-        # using the mapping_field and not default_value
-        mapped_field = False
-        if (
-            "mapping_field" in extension_mapping
-            and extension_mapping["mapping_field"]
-        ):
-            if is_json_path:
-                # If mapping field specified by JSON path is present in data,\
-                #  map that field, else skip by raising
-                # exception:
-                value = self.get_mapping_value_from_json_path(
-                    data, extension_mapping["mapping_field"]
-                )
-                if value:
-                    mapped_field = True
-                    return ",".join([str(val) for val in value]), mapped_field
-                else:
-                    raise FieldNotFoundError(
-                        extension_mapping["mapping_field"]
-                    )
-            else:
-                # If mapping is present in data, map that field, \
-                # else skip by raising exception
-                if (
-                    extension_mapping["mapping_field"] in data
-                ):  # case #1 and case #4
-                    if (
-                        extension_mapping.get("transformation") == "Time Stamp"
-                        and data[extension_mapping["mapping_field"]]
-                    ):
-                        try:
-                            mapped_field = True
-                            return (
-                                int(data[extension_mapping["mapping_field"]]),
-                                mapped_field,
-                            )
-                        except Exception:
-                            pass
-                    return self.get_mapping_value_from_field(
-                        data, extension_mapping["mapping_field"]
-                    )
-                elif "default_value" in extension_mapping:
-                    # If mapped value is not found in response and default is \
-                    # mapped, map the default value (case #2)
-                    return extension_mapping["default_value"], mapped_field
-                else:  # case #6
-                    raise FieldNotFoundError(
-                        extension_mapping["mapping_field"]
-                    )
-        else:
-            # If mapping is not present, 'default_value' must be there\
-            #  because of validation (case #3 and case #5)
-            return extension_mapping["default_value"], mapped_field
-
     def map_json_data(self, mappings, data):
         """Filter the raw data and returns the filtered data.
 
@@ -513,6 +522,22 @@ class SyslogPlugin(PluginBase):
                 )
                 raise SyslogPluginError(error_msg)
 
+            try:
+                header_plan, extension_plan = self.get_mapping_plan(
+                    data_type, subtype, subtype_mapping
+                )
+            except Exception as err:
+                error_msg = (
+                    f"[{data_type}][{subtype}] Error occurred while"
+                    f" compiling mappings for subtype {subtype}."
+                )
+                self.logger.error(
+                    message=(f"{self.log_prefix}: {error_msg} Error: {err}"),
+                    details=str(traceback.format_exc()),
+                )
+                raise SyslogPluginError(error_msg)
+
+            mapping_variables = self.get_mapping_variables(data_type)
             transformed_data = []
             for data in raw_data:
                 if not data:
@@ -522,7 +547,7 @@ class SyslogPlugin(PluginBase):
                 # Generating the CEF header
                 try:
                     header, mapped_flag_header = self.get_headers(
-                        subtype_mapping["header"], data, data_type, subtype
+                        header_plan, data, mapping_variables
                     )
                 except Exception as err:
                     self.logger.error(
@@ -539,7 +564,7 @@ class SyslogPlugin(PluginBase):
 
                 try:
                     extension, mapped_flag_extension = self.get_extensions(
-                        subtype_mapping["extension"], data, data_type, subtype
+                        extension_plan, data
                     )
                 except Exception as err:
                     self.logger.error(
@@ -600,53 +625,19 @@ class SyslogPlugin(PluginBase):
             return transformed_data
 
     def init_handler(self, configuration):
-        """Initialize unique Syslog handler per thread\
-              based on configured protocol."""
-        syslogger = logging.getLogger(
-            "SYSLOG_LOGGER_{}".format(threading.get_ident())
-        )
-        syslogger.setLevel(logging.INFO)
-        syslogger.handlers = []
-        syslogger.propagate = False
-
-        if configuration.get("syslog_protocol") == "TLS":
-            tls_handler = SSLSysLogHandler(
-                configuration.get("syslog_protocol"),
-                address=(
-                    configuration.get("syslog_server").strip(),
-                    configuration.get("syslog_port"),
-                ),
-                certs=configuration.get("syslog_certificate"),
-            )
-            syslogger.addHandler(tls_handler)
-        else:
-            socktype = socket.SOCK_DGRAM  # Set protocol to UDP by default
-            if configuration.get("syslog_protocol") == "TCP":
-                socktype = socket.SOCK_STREAM
-
-            # Create a syslog handler with given configuration parameters
-            handler = SSLSysLogHandler(
-                configuration.get("syslog_protocol"),
-                address=(
-                    configuration.get("syslog_server").strip(),
-                    configuration.get("syslog_port"),
-                ),
-                socktype=socktype,
-            )
-
-            if configuration.get("syslog_protocol") == "TCP":
-                # This will add a line break to the message before it is \
-                # 'emitted' which ensures that the messages are
-                # split up over multiple lines, \
-                # see https://bugs.python.org/issue28404
-                handler.setFormatter(logging.Formatter("%(message)s\n"))
-                # In order for the above to work, then we need to ensure\
-                # that the null terminator is not included
-                handler.append_nul = False
-
-            syslogger.addHandler(handler)
+        """Get the pooled transport for the configured server.
 
-        return syslogger
+        Connections are reused across pushes, an idle connection is acquired
+        here so that connectivity errors surface before ingestion starts.
+        """
+        transport = get_transport(
+            configuration.get("syslog_protocol"),
+            configuration.get("syslog_server").strip(),
+            configuration.get("syslog_port"),
+            certs=configuration.get("syslog_certificate"),
+        )
+        transport.release(transport.acquire())
+        return transport
 
     def log_success_msg(
         self, data_type, subtype, successful_log_push_counter, skipped_logs
@@ -679,7 +670,7 @@ class SyslogPlugin(PluginBase):
         )
         successful_log_push_counter, skipped_logs = 0, 0
         try:
-            syslogger = self.init_handler(self.configuration)
+            transport = self.init_handler(self.configuration)
         except (TimeoutError, ConnectionRefusedError, Exception) as err:
             error_msg = {
                 TimeoutError: (
@@ -698,17 +689,18 @@ class SyslogPlugin(PluginBase):
             raise SyslogPluginError(error_msg)
 
         # Log the transformed data to given syslog server
+        records = [
+            json.dumps(data) if isinstance(data, dict) else data
+            for data in transformed_data
+            if data
+        ]
+        skipped_logs = len(transformed_data) - len(records)
         try:
-            for data in transformed_data:
-                if data:
-                    syslogger.info(
-                        json.dumps(data) if isinstance(data, dict) else data
-                    )
-                    syslogger.handlers[0].flush()
-                    successful_log_push_counter += 1
-                else:
-                    skipped_logs += 1
-
+            successful_log_push_counter = transport.send(
+                records,
+                framing=self.configuration.get("syslog_framing")
+                or NEWLINE_FRAMING,
+            )
             log_msg = self.log_success_msg(
                 data_type, subtype, successful_log_push_counter, skipped_logs
             )
@@ -718,7 +710,9 @@ class SyslogPlugin(PluginBase):
             )
 
         except Exception as err:
-            failed_logs = len(transformed_data) - successful_log_push_counter
+            if isinstance(err, SyslogTransportError):
+                successful_log_push_counter = err.sent
+            failed_logs = len(records) - successful_log_push_counter
             _ = self.log_success_msg(
                 data_type, subtype, successful_log_push_counter, skipped_logs
             )
@@ -735,22 +729,10 @@ class SyslogPlugin(PluginBase):
             )
             raise SyslogPluginError(error_msg)
 
-        # Clean up
-        finally:
-            try:
-                syslogger.handlers[0].close()
-                del syslogger.handlers[:]
-                del syslogger
-            except Exception as err:
-                error_msg = "Error occurred while cleaning up Syslog handler."
-                self.logger.debug(
-                    f"{self.log_prefix}: {error_msg} Error: {err}"
-                )
-
     def test_server_connectivity(self, configuration):
         """Tests whether the configured syslog server is reachable or not."""
         try:
-            syslogger = self.init_handler(configuration)
+            self.init_handler(configuration)
         except Exception as err:
             error_msg = (
                 "Error occurred while establishing "
@@ -762,12 +744,6 @@ class SyslogPlugin(PluginBase):
                 details=str(traceback.format_exc()),
             )
             raise SyslogPluginError(error_msg)
-        else:
-            # Clean up for further use
-            syslogger.handlers[0].flush()
-            syslogger.handlers[0].close()
-            del syslogger.handlers[:]
-            del syslogger
 
     def validate(self, configuration: dict) -> ValidationResult:
         """Validate the configuration parameters dict."""
@@ -840,6 +816,17 @@ class SyslogPlugin(PluginBase):
                 message=err_msg,
             )
 
+        syslog_framing = configuration.get("syslog_framing") or NEWLINE_FRAMING
+        if syslog_framing not in SYSLOG_FRAMINGS:
+            err_msg = (
+                "Invalid Syslog Framing provided in configuration parameters."
+            )
+            self.logger.error(f"{validation_err_msg} {err_msg}")
+            return ValidationResult(
+                success=False,
+                message=err_msg,
+            )
+
         mappings = self.mappings.get("jsonData", None)
         mappings = json.loads(mappings)
         if not isinstance(
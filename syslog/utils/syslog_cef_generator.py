@@ -43,6 +43,15 @@ from .syslog_exceptions import SyslogPluginError
 from netskope.integrations.cls.utils.sanitizer import *
 from netskope.integrations.cls.utils.converter import *
 
+POSSIBLE_HEADERS = (
+    "Device Vendor",
+    "Device Product",
+    "Device Version",
+    "Device Event Class ID",
+    "Name",
+    "Severity",
+)
+
 
 class CEFGenerator(object):
     """CEF Generator class."""
@@ -70,6 +79,8 @@ class CEFGenerator(object):
         self.valid_extensions = self._valid_extensions()
         self.extension_converters = self._type_converter()
         self.delimiter = delimiter
+        self._extension_plans = {}
+        self._timestamp = (None, None)
 
     def _type_converter(self):
         """To Parse the CEF transformation mapping and creates
@@ -156,6 +167,52 @@ class CEFGenerator(object):
             )
             raise SyslogPluginError(error_msg)
 
+    def get_extension_plan(self, data_type, subtype):
+        """To Get the converter and sanitizer of every extension of a subtype.
+
+        The plan is resolved once per data type and subtype and is ordered by
+        the rendered "key=" prefix, which is the order extensions appear in
+        the CEF event.
+
+        Args:
+            data_type: Data type for which CEF event is being generated
+            subtype: Subtype of data type for which
+            CEF event is being generated
+
+        Returns:
+            List of (name, key_name, converter, sanitizer) tuples
+        """
+        plan = self._extension_plans.get((data_type, subtype))
+        if plan is None:
+            prefix = f"{data_type.lower()}_{subtype.lower()}_extension_"
+            plan = []
+            for field_key, extension in self.valid_extensions.items():
+                if not field_key.startswith(prefix):
+                    continue
+                field_converter = self.extension_converters.get(field_key)
+                if field_converter is None:
+                    continue
+                plan.append(
+                    (
+                        field_key[len(prefix):],  # noqa: E203
+                        extension.key_name,
+                        field_converter.converter,
+                        extension.sanitizer,
+                    )
+                )
+            plan.sort(key=lambda entry: f"{entry[1]}=")
+            self._extension_plans[(data_type, subtype)] = plan
+        return plan
+
+    def get_timestamp(self):
+        """To Get the syslog timestamp, formatted at most once per second."""
+        now = int(time.time())
+        second, timestamp = self._timestamp
+        if second != now:
+            timestamp = time.strftime("%b %d %H:%M:%S", time.localtime(now))
+            self._timestamp = (now, timestamp)
+        return timestamp
+
     def get_header_value(self, header, headers):
         """To Fetch sanitized value of header from given
         configured headers dict.
@@ -217,29 +274,16 @@ class CEFGenerator(object):
             log_source_identifier: prefix for the logs sent
         """
         extension_strs = {}
-        for name, value in extensions.items():
+        plan = self.get_extension_plan(data_type, subtype)
+        planned = 0
+        for name, key_name, converter, sanitizer in plan:
+            if name not in extensions:
+                continue
+            planned += 1
             # First convert the incoming value from
             # Netskope to appropriate data type
-
-            field_key = (
-                f"{data_type.lower()}_{subtype.lower()}_extension_{name}"
-            )
             try:
-                value = self.extension_converters[field_key].converter(
-                    value, name
-                )
-
-            except KeyError:
-                self.logger.warn(
-                    message=(
-                        f"{self.log_prefix}: [{data_type}][{subtype}] An error"
-                        f" occurred while generating CEF data for field:"
-                        f' "{name}". Could not find the field in the'
-                        ' "valid_extensions". Field will be ignored.'
-                    ),
-                    details=str(traceback.format_exc()),
-                )
-                continue
+                value = converter(extensions[name], name)
             except Exception as err:
                 self.logger.warn(
                     message=(
@@ -254,43 +298,36 @@ class CEFGenerator(object):
             # Validate and sanitise (if required) the incoming value
             # from Netskope before mapping it CEF
             try:
-                sanitized_value = self.valid_extensions[field_key].sanitizer(
-                    value, name
-                )
+                sanitized_value = sanitizer(value, name)
                 if isinstance(sanitized_value, str):
                     sanitized_value = self._equals_escaper(sanitized_value)
 
-                extension_strs[self.valid_extensions[field_key].key_name] = (
-                    sanitized_value
-                )
-            except KeyError:
+                extension_strs[key_name] = sanitized_value
+            except Exception as err:
                 self.logger.warn(
                     message=(
                         f"{self.log_prefix}: [{data_type}][{subtype}] An error"
                         f" occurred while generating CEF data for field:"
-                        f' "{name}". Could not find the field in the'
-                        ' "valid_extensions". Field will be ignored.'
+                        f' "{name}". Field will be ignored. Error: {err}'
                     ),
                     details=str(traceback.format_exc()),
                 )
-            except Exception as err:
+
+        if planned < len(extensions):
+            planned_names = {entry[0] for entry in plan}
+            for name in extensions:
+                if name in planned_names:
+                    continue
                 self.logger.warn(
                     message=(
                         f"{self.log_prefix}: [{data_type}][{subtype}] An error"
                         f" occurred while generating CEF data for field:"
-                        f' "{name}". Field will be ignored. Error: {err}'
+                        f' "{name}". Could not find the field in the'
+                        ' "valid_extensions". Field will be ignored.'
                     ),
-                    details=str(traceback.format_exc()),
                 )
 
-        possible_headers = [
-            "Device Vendor",
-            "Device Product",
-            "Device Version",
-            "Device Event Class ID",
-            "Name",
-            "Severity",
-        ]
+        possible_headers = POSSIBLE_HEADERS
 
         self.log_invalid_header(possible_headers, headers, data_type, subtype)
 
@@ -299,7 +336,7 @@ class CEFGenerator(object):
         # Append the CEF version
         cef_components = [
             "{} {} CEF:{}".format(
-                time.strftime("%b %d %H:%M:%S", time.localtime(time.time())),
+                self.get_timestamp(),
                 hostname,
                 self.cef_version,
             )
@@ -332,14 +369,19 @@ class CEFGenerator(object):
                         )
                     )
 
+        extension_items = extension_strs.items()
         if data_type == "webtx":
             date = self.webtx_timestamp(raw_data)
             if date:
+                is_new_key = "rt" not in extension_strs
                 extension_strs["rt"] = date
+                if is_new_key:
+                    extension_items = sorted(
+                        extension_items, key=lambda item: f"{item[0]}="
+                    )
 
-        extensions_str = " ".join(
-            sorted("{}={}".format(k, v) for k, v in extension_strs.items())
-        )
+        # Extensions are already in the order of the extension plan
+        extensions_str = " ".join(f"{k}={v}" for k, v in extension_items)
 
         # Append extension string
         cef_components.append(extensions_str)
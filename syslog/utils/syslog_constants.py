@@ -33,7 +33,7 @@ Syslog Plugin constants."""
 
 PLATFORM_NAME = "Syslog"
 MODULE_NAME = "CLS"
-PLUGIN_VERSION = "3.2.2"
+PLUGIN_VERSION = "3.2.4"
 
 SYSLOG_PROTOCOLS = ["UDP", "TCP", "TLS"]
 
@@ -47,6 +47,8 @@ from netskope.integrations.grc.plugin_base import (
     ValidationResult,
 )
 
+from .utils.grc_matcher import GRCMatcher
+
 MAX_RETRY_COUNT = 4
 PLUGIN_NAME = "BitSight ARE Plugin"
 BASE_URL = "https://api.thirdpartytrust.com"
@@ -135,30 +137,6 @@ class BitSightARE(PluginBase):
         query_builder_dict["query_builder_list"] = final_list
         return query_builder_dict
 
-    def check_result(self, bitsight_record_value, application_value):
-        """To check value of the source fields is matching with the value of application field or not."""
-        bitsight_record_value = (
-            bitsight_record_value.lower()
-            if isinstance(bitsight_record_value, str)
-            else bitsight_record_value
-        )
-        if isinstance(application_value, list):
-            for app_val in application_value:
-                app_val = (
-                    app_val.lower() if isinstance(app_val, str) else app_val
-                )
-                if app_val == bitsight_record_value:
-                    return True
-            else:
-                return False
-
-        application_value = (
-            application_value.lower()
-            if isinstance(application_value, str)
-            else application_value
-        )
-        return bitsight_record_value == application_value
-
     def list_of_application(self, final_dict, uuid, app):
         """Final dict created with uuid of each vendor."""
         if uuid in final_dict:
@@ -183,37 +161,27 @@ class BitSightARE(PluginBase):
                 message="Successfully pushed data to BitSight.",
             )
         final_dict = {}
-        operation = query_builder_dict.get("operation")
+        matcher = GRCMatcher(
+            query_builder_dict["query_builder_list"],
+            query_builder_dict.get("operation"),
+        )
+        matcher.add_all(
+            (
+                vendor
+                for vendor in vendor_results
+                if vendor.get("company", {}).get("uuid")
+            ),
+            lambda vendor: vendor.get("company", {}),
+        )
         skip_count = 0
         for app in applications:
-            check_match = False
             app_dict = app.dict()
-            for vendor in vendor_results:
-                count = 0
-                uuid = vendor.get("company", {}).get("uuid")
-                if not uuid:
-                    continue
-                for inner_list in query_builder_dict["query_builder_list"]:
-                    count = count + 1
-                    bitsight_records = vendor.get("company", {}).get(
-                        f"{inner_list['lhs']}"
-                    )
-                    applications_value = app_dict.get(inner_list["rhs"])
-                    res = self.check_result(
-                        bitsight_records, applications_value
-                    )
-                    if res:
-                        if operation == "or" or count == len(
-                            query_builder_dict["query_builder_list"]
-                        ):
-                            final_dict = self.list_of_application(
-                                final_dict, uuid, app_dict
-                            )
-                            check_match = True
-                            break
-                    elif operation == "and":
-                        break
-            if not check_match:
+            matched_vendors = matcher.match(app_dict)
+            for vendor in matched_vendors:
+                final_dict = self.list_of_application(
+                    final_dict, vendor["company"]["uuid"], app_dict
+                )
+            if not matched_vendors:
                 skip_count += 1
                 self.logger.warn(
                     f"{PLUGIN_NAME}: Application "
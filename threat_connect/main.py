@@ -37,7 +37,9 @@ import datetime
 import hashlib
 import json
 import re
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import IPv4Address, ip_address
 from typing import Dict, List, Tuple, Union
 from urllib.parse import quote, urlparse
@@ -55,12 +57,19 @@ from netskope.integrations.cte.plugin_base import (
 from netskope.integrations.cte.utils import TagUtils
 
 from .utils.constants import (
+    BATCH_COMPLETED,
+    BATCH_MAX_WAIT_TIME,
+    BATCH_POLL_INTERVAL,
+    BATCH_SIZE,
     BIFURCATE_INDICATOR_TYPES,
     DATE_FORMAT,
     DEFAULT_CONFIDENCE,
+    EXISTING_LOOKUP_MAX_LENGTH,
+    EXISTING_LOOKUP_SIZE,
     INDICATOR_TYPES,
     INTEGER_THRESHOLD,
     LIMIT,
+    MAX_PUSH_WORKERS,
     MODULE_NAME,
     PAGE_LIMIT,
     PLATFORM_NAME,
@@ -1381,141 +1390,41 @@ class ThreatConnectPlugin(PluginBase):
         self.logger.info(f"{self.log_prefix}: {log_msg}")
 
         try:
-            (base_url, access_id, secret_key) = (
-                self._api_helper.get_credentials(self.configuration)
-            )
-            api_path = THREAT_CONNECT_URLS["indicators"]
-            query_endpoint = base_url + api_path
-            headers = self._api_helper.get_headers_for_auth(
-                api_path, access_id, secret_key, "POST"
-            )
-            for ioc_value, ioc_payload in indicator_payloads.items():
-                try:
-                    logger_msg = (
-                        f"pushing indicator with value '{ioc_value}' to "
-                        f"group ID '{existing_group_id}' on {PLATFORM_NAME}"
-                    )
-                    response = self._api_helper.api_helper(
-                        logger_msg=logger_msg,
-                        url=query_endpoint,
-                        method="POST",
-                        headers=headers,
-                        json=ioc_payload,
-                        is_handle_error_required=False,
-                        verify=self.ssl_validation,
-                        proxies=self.proxy,
-                    )
-                    if response.status_code in [200, 201]:
-                        resp_json = self._api_helper.parse_response(response)
-                        resp_msg = resp_json.get("message", "")
-                        # Push Successful
-                        if (
-                            resp_json.get("status", "") == "Success"
-                            and resp_msg == "Created"
-                        ):
-                            indicator_pushed += 1
-                        # Already exists hence, update indicator
-                        elif resp_msg.endswith("already exists"):
-                            is_successful = self.update_ioc(
-                                indicator.value.upper(),
-                                data["associatedGroups"]["data"][0]["id"],
-                            )
-                            if is_successful:
-                                already_exists += 1
-                            else:
-                                invalid_ioc += 1
-                        # Handling Push resp_json error message.
-                        elif (
-                            resp_msg.startswith("Please enter a valid")
-                            or resp_msg == PUSH_INDICATOR_FAILURE
-                        ):
-                            err_msg = (
-                                f"{self.log_prefix}: Failed to push indicator"
-                                f" with value {indicator.value} to group ID"
-                                f" '{PLATFORM_NAME}' Error: {resp_msg}."
-                            )
-                            self.logger.error(
-                                message=err_msg,
-                                details=f"API Response: {resp_json}",
-                            )
-                            invalid_ioc += 1
-                        # In case of Unknown response message,
-                        # mark it as failure.
-                        else:
-                            err_msg = (
-                                f"{self.log_prefix}: Failed to push indicator"
-                                f" with value '{indicator.value}' to group ID "
-                                f"'{existing_group_id}' on {PLATFORM_NAME}."
-                                f" Error: {resp_msg}."
-                            )
-                            self.logger.error(
-                                message=err_msg,
-                                details=f"API Response: {resp_json}",
-                            )
-                            invalid_ioc += 1
-                    elif response.status_code == 400:
-                        resp_json = self._api_helper.parse_response(response)
-                        if "already exists" in resp_json.get("message", ""):
-                            is_successful = self.update_ioc(
-                                indicator.value.upper(),
-                                data["associatedGroups"]["data"][0]["id"],
-                            )
-                            if is_successful:
-                                already_exists += 1
-                                continue
-                            else:
-                                invalid_ioc += 1
-                                self.logger.error(
-                                    message=(
-                                        f"{self.log_prefix}: Failed to push "
-                                        f"indicator with value "
-                                        f"'{indicator.value}' to group ID "
-                                        f"'{existing_group_id}' on "
-                                        f"{PLATFORM_NAME}. Error: {resp_msg}."
-                                    ),
-                                    details=f"API Response: {resp_json}",
-                                )
-                                continue
-                        else:
-                            invalid_ioc += 1
-                            continue
-                    elif response.status_code == 403:
-                        resp_json = self._api_helper.parse_response(response)
-                        if PUSH_INDICATOR_FAILURE in resp_json.get(
-                            "message", ""
-                        ):
-                            skip_count += 1
-                            continue
-                        else:
-                            self.logger.error(
-                                message=(
-                                    f"{self.log_prefix}: Failed to push "
-                                    f"indicator with value "
-                                    f"'{indicator.value}' to group ID "
-                                    f"'{existing_group_id}' on "
-                                    f"{PLATFORM_NAME}. Error: {resp_msg}."
-                                ),
-                                details=f"API Response: {resp_json}",
-                            )
-                            invalid_ioc += 1
-                    else:
-                        self._api_helper.handle_error(response, logger_msg)
-
-                except ThreatConnectException:
-                    invalid_ioc += 1
-                    continue
-                except Exception as err:
-                    error_msg = (
-                        "Unexpected error ocurred while ingesting"
-                        f" indicator with value {ioc_value} to group "
-                        f"ID {existing_group_id} on {PLATFORM_NAME}."
-                    )
-                    self.logger.error(
-                        message=f"{self.log_prefix}: {error_msg} Error: {err}",
-                        details=traceback.format_exc(),
-                    )
+            push_start = time.monotonic()
+            results = {}
+            fallback_payloads = indicator_payloads
+            if indicator_payloads:
+                fallback_payloads = self._push_batches(
+                    indicator_payloads, existing_group_id, results
+                )
+            if fallback_payloads:
+                self.logger.info(
+                    f"{self.log_prefix}: Pushing {len(fallback_payloads)} "
+                    f"indicator(s) one by one to {PLATFORM_NAME}."
+                )
+                with ThreadPoolExecutor(
+                    max_workers=MAX_PUSH_WORKERS
+                ) as executor:
+                    for ioc_value, result in zip(
+                        fallback_payloads,
+                        executor.map(
+                            lambda item: self._push_indicator(
+                                item[0], item[1], existing_group_id
+                            ),
+                            fallback_payloads.items(),
+                        ),
+                    ):
+                        results[ioc_value] = result
+            for result in results.values():
+                if result == "pushed":
+                    indicator_pushed += 1
+                elif result == "already_exists":
+                    already_exists += 1
+                elif result == "skipped":
+                    skip_count += 1
+                else:
                     invalid_ioc += 1
-                    continue
+            push_seconds = time.monotonic() - push_start
 
             # Push stats
             self.logger.info(
@@ -1525,6 +1434,10 @@ class ThreatConnectPlugin(PluginBase):
                 f"indicator(s) already exists(modified) - {already_exists}, "
                 f"indicator(s) skipped due to system-wide exclusion list - "
                 f"{skip_count}, indicator(s) failed to share - {invalid_ioc}."
+                f" Shared {len(results)} indicator(s) in "
+                f"{push_seconds:.2f} second(s), "
+                f"{len(results) / max(push_seconds, 0.001):.1f} "
+                "indicator(s)/sec."
             )
             return PushResult(
                 success=True,
@@ -1544,6 +1457,440 @@ class ThreatConnectPlugin(PluginBase):
 
             raise ThreatConnectException(error_msg)
 
+    def _push_indicator(
+        self, ioc_value: str, ioc_payload: Dict, existing_group_id: str
+    ) -> str:
+        """Push an indicator with a single API call.
+
+        Args:
+            ioc_value (str): Indicator value.
+            ioc_payload (Dict): Indicator payload.
+            existing_group_id (str): Group ID to add the indicator to.
+
+        Returns:
+            str: "pushed", "already_exists", "skipped" if the indicator is on
+                the system-wide exclusion list or "invalid".
+        """
+        (base_url, access_id, secret_key) = self._api_helper.get_credentials(
+            self.configuration
+        )
+        api_path = THREAT_CONNECT_URLS["indicators"]
+        logger_msg = (
+            f"pushing indicator with value '{ioc_value}' to "
+            f"group ID '{existing_group_id}' on {PLATFORM_NAME}"
+        )
+        try:
+            response = self._api_helper.api_helper(
+                logger_msg=logger_msg,
+                url=base_url + api_path,
+                method="POST",
+                headers=self._api_helper.get_headers_for_auth(
+                    api_path, access_id, secret_key, "POST"
+                ),
+                json=ioc_payload,
+                is_handle_error_required=False,
+                verify=self.ssl_validation,
+                proxies=self.proxy,
+            )
+            if response.status_code in [200, 201]:
+                resp_json = self._api_helper.parse_response(response)
+                resp_msg = resp_json.get("message", "")
+                # Push Successful
+                if (
+                    resp_json.get("status", "") == "Success"
+                    and resp_msg == "Created"
+                ):
+                    return "pushed"
+                # Already exists hence, update indicator
+                elif resp_msg.endswith("already exists"):
+                    if self.update_ioc(ioc_value.upper(), existing_group_id):
+                        return "already_exists"
+                    return "invalid"
+                # Handling Push resp_json error message.
+                elif (
+                    resp_msg.startswith("Please enter a valid")
+                    or resp_msg == PUSH_INDICATOR_FAILURE
+                ):
+                    err_msg = (
+                        f"{self.log_prefix}: Failed to push indicator"
+                        f" with value {ioc_value} to group ID"
+                        f" '{PLATFORM_NAME}' Error: {resp_msg}."
+                    )
+                    self.logger.error(
+                        message=err_msg,
+                        details=f"API Response: {resp_json}",
+                    )
+                    return "invalid"
+                # In case of Unknown response message,
+                # mark it as failure.
+                else:
+                    err_msg = (
+                        f"{self.log_prefix}: Failed to push indicator"
+                        f" with value '{ioc_value}' to group ID "
+                        f"'{existing_group_id}' on {PLATFORM_NAME}."
+                        f" Error: {resp_msg}."
+                    )
+                    self.logger.error(
+                        message=err_msg,
+                        details=f"API Response: {resp_json}",
+                    )
+                    return "invalid"
+            elif response.status_code == 400:
+                resp_json = self._api_helper.parse_response(response)
+                resp_msg = resp_json.get("message", "")
+                if "already exists" in resp_msg:
+                    if self.update_ioc(ioc_value.upper(), existing_group_id):
+                        return "already_exists"
+                    self.logger.error(
+                        message=(
+                            f"{self.log_prefix}: Failed to push "
+                            f"indicator with value "
+                            f"'{ioc_value}' to group ID "
+                            f"'{existing_group_id}' on "
+                            f"{PLATFORM_NAME}. Error: {resp_msg}."
+                        ),
+                        details=f"API Response: {resp_json}",
+                    )
+                return "invalid"
+            elif response.status_code == 403:
+                resp_json = self._api_helper.parse_response(response)
+                resp_msg = resp_json.get("message", "")
+                if PUSH_INDICATOR_FAILURE in resp_msg:
+                    return "skipped"
+                self.logger.error(
+                    message=(
+                        f"{self.log_prefix}: Failed to push "
+                        f"indicator with value "
+                        f"'{ioc_value}' to group ID "
+                        f"'{existing_group_id}' on "
+                        f"{PLATFORM_NAME}. Error: {resp_msg}."
+                    ),
+                    details=f"API Response: {resp_json}",
+                )
+                return "invalid"
+            else:
+                self._api_helper.handle_error(response, logger_msg)
+        except ThreatConnectException:
+            return "invalid"
+        except Exception as err:
+            error_msg = (
+                "Unexpected error ocurred while ingesting"
+                f" indicator with value {ioc_value} to group "
+                f"ID {existing_group_id} on {PLATFORM_NAME}."
+            )
+            self.logger.error(
+                message=f"{self.log_prefix}: {error_msg} Error: {err}",
+                details=traceback.format_exc(),
+            )
+        return "invalid"
+
+    def _get_summary(self, ioc_payload: Dict) -> str:
+        """Get the summary of an indicator payload."""
+        return (
+            ioc_payload.get("ip")
+            or ioc_payload.get("hostName")
+            or ioc_payload.get("text")
+            or ioc_payload.get("md5")
+            or ioc_payload.get("sha256")
+        )
+
+    def _get_batch_item(self, ioc_payload: Dict, group_xid: str) -> Dict:
+        """Convert an indicator payload to a batch job indicator."""
+        return {
+            "summary": self._get_summary(ioc_payload),
+            "type": ioc_payload["type"],
+            "rating": ioc_payload["rating"],
+            "confidence": ioc_payload["confidence"],
+            "tag": [{"name": TAG_NAME}],
+            "associatedGroups": [{"groupXid": group_xid}],
+        }
+
+    def _batch_api_call(
+        self, logger_msg: str, api_path: str, method: str, **kwargs
+    ) -> Dict:
+        """Call a batch API with freshly signed headers."""
+        (base_url, access_id, secret_key) = self._api_helper.get_credentials(
+            self.configuration
+        )
+        headers = self._api_helper.get_headers_for_auth(
+            api_path, access_id, secret_key, method
+        )
+        headers.update(kwargs.pop("headers", {}))
+        return self._api_helper.api_helper(
+            logger_msg=logger_msg,
+            url=base_url + api_path,
+            method=method,
+            headers=headers,
+            is_handle_error_required=True,
+            verify=self.ssl_validation,
+            proxies=self.proxy,
+            **kwargs,
+        )
+
+    def _get_existing_values(
+        self, indicator_payloads: Dict, owner: str
+    ) -> List[str]:
+        """Get the indicator values already on ThreatConnect for an owner.
+
+        Args:
+            indicator_payloads (Dict): Payload of each indicator value.
+            owner (str): Owner of the indicators.
+
+        Returns:
+            List[str]: Indicator values already existing.
+        """
+        values_by_summary = {
+            str(self._get_summary(ioc_payload)).lower(): ioc_value
+            for ioc_value, ioc_payload in indicator_payloads.items()
+        }
+        queries, summaries, length = [], [], 0
+        for summary in values_by_summary:
+            escaped = summary.replace("\\", "\\\\").replace('"', '\\"')
+            term = f'"{escaped}"'
+            if summaries and (
+                len(summaries) >= EXISTING_LOOKUP_SIZE
+                or length + len(quote(term)) > EXISTING_LOOKUP_MAX_LENGTH
+            ):
+                queries.append(summaries)
+                summaries, length = [], 0
+            summaries.append(term)
+            length += len(quote(term)) + len(quote(", "))
+        if summaries:
+            queries.append(summaries)
+        existing = []
+        for summaries in queries:
+            query = quote(f"summary in ({', '.join(summaries)})")
+            response = self._batch_api_call(
+                f"looking up {len(summaries)} existing indicator(s)",
+                f"{THREAT_CONNECT_URLS['indicators']}?tql={query}"
+                f"&owner={quote(owner)}&resultLimit={LIMIT}",
+                "GET",
+            )
+            for indicator in response.get("data", []):
+                ioc_value = values_by_summary.get(
+                    str(indicator.get("summary", "")).lower()
+                )
+                if ioc_value is not None:
+                    existing.append(ioc_value)
+        return list(dict.fromkeys(existing))
+
+    def _update_existing(
+        self, existing: List[str], existing_group_id: str, results: Dict
+    ):
+        """Append the group association of indicators already existing.
+
+        Args:
+            existing (List[str]): Indicator values already existing.
+            existing_group_id (str): Group ID to add the indicators to.
+            results (Dict): Result of each indicator value, updated with the
+                indicators updated.
+        """
+        self.logger.info(
+            f"{self.log_prefix}: Adding {len(existing)} existing "
+            f"indicator(s) to the group on {PLATFORM_NAME}."
+        )
+        with ThreadPoolExecutor(max_workers=MAX_PUSH_WORKERS) as executor:
+            for ioc_value, updated in zip(
+                existing,
+                executor.map(
+                    lambda ioc_value: self.update_ioc(
+                        ioc_value.upper(), existing_group_id
+                    ),
+                    existing,
+                ),
+            ):
+                results[ioc_value] = (
+                    "already_exists" if updated else "invalid"
+                )
+
+    def _push_batches(
+        self, indicator_payloads: Dict, existing_group_id: str, results: Dict
+    ) -> Dict:
+        """Push the indicators in batch jobs.
+
+        A batch job upserts its indicators, which would overwrite the
+        rating and confidence of existing ones. Indicators already on
+        ThreatConnect are looked up first and only get the group
+        association appended, as when pushed one by one.
+
+        Args:
+            indicator_payloads (Dict): Payload of each indicator value.
+            existing_group_id (str): Group ID to add the indicators to.
+            results (Dict): Result of each indicator value, updated with the
+                indicators the batches pushed or skipped.
+
+        Returns:
+            Dict: Payloads of the indicators to push one by one, those the
+                batches rejected or all of them if the batch API is not
+                available.
+        """
+        try:
+            owner = self.get_owner()
+            group = self._batch_api_call(
+                "fetching the group details for batch push",
+                THREAT_CONNECT_URLS["group"].format(
+                    group_id=existing_group_id
+                ),
+                "GET",
+            )
+            group_xid = group.get("data", {}).get("xid")
+            if not group_xid:
+                raise ThreatConnectException("Group XID is not available.")
+            existing = self._get_existing_values(indicator_payloads, owner)
+        except ThreatConnectException as err:
+            self.logger.info(
+                f"{self.log_prefix}: Batch push is not available, pushing "
+                f"the indicators one by one. Error: {err}"
+            )
+            return indicator_payloads
+
+        if existing:
+            self._update_existing(existing, existing_group_id, results)
+        fallback_payloads = {}
+        existing = set(existing)
+        values = [
+            ioc_value
+            for ioc_value in indicator_payloads
+            if ioc_value not in existing
+        ]
+        for start in range(0, len(values), BATCH_SIZE):
+            batch_values = values[start:start + BATCH_SIZE]
+            try:
+                rejected, skipped = self._push_batch(
+                    batch_values, indicator_payloads, owner, group_xid
+                )
+            except ThreatConnectException as err:
+                self.logger.error(
+                    message=(
+                        f"{self.log_prefix}: Batch push failed, pushing the "
+                        f"remaining {len(values) - start} indicator(s) one "
+                        f"by one. Error: {err}"
+                    ),
+                    details=str(traceback.format_exc()),
+                )
+                for ioc_value in values[start:]:
+                    fallback_payloads[ioc_value] = indicator_payloads[
+                        ioc_value
+                    ]
+                break
+            for ioc_value in skipped:
+                results[ioc_value] = "skipped"
+            for ioc_value in rejected:
+                fallback_payloads[ioc_value] = indicator_payloads[ioc_value]
+            rejected_values = set(rejected).union(skipped)
+            for ioc_value in batch_values:
+                if ioc_value not in rejected_values:
+                    results[ioc_value] = "pushed"
+        return fallback_payloads
+
+    def _push_batch(
+        self,
+        batch_values: List[str],
+        indicator_payloads: Dict,
+        owner: str,
+        group_xid: str,
+    ) -> Tuple[List[str], List[str]]:
+        """Push indicators in a batch job and wait for it to complete.
+
+        Args:
+            batch_values (List[str]): Indicator values to push.
+            indicator_payloads (Dict): Payload of each indicator value.
+            owner (str): Owner of the indicators.
+            group_xid (str): XID of the group to add the indicators to.
+
+        Returns:
+            Tuple[List[str], List[str]]: Indicator values rejected by the
+                batch, and those skipped as they are on the system-wide
+                exclusion list.
+        """
+        response = self._batch_api_call(
+            "creating batch job",
+            THREAT_CONNECT_URLS["batch"],
+            "POST",
+            json={
+                "haltOnError": False,
+                "attributeWriteType": "Append",
+                "action": "Create",
+                "owner": owner,
+            },
+        )
+        batch_id = response.get("data", {}).get("batchId")
+        if not batch_id:
+            raise ThreatConnectException(
+                f"Batch ID not available. API Response: {response}"
+            )
+        items = [
+            self._get_batch_item(indicator_payloads[ioc_value], group_xid)
+            for ioc_value in batch_values
+        ]
+        job_path = THREAT_CONNECT_URLS["batch_job"].format(batch_id=batch_id)
+        self._batch_api_call(
+            f"uploading {len(items)} indicator(s) to batch job {batch_id}",
+            job_path,
+            "POST",
+            data=json.dumps(items),
+            headers={"Content-Type": "application/octet-stream"},
+            log_data=False,
+        )
+        wait_start = time.monotonic()
+        while True:
+            response = self._batch_api_call(
+                f"fetching status of batch job {batch_id}", job_path, "GET"
+            )
+            batch_status = response.get("data", {}).get("batchStatus", {})
+            if batch_status.get("status") == BATCH_COMPLETED:
+                break
+            if time.monotonic() - wait_start > BATCH_MAX_WAIT_TIME:
+                raise ThreatConnectException(
+                    f"Batch job {batch_id} did not complete in "
+                    f"{BATCH_MAX_WAIT_TIME} seconds."
+                )
+            time.sleep(BATCH_POLL_INTERVAL)
+
+        success_count = batch_status.get("successCount", 0)
+        self.logger.info(
+            f"{self.log_prefix}: Batch job {batch_id} completed, "
+            f"{success_count} indicator(s) pushed, "
+            f"{batch_status.get('errorCount', 0)} error(s) and "
+            f"{batch_status.get('unprocessCount', 0)} indicator(s) "
+            "not processed."
+        )
+        if success_count >= len(batch_values):
+            return [], []
+        response = self._batch_api_call(
+            f"fetching errors of batch job {batch_id}",
+            THREAT_CONNECT_URLS["batch_errors"].format(batch_id=batch_id),
+            "GET",
+        )
+        errors = response
+        if isinstance(response, dict):
+            errors = response.get("data", [])
+        values_by_summary = {
+            str(item["summary"]).lower(): ioc_value
+            for item, ioc_value in zip(items, batch_values)
+        }
+        rejected, skipped = {}, {}
+        for error in errors:
+            error_text = str(error)
+            if isinstance(error, dict):
+                error_text = " ".join(
+                    str(error.get(key, ""))
+                    for key in ("errorReason", "errorMessage")
+                )
+            for token in re.split(r"[\s\"',()\[\]]+", error_text):
+                ioc_value = values_by_summary.get(token.lower())
+                if ioc_value is None:
+                    continue
+                if PUSH_INDICATOR_FAILURE in error_text:
+                    skipped[ioc_value] = True
+                else:
+                    rejected[ioc_value] = True
+        if success_count + len(rejected) + len(skipped) < len(batch_values):
+            # Not every failure could be traced back to an indicator, all
+            # of them are pushed one by one.
+            return batch_values, []
+        return list(rejected), list(skipped)
+
     def get_actions(self) -> List[ActionWithoutParams]:
         """Get available Actions.
 
@@ -28,7 +28,7 @@ TAG_NAME = "Netskope CE"
 MODULE_NAME = "CTE"
 PLUGIN_NAME = "ThreatConnect"
 PLATFORM_NAME = "ThreatConnect"
-PLUGIN_VERSION = "1.2.1"
+PLUGIN_VERSION = "1.2.2"
 DATE_FORMAT = r"%Y-%m-%dT%H:%M:%SZ"
 # Default Confidence value
 DEFAULT_CONFIDENCE = 50
@@ -41,8 +41,25 @@ THREAT_CONNECT_URLS = {
     "indicators": "/api/v3/indicators",
     "groups": "/api/v3/groups/",
     "update_indicators": "/api/v3/indicators/{value}",
+    "group": "/api/v3/groups/{group_id}",
+    "batch": "/api/v2/batch",
+    "batch_job": "/api/v2/batch/{batch_id}",
+    "batch_errors": "/api/v2/batch/{batch_id}/errors",
 }
 INTEGER_THRESHOLD = 4611686018427387904
 # Response Messages
 PUSH_INDICATOR_FAILURE = "contained on a system-wide exclusion list"
 BIFURCATE_INDICATOR_TYPES = {"url", "domain", "ipv4", "ipv6", "hostname"}
+# Indicators are pushed in batch jobs of BATCH_SIZE indicators, polled every
+# BATCH_POLL_INTERVAL seconds for at most BATCH_MAX_WAIT_TIME seconds. The
+# indicators a batch rejects are pushed one by one by MAX_PUSH_WORKERS threads.
+BATCH_SIZE = 5000
+BATCH_POLL_INTERVAL = 5
+BATCH_MAX_WAIT_TIME = 1800
+BATCH_COMPLETED = "Completed"
+MAX_PUSH_WORKERS = 8
+# Indicators already on ThreatConnect are looked up by EXISTING_LOOKUP_SIZE
+# summaries at a time, with a query of at most EXISTING_LOOKUP_MAX_LENGTH
+# characters, and only get the group association appended.
+EXISTING_LOOKUP_SIZE = 100
+EXISTING_LOOKUP_MAX_LENGTH = 4000
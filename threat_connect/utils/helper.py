@@ -122,6 +122,7 @@ class ThreatConnectPluginHelper(object):
         verify: bool = True,
         regenerate_auth_token: bool = True,
         proxies: Dict = {},
+        log_data: bool = True,
     ):
         """API Helper perform API request to ThirdParty platform
         and captures all the possible errors for requests.
@@ -130,6 +131,8 @@ class ThreatConnectPluginHelper(object):
             request (request): Requests object.
             code is required?. Defaults to True.
             is_validation : API call from validation method or not
+            log_data : Whether the request data is logged, only its length
+                is logged otherwise.
 
         Returns:
             dict: Response dictionary.
@@ -151,8 +154,10 @@ class ThreatConnectPluginHelper(object):
             )
             if params:
                 debug_log_msg += f", params={params}"
-            if data:
+            if data and log_data:
                 debug_log_msg += f", data={data}."
+            elif data:
+                debug_log_msg += f", data omitted ({len(data)} characters)."
 
             self.logger.debug(debug_log_msg)
             for retry_counter in range(MAX_RETRY):
@@ -195,6 +200,7 @@ class ThreatConnectPluginHelper(object):
                         url=url,
                         method=method,
                         params=params,
+                        data=data,
                         headers=headers,
                         json=json,
                         is_handle_error_required=is_handle_error_required,
@@ -202,6 +208,7 @@ class ThreatConnectPluginHelper(object):
                         verify=verify,
                         regenerate_auth_token=False,
                         proxies=proxies,
+                        log_data=log_data,
                     )
 
                 if (